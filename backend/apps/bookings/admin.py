@@ -1,7 +1,19 @@
 from django.contrib import admin
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.utils import timezone
+from utils.pagination import EstimatedCountPaginator
 from .models import Appointment, Payment, Review, CancellationPolicy
 
 
+class StaffListFilter(admin.RelatedFieldListFilter):
+    """Staff filter that loads the staff members and their users in one query."""
+    
+    def field_choices(self, field, request, model_admin):
+        ordering = self.field_admin_ordering(field, request, model_admin)
+        queryset = field.related_model._default_manager.select_related('user').order_by(*ordering)
+        return [(staff.pk, str(staff)) for staff in queryset]
+
+
 class PaymentInline(admin.TabularInline):
     model = Payment
     extra = 0
@@ -14,14 +26,21 @@ class AppointmentAdmin(admin.ModelAdmin):
         'client', 'service', 'staff', 'appointment_date', 'start_time',
         'status', 'payment_status', 'total_amount', 'is_upcoming'
     ]
-    list_filter = ['status', 'payment_status', 'appointment_date', 'staff', 'service']
+    list_filter = [
+        'status', 'payment_status', 'appointment_date',
+        ('staff', StaffListFilter), ('service', admin.RelatedOnlyFieldListFilter)
+    ]
+    list_select_related = ['client', 'service', 'staff__user']
     search_fields = [
         'client__email', 'client__first_name', 'client__last_name',
         'service__name', 'staff__user__first_name', 'staff__user__last_name'
     ]
+    autocomplete_fields = ['client', 'staff', 'service']
     readonly_fields = ['created_at', 'updated_at', 'cancelled_at', 'completed_at']
     ordering = ['-appointment_date', '-start_time']
     inlines = [PaymentInline]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Appointment Details', {
@@ -41,10 +60,24 @@ class AppointmentAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        # Same rule as Appointment.is_upcoming, evaluated in SQL for the changelist
+        now = timezone.localtime()
+        return super().get_queryset(request).annotate(
+            upcoming=ExpressionWrapper(
+                Q(status__in=['pending', 'confirmed']) & (
+                    Q(appointment_date__gt=now.date()) |
+                    Q(appointment_date=now.date(), start_time__gt=now.time())
+                ),
+                output_field=BooleanField()
+            )
+        )
+    
     def is_upcoming(self, obj):
-        return obj.is_upcoming
+        return obj.upcoming
     is_upcoming.boolean = True
     is_upcoming.short_description = 'Upcoming'
+    is_upcoming.admin_order_field = 'upcoming'
 
 
 @admin.register(Payment)
@@ -52,8 +85,11 @@ class PaymentAdmin(admin.ModelAdmin):
     list_display = ['appointment', 'amount', 'payment_method', 'payment_date', 'is_refunded']
     list_filter = ['payment_method', 'is_refunded', 'payment_date']
     search_fields = ['appointment__client__email', 'transaction_id']
+    list_select_related = ['appointment__client', 'appointment__service']
     readonly_fields = ['payment_date']
     ordering = ['-payment_date']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Payment Details', {
@@ -73,9 +109,13 @@ class PaymentAdmin(admin.ModelAdmin):
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ['appointment', 'rating', 'client_name', 'service_name', 'is_featured', 'is_approved']
     list_filter = ['rating', 'is_featured', 'is_approved', 'created_at']
+    list_select_related = ['appointment__client', 'appointment__service']
     search_fields = ['appointment__client__email', 'comment']
+    autocomplete_fields = ['appointment']
     readonly_fields = ['created_at', 'updated_at']
     ordering = ['-created_at']
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Review Details', {
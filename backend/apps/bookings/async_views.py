@@ -0,0 +1,57 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.db.models import Sum
+from django.utils import timezone
+from utils.async_views import async_api_view, json_response
+from utils.helpers import build_time_slots
+from .models import Appointment, Payment
+from .serializers import AvailabilityCheckSerializer, TimeSlotSerializer
+
+
+@async_api_view()
+async def availability_check(request):
+    """Async version of AvailabilityViewSet.check, mounted in ASGI mode."""
+    serializer = AvailabilityCheckSerializer(data=request.GET)
+    if not await sync_to_async(serializer.is_valid)():
+        return json_response(serializer.errors, status=400)
+    
+    staff = serializer.validated_data['staff']
+    service = serializer.validated_data['service']
+    target_date = serializer.validated_data['date']
+    
+    windows = [
+        window async for window in staff.availabilities.filter(
+            date=target_date, is_available=True
+        ).order_by('start_time').values_list('start_time', 'end_time')
+    ]
+    booked = [
+        booking async for booking in Appointment.objects.filter(
+            staff=staff, appointment_date=target_date, status__in=['pending', 'confirmed']
+        ).values_list('start_time', 'end_time')
+    ]
+    
+    slots = build_time_slots(target_date, windows, booked, service.duration)
+    return json_response(TimeSlotSerializer(slots, many=True).data)
+
+
+@async_api_view(authenticated=True)
+async def dashboard_stats(request):
+    """Async version of DashboardStatsView, mounted in ASGI mode."""
+    today = timezone.localdate()
+    appointments_today = await Appointment.objects.filter(
+        appointment_date=today, status__in=['pending', 'confirmed']
+    ).acount()
+    upcoming = await Appointment.objects.filter(
+        appointment_date__gte=today, status__in=['pending', 'confirmed']
+    ).acount()
+    total_clients = await get_user_model().objects.acount()
+    revenue_today = (await Payment.objects.filter(
+        payment_date__date=today
+    ).aaggregate(total=Sum('amount')))['total'] or 0
+    
+    return json_response([
+        {'label': "Today's Appointments", 'value': appointments_today, 'color': 'primary'},
+        {'label': 'Upcoming Appointments', 'value': upcoming, 'color': 'info'},
+        {'label': 'Total Clients', 'value': total_clients, 'color': 'success'},
+        {'label': 'Revenue Today', 'value': float(revenue_today), 'color': 'warning'},
+    ])
@@ -0,0 +1,113 @@
+import csv
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from .models import Appointment, Payment
+
+APPOINTMENT_COLUMNS = [
+    ('id', 'ID'),
+    ('appointment_date', 'Date'),
+    ('start_time', 'Start Time'),
+    ('end_time', 'End Time'),
+    ('status', 'Status'),
+    ('payment_status', 'Payment Status'),
+    ('client__email', 'Client Email'),
+    ('client__first_name', 'Client First Name'),
+    ('client__last_name', 'Client Last Name'),
+    ('staff__user__first_name', 'Staff First Name'),
+    ('staff__user__last_name', 'Staff Last Name'),
+    ('service__name', 'Service'),
+    ('service_price', 'Service Price'),
+    ('discount_amount', 'Discount'),
+    ('tax_amount', 'Tax'),
+    ('total_amount', 'Total'),
+    ('amount_paid', 'Amount Paid'),
+    ('created_at', 'Created At'),
+    ('cancelled_at', 'Cancelled At'),
+    ('completed_at', 'Completed At'),
+]
+
+PAYMENT_COLUMNS = [
+    ('id', 'ID'),
+    ('payment_date', 'Payment Date'),
+    ('appointment_id', 'Appointment ID'),
+    ('appointment__appointment_date', 'Appointment Date'),
+    ('appointment__status', 'Appointment Status'),
+    ('appointment__client__email', 'Client Email'),
+    ('appointment__service__name', 'Service'),
+    ('amount', 'Amount'),
+    ('payment_method', 'Method'),
+    ('transaction_id', 'Transaction ID'),
+    ('is_refunded', 'Refunded'),
+    ('refund_amount', 'Refund Amount'),
+    ('refund_date', 'Refund Date'),
+]
+
+# kind -> (model, columns, date field, appointment status field)
+EXPORTS = {
+    'appointments': (Appointment, APPOINTMENT_COLUMNS, 'appointment_date', 'status'),
+    'payments': (Payment, PAYMENT_COLUMNS, 'payment_date', 'appointment__status'),
+}
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+class Echo:
+    """File-like object whose write() returns the value, for csv.writer streaming."""
+    
+    def write(self, value):
+        return value
+
+
+def export_queryset(kind, start_date=None, end_date=None, statuses=None):
+    """Return a values_list queryset for an export, ordered for stable output."""
+    model, columns, date_field, status_field = EXPORTS[kind]
+    queryset = model.objects.all()
+    
+    if date_field == 'payment_date':
+        # Filter on the raw datetime column so the payment_date index applies
+        tz = timezone.get_current_timezone()
+        if start_date:
+            queryset = queryset.filter(
+                payment_date__gte=timezone.make_aware(datetime.combine(start_date, time.min), tz)
+            )
+        if end_date:
+            queryset = queryset.filter(
+                payment_date__lt=timezone.make_aware(
+                    datetime.combine(end_date + timedelta(days=1), time.min), tz
+                )
+            )
+    else:
+        if start_date:
+            queryset = queryset.filter(**{f'{date_field}__gte': start_date})
+        if end_date:
+            queryset = queryset.filter(**{f'{date_field}__lte': end_date})
+    
+    if statuses:
+        queryset = queryset.filter(**{f'{status_field}__in': statuses})
+    
+    return queryset.order_by(date_field, 'id').values_list(*[field for field, _ in columns])
+
+
+def iter_csv_rows(kind, start_date=None, end_date=None, statuses=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield CSV lines for an export.
+    
+    Rows are read through a chunked cursor, so memory use does not grow with
+    the size of the export.
+    """
+    columns = EXPORTS[kind][1]
+    writer = csv.writer(Echo())
+    yield writer.writerow([header for _, header in columns])
+    
+    queryset = export_queryset(kind, start_date, end_date, statuses)
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield writer.writerow(row)
+
+
+def export_filename(kind, start_date=None, end_date=None):
+    parts = [kind]
+    if start_date:
+        parts.append(start_date.isoformat())
+    if end_date:
+        parts.append(end_date.isoformat())
+    return '-'.join(parts) + '.csv'
@@ -0,0 +1,55 @@
+# apps/bookings/management/commands/export_bookings.py
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from apps.bookings.exports import EXPORTS, DEFAULT_CHUNK_SIZE, iter_csv_rows
+from apps.bookings.serializers import ExportQuerySerializer
+
+
+class Command(BaseCommand):
+    help = 'Export appointments or payments as CSV, streaming rows from the database'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('kind', choices=sorted(EXPORTS))
+        parser.add_argument('--start-date', help='First date to include (YYYY-MM-DD)')
+        parser.add_argument('--end-date', help='Last date to include (YYYY-MM-DD)')
+        parser.add_argument('--status', help='Comma-separated appointment statuses')
+        parser.add_argument('--output', '-o', help='Output file (defaults to stdout)')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    
+    def handle(self, *args, **options):
+        # Same validation as the export endpoint
+        query = {
+            name: options[name] for name in ('start_date', 'end_date', 'status')
+            if options[name] is not None
+        }
+        serializer = ExportQuerySerializer(data=query)
+        if not serializer.is_valid():
+            raise CommandError('; '.join(
+                str(error) for errors in serializer.errors.values() for error in errors
+            ))
+        params = serializer.validated_data
+        
+        rows = iter_csv_rows(
+            options['kind'],
+            start_date=params.get('start_date'),
+            end_date=params.get('end_date'),
+            statuses=params.get('status'),
+            chunk_size=options['chunk_size']
+        )
+        
+        if options['output']:
+            output = open(options['output'], 'w', newline='')
+        else:
+            output = sys.stdout
+        
+        count = -1  # header row
+        try:
+            for line in rows:
+                output.write(line)
+                count += 1
+        finally:
+            if options['output']:
+                output.close()
+        
+        if options['output']:
+            self.stdout.write(self.style.SUCCESS(f"Exported {count} {options['kind']} to {options['output']}"))
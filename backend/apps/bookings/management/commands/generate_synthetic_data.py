@@ -0,0 +1,79 @@
+# apps/bookings/management/commands/generate_synthetic_data.py
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from apps.bookings.synthetic import (
+    DEFAULT_BATCH_SIZE, MAX_BOOKABLE_DURATION, SYNTHETIC_DOMAIN, clear_synthetic_data, generate_synthetic_data,
+    synthetic_users
+)
+
+
+def parse_date(value):
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError(f"Invalid date '{value}'. Use YYYY-MM-DD")
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a reproducible synthetic dataset for scale testing: clients, staff, services, '
+        'appointment history with payments and reviews, and gallery images. '
+        'For example, --staff 40 --clients 20000 --per-day 8 gives about 120k appointments '
+        'and 250k rows in total.'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=1000)
+        parser.add_argument('--staff', type=int, default=10)
+        parser.add_argument('--services', type=int, default=0, help='Synthetic services on top of the catalog')
+        parser.add_argument('--months', type=int, default=12, help='Months of appointment history')
+        parser.add_argument('--per-day', type=int, default=6, help='Appointments per stylist per day')
+        parser.add_argument('--days-ahead', type=int, default=30, help='Days of upcoming bookings and availability')
+        parser.add_argument('--gallery-images', type=int, default=200)
+        parser.add_argument('--seed', type=int, default=0, help='Random seed; the same seed gives the same data')
+        parser.add_argument(
+            '--anchor-date', type=parse_date,
+            help='Date the history runs up to (YYYY-MM-DD, defaults to today); fix it for identical dates across runs'
+        )
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--skip-populate', action='store_true', help='Do not run the populate_* commands first')
+        parser.add_argument('--clear', action='store_true', help='Delete synthetic data from a previous run first')
+    
+    def handle(self, *args, **options):
+        for name in ('clients', 'staff', 'services', 'months', 'per_day', 'days_ahead', 'gallery_images'):
+            if options[name] < 0:
+                raise CommandError(f"--{name.replace('_', '-')} cannot be negative")
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be at least 1')
+        
+        if options['clear']:
+            deleted = clear_synthetic_data()
+            self.stdout.write(f"Deleted {deleted} rows of synthetic data")
+        elif synthetic_users().exists():
+            raise CommandError(f"Synthetic data (users @{SYNTHETIC_DOMAIN}) already exists; use --clear to replace it")
+        
+        def progress(stats):
+            self.stdout.write(f"  {stats.summary()}")
+        
+        stats = generate_synthetic_data(
+            clients=options['clients'],
+            staff=options['staff'],
+            services=options['services'],
+            months=options['months'],
+            per_day=options['per_day'],
+            days_ahead=options['days_ahead'],
+            gallery_images=options['gallery_images'],
+            seed=options['seed'],
+            anchor_date=options['anchor_date'],
+            batch_size=options['batch_size'],
+            populate=not options['skip_populate'],
+            progress=progress if options['verbosity'] > 1 else None,
+        )
+        
+        if options['staff'] and options['clients'] and not stats.counts['appointments']:
+            self.stdout.write(self.style.WARNING(
+                f"No appointments were generated: there are no active services of up to "
+                f"{MAX_BOOKABLE_DURATION} minutes. Run without --skip-populate or pass --services."
+            ))
+        
+        self.stdout.write(self.style.SUCCESS(f"Generated {stats.summary()}"))
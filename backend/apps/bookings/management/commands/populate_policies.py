@@ -1,6 +1,7 @@
 # apps/bookings/management/commands/populate_policies.py
 from django.core.management.base import BaseCommand
 from apps.bookings.models import CancellationPolicy
+from utils.bulk import bulk_upsert
 
 
 class Command(BaseCommand):
@@ -30,18 +31,14 @@ class Command(BaseCommand):
             },
         ]
         
-        for policy_data in policies:
-            policy, created = CancellationPolicy.objects.get_or_create(
-                name=policy_data['name'],
-                defaults=policy_data
-            )
-            
-            if not created:
-                for key, value in policy_data.items():
-                    setattr(policy, key, value)
-                policy.save()
-            
-            status = 'Created' if created else 'Updated'
-            self.stdout.write(f"  {status}: {policy.name}")
+        result = bulk_upsert(
+            CancellationPolicy,
+            policies,
+            unique_fields=['name'],
+            update_fields=['hours_before', 'penalty_percentage', 'is_active'],
+        )
+        self.stdout.write(
+            f"  Policies: {result.created} created, {result.updated} updated, {result.unchanged} unchanged"
+        )
         
-        self.stdout.write(self.style.SUCCESS('Successfully populated policies!'))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS('Successfully populated policies!'))
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-19 12:41
+
+from django.db import migrations, models
+
+
+def rename_duplicate_policies(apps, schema_editor):
+    """Suffix duplicate policy names with their id so the unique constraint can be added."""
+    CancellationPolicy = apps.get_model('bookings', 'CancellationPolicy')
+    seen = set()
+    for policy in CancellationPolicy.objects.order_by('id'):
+        if policy.name in seen:
+            policy.name = f'{policy.name[:90]} ({policy.id})'
+            policy.save(update_fields=['name'])
+        seen.add(policy.name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_appointment_bookings_ap_status_85414a_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_policies, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='cancellationpolicy',
+            name='name',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
@@ -25,6 +25,15 @@ class Appointment(models.Model):
         ('failed', 'Failed'),
     ]
     
+    # Allowed status changes, keyed by current status
+    STATUS_TRANSITIONS = {
+        'pending': {'confirmed', 'completed', 'cancelled', 'no_show'},
+        'confirmed': {'completed', 'cancelled', 'no_show'},
+        'completed': set(),
+        'cancelled': set(),
+        'no_show': set(),
+    }
+    
     # Appointment details
     client = models.ForeignKey(
         User, 
@@ -111,6 +120,7 @@ class Appointment(models.Model):
             models.Index(fields=['staff', 'appointment_date']),
             models.Index(fields=['status']),
             models.Index(fields=['appointment_date']),
+            models.Index(fields=['status', 'appointment_date']),
         ]
         constraints = [
             models.UniqueConstraint(
@@ -138,13 +148,33 @@ class Appointment(models.Model):
         if not self.total_amount and self.service_price:
             self.total_amount = self.service_price - self.discount_amount + self.tax_amount
         
+        # Derive status before the write so a payment update costs one UPDATE
+        previous_status = self.status
+        self.apply_derived_status()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.status != previous_status:
+            kwargs['update_fields'] = set(update_fields) | {'status'}
+        
         super().save(*args, **kwargs)
     
+    def derived_status(self):
+        """Return the status implied by the current payment state."""
+        if self.payment_status == 'paid' and self.status == 'pending':
+            return 'confirmed'
+        return self.status
+    
+    def apply_derived_status(self):
+        self.status = self.derived_status()
+    
+    @classmethod
+    def can_transition(cls, from_status, to_status):
+        return to_status in cls.STATUS_TRANSITIONS.get(from_status, set())
+    
     @property
     def is_upcoming(self):
         from datetime import datetime
         now = timezone.now()
-        appointment_datetime = datetime.combine(self.appointment_date, self.start_time)
+        appointment_datetime = timezone.make_aware(datetime.combine(self.appointment_date, self.start_time))
         return appointment_datetime > now and self.status in ['pending', 'confirmed']
     
     @property
@@ -198,6 +228,9 @@ class Payment(models.Model):
     
     class Meta:
         ordering = ['-payment_date']
+        indexes = [
+            models.Index(fields=['payment_date']),
+        ]
     
     def __str__(self):
         return f"Payment #{self.id} - {self.amount} - {self.appointment}"
@@ -249,7 +282,7 @@ class Review(models.Model):
 
 
 class CancellationPolicy(models.Model):
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, unique=True)
     hours_before = models.PositiveIntegerField(
         help_text="Hours before appointment when cancellation is allowed"
     )
@@ -0,0 +1,143 @@
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum, Count, Q
+from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
+from django.utils import timezone
+from .models import Appointment, Payment
+
+PERIOD_FUNCTIONS = {
+    'day': TruncDate,
+    'week': TruncWeek,
+    'month': TruncMonth,
+}
+
+# (id field, label fields) per grouping, for payments and appointments
+PAYMENT_GROUPS = {
+    'staff': ('appointment__staff_id', ['appointment__staff__user__first_name', 'appointment__staff__user__last_name']),
+    'service': ('appointment__service_id', ['appointment__service__name']),
+    'method': ('payment_method', []),
+}
+APPOINTMENT_GROUPS = {
+    'staff': ('staff_id', ['staff__user__first_name', 'staff__user__last_name']),
+    'service': ('service_id', ['service__name']),
+}
+
+
+def _as_date(value):
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _group_label(row, label_fields, group_id):
+    parts = [row[field] for field in label_fields if row.get(field)]
+    return ' '.join(parts) if parts else group_id
+
+
+def _payment_rows(start_date, end_date, period, group_by):
+    tz = timezone.get_current_timezone()
+    # Range on the raw column so the payment_date index can be used
+    start_dt = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+    end_dt = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min), tz)
+    
+    group_fields = []
+    label_fields = []
+    if group_by in PAYMENT_GROUPS:
+        id_field, label_fields = PAYMENT_GROUPS[group_by]
+        group_fields = [id_field] + label_fields
+    
+    rows = Payment.objects.filter(
+        payment_date__gte=start_dt, payment_date__lt=end_dt
+    ).annotate(
+        period=PERIOD_FUNCTIONS[period]('payment_date', tzinfo=tz)
+    ).values('period', *group_fields).annotate(
+        revenue=Sum('amount'),
+        refunds=Sum('refund_amount', filter=Q(is_refunded=True)),
+        payments=Count('id'),
+    ).order_by()
+    
+    for row in rows:
+        group_id = row[group_fields[0]] if group_fields else None
+        yield (_as_date(row['period']), group_id), row, label_fields
+
+
+def _appointment_rows(start_date, end_date, period, group_by):
+    group_fields = []
+    label_fields = []
+    if group_by in APPOINTMENT_GROUPS:
+        id_field, label_fields = APPOINTMENT_GROUPS[group_by]
+        group_fields = [id_field] + label_fields
+    
+    rows = Appointment.objects.filter(
+        appointment_date__gte=start_date, appointment_date__lte=end_date
+    ).annotate(
+        period=PERIOD_FUNCTIONS[period]('appointment_date')
+    ).values('period', *group_fields).annotate(
+        bookings=Count('id'),
+        completed=Count('id', filter=Q(status='completed')),
+        cancelled=Count('id', filter=Q(status='cancelled')),
+        no_show=Count('id', filter=Q(status='no_show')),
+        discounts=Sum('discount_amount', filter=~Q(status='cancelled')),
+    ).order_by()
+    
+    for row in rows:
+        group_id = row[group_fields[0]] if group_fields else None
+        yield (_as_date(row['period']), group_id), row, label_fields
+
+
+def build_revenue_report(start_date, end_date, period='day', group_by=None):
+    """
+    Revenue, refund, discount and booking totals per period (and optional group).
+    
+    Payments and appointments are each aggregated with a single GROUP BY and
+    merged in memory. Appointments have no payment method, so booking counts
+    are reported per period only when grouping by method.
+    """
+    results = {}
+    
+    def entry(key, label):
+        if key not in results:
+            results[key] = {
+                'period': key[0].isoformat(),
+                'group': {'id': key[1], 'name': label} if group_by else None,
+                'revenue': 0.0,
+                'refunds': 0.0,
+                'net_revenue': 0.0,
+                'payments': 0,
+                'discounts': 0.0,
+                'bookings': 0,
+                'completed': 0,
+                'cancelled': 0,
+                'no_show': 0,
+            }
+        return results[key]
+    
+    for key, row, label_fields in _payment_rows(start_date, end_date, period, group_by):
+        item = entry(key, _group_label(row, label_fields, key[1]))
+        item['revenue'] = float(row['revenue'] or 0)
+        item['refunds'] = float(row['refunds'] or 0)
+        item['net_revenue'] = item['revenue'] - item['refunds']
+        item['payments'] = row['payments']
+    
+    for key, row, label_fields in _appointment_rows(start_date, end_date, period, group_by):
+        item = entry(key, _group_label(row, label_fields, key[1]))
+        item['discounts'] = float(row['discounts'] or 0)
+        for field in ('bookings', 'completed', 'cancelled', 'no_show'):
+            item[field] = row[field]
+    
+    return sorted(
+        results.values(),
+        key=lambda item: (item['period'], str(item['group']['id']) if item['group'] else '')
+    )
+
+
+def get_revenue_report(start_date, end_date, period='day', group_by=None):
+    """Return the report, caching it when the whole range is in the past."""
+    if end_date >= timezone.localdate():
+        return build_revenue_report(start_date, end_date, period, group_by)
+    
+    cache_key = f"reports:revenue:{period}:{group_by or 'none'}:{start_date}:{end_date}"
+    report = cache.get(cache_key)
+    if report is None:
+        report = build_revenue_report(start_date, end_date, period, group_by)
+        cache.set(cache_key, report, settings.REPORT_CACHE_TIMEOUT)
+    return report
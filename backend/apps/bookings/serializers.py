@@ -1,7 +1,9 @@
 from rest_framework import serializers
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.utils import timezone
 from datetime import datetime, timedelta
 from .models import Appointment, Payment, Review, CancellationPolicy
+from .services import post_payment
 from apps.users.serializers import UserSerializer
 from apps.staff.serializers import StaffListSerializer
 from apps.services.serializers import ServiceSerializer
@@ -54,7 +56,7 @@ class AppointmentSerializer(serializers.ModelSerializer):
         start_time = data.get('start_time')
         
         if appointment_date and start_time:
-            appointment_datetime = datetime.combine(appointment_date, start_time)
+            appointment_datetime = timezone.make_aware(datetime.combine(appointment_date, start_time))
             if appointment_datetime < timezone.now():
                 raise serializers.ValidationError(
                     "Appointment date and time cannot be in the past"
@@ -120,6 +122,44 @@ class AppointmentCreateSerializer(serializers.ModelSerializer):
     
     def validate(self, data):
         return AppointmentSerializer.validate(self, data)
+    
+    def create(self, validated_data):
+        request = self.context.get('request')
+        if request and request.user.is_authenticated:
+            validated_data.setdefault('client_id', request.user.pk)
+        validated_data.setdefault('service_price', validated_data['service'].final_price)
+        return super().create(validated_data)
+
+
+class AppointmentStatusTransitionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.ChoiceField(choices=Appointment.STATUS_CHOICES)
+
+
+class AppointmentBatchStatusSerializer(serializers.Serializer):
+    transitions = AppointmentStatusTransitionSerializer(many=True, allow_empty=False)
+    reason = serializers.CharField(required=False, allow_blank=True, default='')
+    
+    def validate_transitions(self, value):
+        ids = [item['id'] for item in value]
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError("Each appointment can only appear once per batch")
+        
+        # Validate every transition against the current statuses in one query
+        current_statuses = dict(
+            Appointment.objects.filter(id__in=ids).values_list('id', 'status')
+        )
+        errors = {}
+        for item in value:
+            current = current_statuses.get(item['id'])
+            if current is None:
+                errors[str(item['id'])] = "Appointment not found"
+            elif not Appointment.can_transition(current, item['status']):
+                errors[str(item['id'])] = f"Cannot change status from {current} to {item['status']}"
+        
+        if errors:
+            raise serializers.ValidationError(errors)
+        return value
 
 
 class PaymentSerializer(serializers.ModelSerializer):
@@ -134,21 +174,44 @@ class PaymentSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'payment_date']
     
+    REFUND_FIELDS = ('is_refunded', 'refund_date', 'refund_amount')
+    
     def validate(self, data):
         appointment = data.get('appointment')
         amount = data.get('amount')
         
+        # post_payment() records new payments only; refunds are updates to an existing one
+        if self.instance is None:
+            refund_errors = {
+                field: "Cannot be set when recording a payment."
+                for field in self.REFUND_FIELDS if data.get(field)
+            }
+            if refund_errors:
+                raise serializers.ValidationError(refund_errors)
+        
         if appointment and amount:
             if amount <= 0:
                 raise serializers.ValidationError("Payment amount must be greater than zero")
             
-            # Check if payment exceeds balance due
+            # Check if payment exceeds balance due (re-checked under lock in post_payment)
             if amount > appointment.balance_due:
                 raise serializers.ValidationError(
                     f"Payment amount exceeds balance due. Balance: {appointment.balance_due}"
                 )
         
         return data
+    
+    def create(self, validated_data):
+        try:
+            return post_payment(
+                validated_data['appointment'].pk,
+                validated_data['amount'],
+                validated_data['payment_method'],
+                transaction_id=validated_data.get('transaction_id', ''),
+                notes=validated_data.get('notes', '')
+            )
+        except DjangoValidationError as e:
+            raise serializers.ValidationError(e.messages)
 
 
 class ReviewSerializer(serializers.ModelSerializer):
@@ -225,4 +288,48 @@ class AvailabilityCheckSerializer(serializers.Serializer):
 class TimeSlotSerializer(serializers.Serializer):
     start_time = serializers.TimeField()
     end_time = serializers.TimeField()
-    is_available = serializers.BooleanField()
\ No newline at end of file
+    is_available = serializers.BooleanField()
+
+
+class RevenueReportQuerySerializer(serializers.Serializer):
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    period = serializers.ChoiceField(choices=['day', 'week', 'month'], default='day')
+    group_by = serializers.ChoiceField(
+        choices=['staff', 'service', 'method'],
+        required=False,
+        allow_null=True,
+        default=None
+    )
+    
+    def validate(self, data):
+        today = timezone.localdate()
+        data['end_date'] = data.get('end_date') or today
+        data['start_date'] = data.get('start_date') or data['end_date'] - timedelta(days=30)
+        
+        if data['start_date'] > data['end_date']:
+            raise serializers.ValidationError("start_date must be on or before end_date")
+        if (data['end_date'] - data['start_date']).days > 366 * 3:
+            raise serializers.ValidationError("Date range cannot exceed three years")
+        return data
+
+
+class ExportQuerySerializer(serializers.Serializer):
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+    status = serializers.CharField(required=False, allow_blank=True)
+    
+    def validate_status(self, value):
+        statuses = [item.strip() for item in value.split(',') if item.strip()]
+        valid = {choice for choice, _ in Appointment.STATUS_CHOICES}
+        invalid = [item for item in statuses if item not in valid]
+        if invalid:
+            raise serializers.ValidationError(f"Invalid status: {', '.join(invalid)}")
+        return statuses
+    
+    def validate(self, data):
+        start_date = data.get('start_date')
+        end_date = data.get('end_date')
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError("start_date must be on or before end_date")
+        return data
\ No newline at end of file
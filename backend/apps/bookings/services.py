@@ -0,0 +1,105 @@
+from collections import defaultdict
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import F, Case, When, Value
+from django.utils import timezone
+from .models import Appointment, Payment
+from .signals import appointments_status_changed
+from utils.tasks import enqueue
+
+
+class StatusTransitionConflict(Exception):
+    """Raised when appointments changed status while a batch was being applied."""
+
+
+def apply_status_transitions(transitions, reason=''):
+    """
+    Apply a mapping of {appointment_id: new_status} with one UPDATE per target status.
+    
+    Transitions are expected to be validated already; the UPDATE is still
+    guarded on the allowed source statuses so a concurrent change cannot
+    produce an invalid transition. Returns {status: [ids]}.
+    """
+    by_status = defaultdict(list)
+    for appointment_id, new_status in transitions.items():
+        by_status[new_status].append(appointment_id)
+    
+    now = timezone.now()
+    changes = {}
+    
+    with transaction.atomic():
+        for new_status, ids in by_status.items():
+            source_statuses = [
+                current for current, targets in Appointment.STATUS_TRANSITIONS.items()
+                if new_status in targets
+            ]
+            fields = {'status': new_status, 'updated_at': now}
+            if new_status == 'completed':
+                fields['completed_at'] = now
+            elif new_status == 'cancelled':
+                fields['cancelled_at'] = now
+                fields['cancellation_reason'] = reason
+            
+            updated = Appointment.objects.filter(
+                id__in=ids, status__in=source_statuses
+            ).update(**fields)
+            if updated != len(ids):
+                raise StatusTransitionConflict(
+                    "Some appointments changed status during the update, please retry"
+                )
+            changes[new_status] = ids
+        
+        transaction.on_commit(
+            lambda: enqueue(
+                appointments_status_changed.send,
+                sender=Appointment,
+                changes=changes,
+                reason=reason
+            )
+        )
+    
+    return changes
+
+
+def post_payment(appointment_id, amount, payment_method, transaction_id='', notes=''):
+    """
+    Record a payment and update the appointment's amount_paid/payment_status.
+    
+    The appointment row is locked for the duration of the transaction, so
+    concurrent postings are serialized and the balance check cannot be raced.
+    The denormalized totals are updated with F() arithmetic instead of being
+    recalculated from the payment history.
+    """
+    if amount <= 0:
+        raise ValidationError("Payment amount must be greater than zero")
+    
+    with transaction.atomic():
+        appointment = Appointment.objects.select_for_update().get(pk=appointment_id)
+        
+        if amount > appointment.balance_due:
+            raise ValidationError(
+                f"Payment amount exceeds balance due. Balance: {appointment.balance_due}"
+            )
+        
+        payment = Payment.objects.create(
+            appointment=appointment,
+            amount=amount,
+            payment_method=payment_method,
+            transaction_id=transaction_id,
+            notes=notes
+        )
+        
+        new_amount_paid = F('amount_paid') + amount
+        fully_paid = When(total_amount__lte=new_amount_paid, then=Value('paid'))
+        Appointment.objects.filter(pk=appointment.pk).update(
+            amount_paid=new_amount_paid,
+            payment_status=Case(fully_paid, default=Value('partial')),
+            # Same rule as Appointment.derived_status(), applied in SQL
+            status=Case(
+                When(status='pending', total_amount__lte=new_amount_paid, then=Value('confirmed')),
+                default=F('status')
+            ),
+            updated_at=timezone.now()
+        )
+    
+    return payment
@@ -1,25 +1,22 @@
-from django.db.models.signals import post_save, pre_save
-from django.dispatch import receiver
+from django.db.models.signals import pre_save
+from django.dispatch import receiver, Signal
 from django.utils import timezone
 from datetime import timedelta
 from .models import Appointment
-from utils.email_service import send_appointment_reminder
+from utils.email_service import (
+    send_appointment_reminder,
+    send_appointment_cancellation,
+    send_staff_notification,
+)
 
-
-@receiver(post_save, sender=Appointment)
-def update_appointment_status(sender, instance, created, **kwargs):
-    """Update appointment status based on payment."""
-    if not created and instance.payment_status == 'paid' and instance.status == 'pending':
-        instance.status = 'confirmed'
-        instance.save(update_fields=['status'])
+# Sent once per batch status update with changes={status: [appointment ids]}
+appointments_status_changed = Signal()
 
 
 @receiver(pre_save, sender=Appointment)
 def check_for_reminders(sender, instance, **kwargs):
     """Check if reminder needs to be sent."""
     if instance.pk:
-        old_instance = Appointment.objects.get(pk=instance.pk)
-        
         # Check if appointment is within 24 hours and reminder hasn't been sent
         appointment_datetime = timezone.make_aware(
             timezone.datetime.combine(instance.appointment_date, instance.start_time)
@@ -28,4 +25,19 @@ def check_for_reminders(sender, instance, **kwargs):
         if (appointment_datetime - timezone.now()) <= timedelta(hours=24):
             if not instance.reminder_sent and instance.status in ['pending', 'confirmed']:
                 send_appointment_reminder(instance)
-                instance.reminder_sent = True
\ No newline at end of file
+                instance.reminder_sent = True
+
+
+@receiver(appointments_status_changed)
+def notify_batch_cancellations(sender, changes, reason='', **kwargs):
+    """Send cancellation emails for a batch status update in one pass."""
+    cancelled_ids = changes.get('cancelled')
+    if not cancelled_ids:
+        return
+    
+    appointments = Appointment.objects.filter(id__in=cancelled_ids).select_related(
+        'client', 'service', 'staff__user'
+    )
+    for appointment in appointments:
+        send_appointment_cancellation(appointment, reason)
+        send_staff_notification(appointment, 'cancelled')
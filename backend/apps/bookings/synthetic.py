@@ -0,0 +1,417 @@
+import io
+import random
+import time as timer
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+from apps.gallery.models import GalleryCategory, GalleryImage
+from apps.services.models import Service, ServiceCategory
+from apps.staff.models import Staff, StaffAvailability, StaffService
+from apps.users.models import UserProfile
+from .models import Appointment, Payment, Review
+
+User = get_user_model()
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Every synthetic user has an email on this domain, which is how --clear finds them
+SYNTHETIC_DOMAIN = 'synthetic.example.com'
+SERVICE_SLUG_PREFIX = 'synthetic-service-'
+GALLERY_TITLE_PREFIX = 'Synthetic '
+PASSWORD = 'SyntheticPass123!'
+
+# Synthetic staff work one window per day; bookings only use services that fit it
+DAY_START = time(9, 0)
+DAY_END = time(19, 0)
+MAX_BOOKABLE_DURATION = 120
+GAPS = ((0, 50), (15, 30), (30, 15), (60, 5))
+
+POPULATE_COMMANDS = ('populate_services', 'populate_staff', 'populate_policies', 'populate_gallery')
+
+# (value, weight) tables for the status and payment distributions
+HISTORY_STATUSES = (('completed', 78), ('cancelled', 13), ('no_show', 9))
+UPCOMING_STATUSES = (('confirmed', 70), ('pending', 30))
+PAYMENT_METHODS = (('card', 55), ('cash', 25), ('online', 15), ('wallet', 5))
+RATINGS = ((5, 62), (4, 24), (3, 8), (2, 4), (1, 2))
+
+# Share of the total taken as a discount or a deposit
+DISCOUNT = Decimal('0.10')
+DEPOSIT = Decimal('0.30')
+
+# Probabilities
+DISCOUNT_RATE = 0.1
+DEPOSIT_RATE = 0.3
+COMPLETED_UNPAID_RATE = 0.05
+CANCELLED_REFUND_RATE = 0.35
+NO_SHOW_FAILED_RATE = 0.25
+REVIEW_RATE = 0.35
+
+REVIEW_COMMENTS = (
+    'Loved the result, will be back!',
+    'Great attention to detail and very friendly.',
+    'Took a bit longer than expected but looks amazing.',
+    'Neat, fast and comfortable.',
+    'Good service overall.',
+    '',
+)
+
+FIRST_NAMES = (
+    'Amara', 'Brianna', 'Chloe', 'Dana', 'Ebony', 'Fatima', 'Grace', 'Imani', 'Jade',
+    'Keisha', 'Lena', 'Maya', 'Nia', 'Olivia', 'Precious', 'Rosa', 'Simone', 'Tasha',
+    'Victor', 'Marcus', 'Andre', 'Jamal', 'Kofi', 'Daniel',
+)
+LAST_NAMES = (
+    'Adams', 'Baker', 'Clarke', 'Diallo', 'Evans', 'Frazier', 'Green', 'Harris', 'Johnson',
+    'King', 'Lewis', 'Mensah', 'Njoroge', 'Owens', 'Parker', 'Robinson', 'Smith', 'Walker',
+)
+
+
+def weighted(rng, table):
+    values, weights = zip(*table)
+    return rng.choices(values, weights)[0]
+
+
+def synthetic_users():
+    return User.objects.filter(email__endswith=f'@{SYNTHETIC_DOMAIN}')
+
+
+class GenerationStats:
+    """Running totals for a synthetic data run."""
+    
+    def __init__(self):
+        self.counts = defaultdict(int)
+        self.started = timer.perf_counter()
+    
+    @property
+    def elapsed(self):
+        return timer.perf_counter() - self.started
+    
+    @property
+    def total(self):
+        return sum(self.counts.values())
+    
+    def summary(self):
+        parts = ', '.join(f"{count} {name}" for name, count in self.counts.items())
+        return f"{self.total} rows ({parts}) in {self.elapsed:.1f}s"
+
+
+class SyntheticDataGenerator:
+    """
+    Bulk-insert a reproducible dataset around an anchor date.
+    
+    Every random choice comes from one Random(seed), and dates are relative
+    to anchor_date, so the same arguments always produce the same rows.
+    Appointments are built day by day and written with bulk_create every
+    batch_size rows, together with their payments and reviews, so memory
+    stays flat however much history is requested.
+    """
+    
+    def __init__(self, seed=0, anchor_date=None, batch_size=DEFAULT_BATCH_SIZE, progress=None):
+        self.rng = random.Random(seed)
+        self.anchor_date = anchor_date or timezone.localdate()
+        self.batch_size = batch_size
+        self.progress = progress
+        self.stats = GenerationStats()
+        self.password = make_password(PASSWORD)
+    
+    def bulk_create(self, model, objects):
+        objects = model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.stats.counts[str(model._meta.verbose_name_plural).lower()] += len(objects)
+        return objects
+    
+    def aware(self, day, at):
+        return timezone.make_aware(datetime.combine(day, at))
+    
+    def create_services(self, count):
+        categories = list(ServiceCategory.objects.order_by('id'))
+        if not categories:
+            categories = [ServiceCategory.objects.create(name='Synthetic Services')]
+        self.bulk_create(Service, [
+            Service(
+                category=categories[i % len(categories)],
+                name=f'Synthetic Service {i}',
+                slug=f'{SERVICE_SLUG_PREFIX}{i}',
+                description='Synthetic service for scale testing',
+                duration=self.rng.choice((30, 60, 90, 120)),
+                price=Decimal(self.rng.randrange(40, 300)),
+                is_active=True,
+                display_order=100 + i,
+            )
+            for i in range(count)
+        ])
+    
+    def create_users(self, kind, count, **extra):
+        return self.bulk_create(User, [
+            User(
+                email=f'{kind}-{i}@{SYNTHETIC_DOMAIN}',
+                first_name=self.rng.choice(FIRST_NAMES),
+                last_name=self.rng.choice(LAST_NAMES),
+                phone=f'(555) {self.rng.randrange(100, 1000)}-{self.rng.randrange(1000, 10000)}',
+                password=self.password,
+                **extra
+            )
+            for i in range(count)
+        ])
+    
+    def create_clients(self, count):
+        clients = self.create_users('client', count)
+        self.bulk_create(UserProfile, [
+            UserProfile(user=client, gender=self.rng.choice(('female', 'male', '')))
+            for client in clients
+        ])
+        return clients
+    
+    def create_staff(self, count, days_back, days_ahead):
+        users = self.create_users('staff', count, is_staff_member=True)
+        staff = self.bulk_create(Staff, [
+            Staff(
+                user=user,
+                title=self.rng.choice(('Stylist', 'Senior Stylist', 'Braider')),
+                experience_years=self.rng.randrange(1, 15),
+                display_order=10 + i,
+            )
+            for i, user in enumerate(users)
+        ])
+        
+        service_ids = list(Service.objects.filter(is_active=True).values_list('id', flat=True))
+        self.bulk_create(StaffService, [
+            StaffService(staff=member, service_id=service_id)
+            for member in staff for service_id in service_ids
+        ])
+        self.bulk_create(StaffAvailability, [
+            StaffAvailability(
+                staff=member,
+                date=self.anchor_date + timedelta(days=offset),
+                start_time=DAY_START,
+                end_time=DAY_END,
+                is_available=True,
+            )
+            for member in staff for offset in range(-days_back, days_ahead + 1)
+        ])
+        return staff
+    
+    def create_gallery(self, count, staff):
+        categories = list(GalleryCategory.objects.order_by('id')) or [None]
+        services = list(Service.objects.filter(is_active=True).order_by('id')) or [None]
+        image_types = [choice for choice, _ in GalleryImage.IMAGE_TYPE_CHOICES]
+        images = []
+        for i in range(count):
+            image_type = self.rng.choice(image_types)
+            images.append(GalleryImage(
+                title=f'{GALLERY_TITLE_PREFIX}{i}',
+                image=f'gallery/synthetic/{i}.jpg',
+                category=self.rng.choice(categories),
+                image_type=image_type,
+                # save() derives this from image_type, but bulk_create skips save()
+                is_before_after=image_type == 'before_after',
+                service=self.rng.choice(services),
+                staff=self.rng.choice(staff) if staff else None,
+                display_order=i,
+                is_featured=self.rng.random() < 0.05,
+                views=self.rng.randrange(0, 5000),
+                likes=self.rng.randrange(0, 500),
+            ))
+        self.bulk_create(GalleryImage, images)
+    
+    def plan_day(self, day, staff, clients, services, per_day, upcoming):
+        """Yield (appointment, payments, review) for one day of every stylist's diary."""
+        for member in staff:
+            start = datetime.combine(day, DAY_START)
+            for _ in range(per_day):
+                start += timedelta(minutes=weighted(self.rng, GAPS))
+                service = self.rng.choice(services)
+                end = start + timedelta(minutes=service.duration)
+                if end.time() > DAY_END or end.date() != day:
+                    break
+                
+                price = service.final_price
+                discount = Decimal(0)
+                if self.rng.random() < DISCOUNT_RATE:
+                    discount = (price * DISCOUNT).quantize(Decimal('0.01'))
+                total = price - discount
+                deposit = (total * DEPOSIT).quantize(Decimal('0.01'))
+                method = weighted(self.rng, PAYMENT_METHODS)
+                
+                payments = []
+                review = None
+                fields = {}
+                if upcoming:
+                    appointment_status = weighted(self.rng, UPCOMING_STATUSES)
+                    if self.rng.random() < DEPOSIT_RATE:
+                        payments.append(Payment(amount=deposit, payment_method=method))
+                        fields = {'payment_status': 'partial', 'amount_paid': deposit}
+                else:
+                    appointment_status = weighted(self.rng, HISTORY_STATUSES)
+                    if appointment_status == 'completed':
+                        fields['completed_at'] = self.aware(day, end.time())
+                        if self.rng.random() >= COMPLETED_UNPAID_RATE:
+                            # Paid in full, some after an earlier deposit
+                            if self.rng.random() < DEPOSIT_RATE:
+                                payments.append(Payment(amount=deposit, payment_method=method))
+                                payments.append(Payment(amount=total - deposit, payment_method=method))
+                            else:
+                                payments.append(Payment(amount=total, payment_method=method))
+                            fields.update(payment_status='paid', amount_paid=total)
+                        if self.rng.random() < REVIEW_RATE:
+                            rating = weighted(self.rng, RATINGS)
+                            review = Review(
+                                rating=rating,
+                                staff_rating=max(1, min(5, rating + self.rng.choice((-1, 0, 0, 1)))),
+                                service_rating=max(1, min(5, rating + self.rng.choice((-1, 0, 0, 1)))),
+                                comment=self.rng.choice(REVIEW_COMMENTS),
+                                is_approved=self.rng.random() < 0.9,
+                                is_featured=rating == 5 and self.rng.random() < 0.1,
+                            )
+                    elif appointment_status == 'cancelled':
+                        fields['cancelled_at'] = self.aware(day - timedelta(days=1), DAY_START)
+                        fields['cancellation_reason'] = 'Schedule conflict'
+                        if self.rng.random() < CANCELLED_REFUND_RATE:
+                            payments.append(Payment(
+                                amount=deposit, payment_method=method, is_refunded=True,
+                                refund_date=fields['cancelled_at'], refund_amount=deposit
+                            ))
+                            fields['payment_status'] = 'refunded'
+                    elif self.rng.random() < NO_SHOW_FAILED_RATE:
+                        fields['payment_status'] = 'failed'
+                
+                appointment = Appointment(
+                    client=self.rng.choice(clients),
+                    staff=member,
+                    service=service,
+                    appointment_date=day,
+                    start_time=start.time(),
+                    end_time=end.time(),
+                    status=appointment_status,
+                    service_price=price,
+                    discount_amount=discount,
+                    total_amount=total,
+                    confirmation_sent=True,
+                    reminder_sent=day <= self.anchor_date,
+                    **fields
+                )
+                yield appointment, payments, review
+                start = end
+    
+    def flush(self, planned):
+        """Write a batch of planned appointments, then backdate their timestamps."""
+        appointments = self.bulk_create(Appointment, [appointment for appointment, _, _ in planned])
+        
+        payments = []
+        reviews = []
+        for appointment, (_, appointment_payments, review) in zip(appointments, planned):
+            for payment in appointment_payments:
+                payment.appointment = appointment
+                payments.append(payment)
+            if review is not None:
+                review.appointment = appointment
+                reviews.append(review)
+        payments = self.bulk_create(Payment, payments)
+        reviews = self.bulk_create(Review, reviews)
+        
+        # auto_now_add fields are always set to the insert time, so move them
+        # back with one UPDATE per model and timestamp
+        booked = defaultdict(list)
+        paid = defaultdict(list)
+        reviewed = defaultdict(list)
+        for appointment in appointments:
+            booked[self.booked_at(appointment.appointment_date)].append(appointment.pk)
+        for payment in payments:
+            day = payment.appointment.appointment_date
+            if payment.is_refunded or day > self.anchor_date:
+                paid[self.booked_at(day)].append(payment.pk)
+            else:
+                paid[self.aware(day, DAY_END)].append(payment.pk)
+        for review in reviews:
+            reviewed[self.aware(review.appointment.appointment_date + timedelta(days=1), time(12, 0))].append(review.pk)
+        
+        for model, field, groups in (
+            (Appointment, 'created_at', booked),
+            (Payment, 'payment_date', paid),
+            (Review, 'created_at', reviewed),
+        ):
+            for value, pks in groups.items():
+                model.objects.filter(pk__in=pks).update(**{field: value})
+        
+        if self.progress:
+            self.progress(self.stats)
+    
+    def booked_at(self, day):
+        """When an appointment on `day` was made: a week ahead, but never after the anchor date."""
+        return self.aware(min(day - timedelta(days=7), self.anchor_date), time(12, 0))
+    
+    def create_appointments(self, staff, clients, history_days, days_ahead, per_day):
+        services = list(
+            Service.objects.filter(is_active=True, duration__lte=MAX_BOOKABLE_DURATION).order_by('id')
+        )
+        if not services:
+            return
+        
+        planned = []
+        for offset in range(-history_days, days_ahead + 1):
+            day = self.anchor_date + timedelta(days=offset)
+            upcoming = offset > 0
+            # Future diaries fill up as the date gets closer
+            day_per_day = max(1, round(per_day * (1 - offset / (days_ahead + 1)))) if upcoming else per_day
+            planned.extend(self.plan_day(day, staff, clients, services, day_per_day, upcoming))
+            if len(planned) >= self.batch_size:
+                self.flush(planned)
+                planned = []
+        if planned:
+            self.flush(planned)
+    
+    def generate(self, clients, staff, services=0, months=12, per_day=6, days_ahead=30, gallery_images=200):
+        history_days = months * 30
+        with transaction.atomic():
+            if services:
+                self.create_services(services)
+            staff_members = self.create_staff(staff, history_days, days_ahead)
+            client_users = self.create_clients(clients)
+            self.create_gallery(gallery_images, staff_members)
+            if client_users and staff_members:
+                self.create_appointments(staff_members, client_users, history_days, days_ahead, per_day)
+        return self.stats
+
+
+def populate_catalog():
+    """Run the populate_* commands so synthetic data sits on top of the real catalog."""
+    for command in POPULATE_COMMANDS:
+        call_command(command, stdout=io.StringIO())
+
+
+def clear_synthetic_data():
+    """Delete everything a previous run created; returns the number of rows deleted."""
+    with transaction.atomic():
+        deleted, _ = synthetic_users().delete()
+        deleted += Service.objects.filter(slug__startswith=SERVICE_SLUG_PREFIX).delete()[0]
+        deleted += GalleryImage.objects.filter(title__startswith=GALLERY_TITLE_PREFIX).delete()[0]
+        deleted += ServiceCategory.objects.filter(name='Synthetic Services').delete()[0]
+    return deleted
+
+
+def generate_synthetic_data(clients=1000, staff=10, services=0, months=12, per_day=6, days_ahead=30,
+                            gallery_images=200, seed=0, anchor_date=None, batch_size=DEFAULT_BATCH_SIZE,
+                            populate=True, progress=None):
+    """
+    Create synthetic clients, staff, services, appointments with payments and
+    reviews, and gallery images. Returns GenerationStats.
+    
+    Appointment volume is about staff * per_day * (months * 30 + days_ahead),
+    and payments and reviews add roughly as many rows again.
+    """
+    if populate:
+        populate_catalog()
+    generator = SyntheticDataGenerator(seed=seed, anchor_date=anchor_date, batch_size=batch_size, progress=progress)
+    return generator.generate(
+        clients=clients,
+        staff=staff,
+        services=services,
+        months=months,
+        per_day=per_day,
+        days_ahead=days_ahead,
+        gallery_images=gallery_images,
+    )
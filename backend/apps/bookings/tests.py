@@ -0,0 +1,476 @@
+import os
+import tempfile
+import threading
+import tracemalloc
+from datetime import date, time, timedelta
+from decimal import Decimal
+from unittest import mock
+from django.core import mail
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings, skipUnlessDBFeature
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+from apps.services.models import Service, ServiceCategory
+from apps.staff.models import Staff, StaffAvailability, StaffService
+from apps.users.models import User
+from .exports import iter_csv_rows
+from .models import Appointment, Payment, Review
+from .serializers import PaymentSerializer
+from .signals import appointments_status_changed
+from .services import post_payment
+
+
+def create_booking_fixtures():
+    """A service, a stylist and a client to book appointments with."""
+    category = ServiceCategory.objects.create(name='Braids')
+    service = Service.objects.create(
+        category=category, name='Box Braids', slug='box-braids',
+        description='Box braids', duration=60, price=Decimal('100.00')
+    )
+    staff = Staff.objects.create(
+        user=User.objects.create(email='stylist@example.com', is_staff_member=True)
+    )
+    client_user = User.objects.create(email='client@example.com')
+    return service, staff, client_user
+
+
+def create_appointment(service, staff, client_user, days_ahead=7, hour=10, **fields):
+    # More than a day ahead by default, so the reminder hook has nothing to send
+    return Appointment.objects.create(
+        client=client_user, staff=staff, service=service,
+        appointment_date=timezone.localdate() + timedelta(days=days_ahead), start_time=time(hour, 0),
+        service_price=Decimal('100.00'), **fields
+    )
+
+
+class AppointmentSaveQueryTests(TestCase):
+    """Saving an appointment, with or without a payment, costs a single UPDATE."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.service, cls.staff, cls.client_user = create_booking_fixtures()
+    
+    def setUp(self):
+        self.appointment = create_appointment(self.service, self.staff, self.client_user)
+    
+    def test_plain_save(self):
+        self.appointment.notes = 'Bring extensions'
+        with self.assertNumQueries(1):
+            self.appointment.save()
+    
+    def test_paid_save_confirms_in_the_same_update(self):
+        self.appointment.payment_status = 'paid'
+        self.appointment.amount_paid = self.appointment.total_amount
+        with self.assertNumQueries(1):
+            self.appointment.save(update_fields=['payment_status', 'amount_paid'])
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, 'confirmed')
+    
+    def test_paid_full_save_confirms_in_the_same_update(self):
+        self.appointment.payment_status = 'paid'
+        with self.assertNumQueries(1):
+            self.appointment.save()
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.status, 'confirmed')
+    
+    def test_post_payment(self):
+        # Savepoint, locked read, payment INSERT, appointment UPDATE, release
+        with self.assertNumQueries(5):
+            post_payment(self.appointment.pk, self.appointment.total_amount, 'cash')
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.payment_status, 'paid')
+        self.assertEqual(self.appointment.status, 'confirmed')
+
+
+class AppointmentReminderTests(TestCase):
+    """Saving an appointment within 24 hours of its start sends the reminder once."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.service, cls.staff, cls.client_user = create_booking_fixtures()
+    
+    def test_reminder_is_sent_once(self):
+        appointment = create_appointment(self.service, self.staff, self.client_user, days_ahead=1, hour=0)
+        self.assertEqual(len(mail.outbox), 0)
+        
+        appointment.notes = 'Running late'
+        appointment.save()
+        appointment.save()
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('Appointment Reminder', mail.outbox[0].subject)
+        self.assertIn('friendly reminder', mail.outbox[0].body)
+        appointment.refresh_from_db()
+        self.assertTrue(appointment.reminder_sent)
+
+
+class AvailabilityQueryTests(TestCase):
+    """The availability endpoint runs the same queries however booked the day is."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.service, cls.staff, cls.client_user = create_booking_fixtures()
+        StaffService.objects.create(staff=cls.staff, service=cls.service)
+        cls.day = timezone.localdate() + timedelta(days=7)
+        StaffAvailability.objects.create(staff=cls.staff, date=cls.day, start_time=time(9), end_time=time(17))
+    
+    def get_slots(self):
+        # Staff, service, staff service check, availability windows, bookings
+        with self.assertNumQueries(5):
+            response = self.client.get('/api/bookings/availability/check/', {
+                'staff_id': self.staff.pk, 'service_id': self.service.pk, 'date': self.day
+            })
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+    
+    def test_query_count_does_not_depend_on_bookings(self):
+        self.assertEqual(sum(slot['is_available'] for slot in self.get_slots()), 8)
+        
+        for hours in ((9, 11, 13, 15), (10, 12, 14, 16)):
+            for hour in hours:
+                create_appointment(self.service, self.staff, self.client_user, hour=hour, status='confirmed')
+            slots = self.get_slots()
+        
+        self.assertEqual(len(slots), 8)
+        self.assertFalse(any(slot['is_available'] for slot in slots))
+
+
+class BatchStatusTests(TestCase):
+    """The batch status endpoint applies a validated batch all at once, or not at all."""
+    
+    URL = '/api/bookings/appointments/batch_status/'
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.service, cls.staff, cls.client_user = create_booking_fixtures()
+        cls.admin = User.objects.create(email='admin@example.com', is_staff=True)
+    
+    def setUp(self):
+        self.appointments = [
+            create_appointment(self.service, self.staff, self.client_user, hour=hour)
+            for hour in (9, 11, 13)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+    
+    def post(self, transitions, **data):
+        return self.client.post(self.URL, {
+            'transitions': [{'id': appointment.pk, 'status': new_status} for appointment, new_status in transitions],
+            **data
+        }, format='json')
+    
+    def statuses(self):
+        return list(Appointment.objects.order_by('pk').values_list('status', flat=True))
+    
+    def test_applies_every_transition(self):
+        first, second, third = self.appointments
+        response = self.post([(first, 'completed'), (second, 'completed'), (third, 'no_show')])
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, {'updated': {'completed': 2, 'no_show': 1}})
+        self.assertEqual(self.statuses(), ['completed', 'completed', 'no_show'])
+        first.refresh_from_db()
+        self.assertIsNotNone(first.completed_at)
+    
+    def test_invalid_transition(self):
+        first, second, _third = self.appointments
+        Appointment.objects.filter(pk=first.pk).update(status='no_show')
+        
+        response = self.post([(first, 'completed'), (second, 'completed')])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.data['transitions'], {str(first.pk): "Cannot change status from no_show to completed"}
+        )
+        self.assertEqual(self.statuses(), ['no_show', 'pending', 'pending'])
+    
+    def test_duplicate_ids(self):
+        first = self.appointments[0]
+        response = self.post([(first, 'completed'), (first, 'no_show')])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.statuses(), ['pending'] * 3)
+    
+    def test_conflict_rolls_back_the_batch(self):
+        first, second, _third = self.appointments
+        can_transition = Appointment.can_transition
+        
+        def complete_after_validation(current, new_status):
+            # Another request finishes the last appointment while the batch is validated
+            Appointment.objects.filter(pk=second.pk).update(status='completed')
+            return can_transition(current, new_status)
+        
+        with mock.patch.object(Appointment, 'can_transition', side_effect=complete_after_validation):
+            response = self.post([(first, 'completed'), (second, 'no_show')])
+        
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(self.statuses(), ['pending', 'completed', 'pending'])
+    
+    @override_settings(BACKGROUND_TASKS_EAGER=True)
+    def test_signal_is_sent_once_on_commit(self):
+        first, second, third = self.appointments
+        received = []
+        
+        def receiver(sender, changes, reason, **kwargs):
+            received.append((changes, reason))
+        
+        appointments_status_changed.connect(receiver)
+        self.addCleanup(appointments_status_changed.disconnect, receiver)
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post(
+                [(first, 'completed'), (second, 'no_show'), (third, 'completed')], reason='End of day'
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(received, [])
+        
+        self.assertEqual(received, [({'completed': [first.pk, third.pk], 'no_show': [second.pk]}, 'End of day')])
+
+
+
+@override_settings(STATICFILES_STORAGE='django.contrib.staticfiles.storage.StaticFilesStorage')
+class AdminChangelistQueryTests(TestCase):
+    """Admin changelists cost the same number of queries however many rows they show."""
+    
+    ROWS = 12
+    
+    @classmethod
+    def setUpTestData(cls):
+        service, _staff, _client_user = create_booking_fixtures()
+        for index in range(cls.ROWS):
+            # A stylist and a client per row, so any per-row lookup shows up as extra queries
+            staff = Staff.objects.create(
+                user=User.objects.create(email=f'stylist{index}@example.com', first_name='Stylist', is_staff_member=True)
+            )
+            client_user = User.objects.create(email=f'client{index}@example.com')
+            appointment = create_appointment(service, staff, client_user, days_ahead=index + 2)
+            Review.objects.create(appointment=appointment, rating=index % 5 + 1)
+        cls.admin = User.objects.create_superuser(email='admin@example.com', password='secret-123')
+    
+    def setUp(self):
+        self.client.force_login(self.admin)
+    
+    def test_appointment_changelist(self):
+        # Session, user, staff filter, service filter, count, page
+        with self.assertNumQueries(6):
+            response = self.client.get('/admin/bookings/appointment/')
+        self.assertEqual(len(response.context['cl'].result_list), self.ROWS)
+    
+    def test_review_changelist(self):
+        # Session, user, count, page, rating filter
+        with self.assertNumQueries(5):
+            response = self.client.get('/admin/bookings/review/')
+        self.assertEqual(len(response.context['cl'].result_list), self.ROWS)
+
+
+
+class PaymentPostingTests(TestCase):
+    """Payments are checked against the balance under the appointment's row lock."""
+    
+    @classmethod
+    def setUpTestData(cls):
+        cls.service, cls.staff, cls.client_user = create_booking_fixtures()
+        cls.admin = User.objects.create(email='admin@example.com', is_staff=True)
+    
+    def setUp(self):
+        self.appointment = create_appointment(self.service, self.staff, self.client_user)
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+    
+    def post(self, **data):
+        return self.client.post(
+            '/api/bookings/payments/',
+            {'appointment': self.appointment.pk, 'payment_method': 'cash', **data},
+            format='json'
+        )
+    
+    def test_refund_fields_are_rejected_on_create(self):
+        response = self.post(amount='50.00', is_refunded=True, refund_amount='50.00')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(set(response.data), {'is_refunded', 'refund_amount'})
+        self.assertFalse(Payment.objects.exists())
+        
+        response = self.post(amount='50.00', is_refunded=False)
+        self.assertEqual(response.status_code, 201)
+    
+    def test_payments_validated_together_cannot_exceed_the_balance(self):
+        # Both requests pass validation against the same balance before either posts
+        serializers = [
+            PaymentSerializer(data={'appointment': self.appointment.pk, 'amount': '60.00', 'payment_method': 'cash'})
+            for _ in range(2)
+        ]
+        for serializer in serializers:
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        
+        serializers[0].save()
+        with self.assertRaises(ValidationError):
+            serializers[1].save()
+        
+        self.appointment.refresh_from_db()
+        self.assertEqual(self.appointment.amount_paid, Decimal('60.00'))
+        self.assertEqual(Payment.objects.count(), 1)
+
+
+@skipUnlessDBFeature('has_select_for_update')
+class ConcurrentPaymentTests(TransactionTestCase):
+    """Two payments posted at the same moment cannot overpay an appointment."""
+    
+    def test_concurrent_payments_cannot_exceed_the_balance(self):
+        appointment = create_appointment(*create_booking_fixtures())
+        barrier = threading.Barrier(2)
+        results = []
+        
+        def pay():
+            try:
+                barrier.wait()
+                post_payment(appointment.pk, Decimal('60.00'), 'cash')
+                results.append('paid')
+            except DjangoValidationError:
+                results.append('rejected')
+            finally:
+                connection.close()
+        
+        threads = [threading.Thread(target=pay) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(sorted(results), ['paid', 'rejected'])
+        appointment.refresh_from_db()
+        self.assertEqual(appointment.amount_paid, Decimal('60.00'))
+
+
+class ExportStreamingTests(TestCase):
+    """Large CSV exports stream in bounded memory through the endpoint and the command."""
+    
+    ROWS = 100_000
+    STAFF = 10
+    SLOTS_PER_DAY = 10
+    
+    @classmethod
+    def setUpTestData(cls):
+        category = ServiceCategory.objects.create(name='Braids')
+        service = Service.objects.create(
+            category=category, name='Box Braids', slug='box-braids',
+            description='Box braids', duration=30, price=Decimal('100.00')
+        )
+        client_user = User.objects.create(email='client@example.com')
+        staff = [
+            Staff.objects.create(user=User.objects.create(email=f'stylist{i}@example.com', is_staff_member=True))
+            for i in range(cls.STAFF)
+        ]
+        cls.admin = User.objects.create(email='admin@example.com', is_staff=True)
+        
+        cls.insert_appointments(client_user, staff, service)
+    
+    @classmethod
+    def insert_appointments(cls, client_user, staff, service):
+        """
+        Insert ROWS appointments with one executemany.
+        
+        bulk_create spends most of its time preparing every field of every
+        row; here the values are prepared once from a template and only the
+        staff, date, times and status vary.
+        """
+        template = Appointment(
+            client=client_user, staff=staff[0], service=service,
+            appointment_date=date(2020, 1, 1), start_time=time(8), end_time=time(8, 30),
+            status='completed', service_price=Decimal('100.00'), total_amount=Decimal('100.00')
+        )
+        fields = [field for field in Appointment._meta.concrete_fields if not field.primary_key]
+        prepared = {
+            field.attname: field.get_db_prep_save(field.pre_save(template, True), connection)
+            for field in fields
+        }
+        
+        def prepare(name, value):
+            return Appointment._meta.get_field(name).get_db_prep_save(value, connection)
+        
+        day_count = cls.ROWS // cls.STAFF // cls.SLOTS_PER_DAY
+        days = [prepare('appointment_date', date(2020, 1, 1) + timedelta(days=day)) for day in range(day_count)]
+        starts = [prepare('start_time', time(8 + hour)) for hour in range(cls.SLOTS_PER_DAY)]
+        ends = [prepare('end_time', time(8 + hour, 30)) for hour in range(cls.SLOTS_PER_DAY)]
+        
+        rows = []
+        for index in range(cls.ROWS):
+            slot, staff_index = divmod(index, cls.STAFF)
+            day, hour = divmod(slot, cls.SLOTS_PER_DAY)
+            prepared.update(
+                staff_id=staff[staff_index].pk, appointment_date=days[day],
+                start_time=starts[hour], end_time=ends[hour],
+                status='completed' if index % 4 else 'cancelled',
+            )
+            rows.append([prepared[field.attname] for field in fields])
+        
+        quote_name = connection.ops.quote_name
+        columns = ', '.join(quote_name(field.column) for field in fields)
+        placeholders = ', '.join(['%s'] * len(fields))
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {quote_name(Appointment._meta.db_table)} ({columns}) VALUES ({placeholders})", rows
+            )
+    
+    def consume(self, lines):
+        """Count lines and bytes while tracing the peak memory held at any point."""
+        count = 0
+        size = 0
+        tracemalloc.start()
+        try:
+            for line in lines:
+                count += 1
+                size += len(line)
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return count, size, peak
+    
+    def test_endpoint_streams_every_row_in_bounded_memory(self):
+        client = APIClient()
+        client.force_authenticate(self.admin)
+        response = client.get('/api/reports/export/appointments/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines, size, peak = self.consume(
+            chunk.decode() if isinstance(chunk, bytes) else chunk for chunk in response.streaming_content
+        )
+        self.assertEqual(lines, self.ROWS + 1)
+        # Materializing the rows would hold several times the CSV's size; streaming holds a fraction
+        self.assertLess(peak, size / 2)
+    
+    def test_rows_are_read_in_chunks(self):
+        rows = iter_csv_rows('appointments', chunk_size=500)
+        next(rows)  # header
+        tracemalloc.start()
+        try:
+            first_rows = [next(rows) for _ in range(1000)]
+            _current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+            rows.close()
+        
+        self.assertEqual(len(first_rows), 1000)
+        # Reading the first rows must not have materialized the other 99,000
+        self.assertLess(peak, 2 * 1024 * 1024)
+    
+    def test_status_filter(self):
+        lines = sum(1 for _ in iter_csv_rows('appointments', statuses=['cancelled']))
+        self.assertEqual(lines, self.ROWS // 4 + 1)
+    
+    def test_command_writes_every_row(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'appointments.csv')
+            call_command('export_bookings', 'appointments', '--output', path, stdout=open(os.devnull, 'w'))
+            with open(path, newline='') as export_file:
+                self.assertEqual(sum(1 for _ in export_file), self.ROWS + 1)
+    
+    def test_command_validates_like_the_endpoint(self):
+        with self.assertRaisesMessage(CommandError, 'Invalid status: unknown'):
+            call_command('export_bookings', 'appointments', '--status', 'completed,unknown')
+        with self.assertRaisesMessage(CommandError, 'start_date must be on or before end_date'):
+            call_command('export_bookings', 'appointments', '--start-date', '2020-02-01', '--end-date', '2020-01-01')
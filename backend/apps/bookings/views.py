@@ -2,19 +2,26 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
-from datetime import datetime, date, timedelta
+from django.db import transaction
 from .models import Appointment, Payment, Review, CancellationPolicy
 from .serializers import (
     AppointmentSerializer,
     AppointmentCreateSerializer,
+    AppointmentBatchStatusSerializer,
     PaymentSerializer,
     ReviewSerializer,
     CancellationPolicySerializer,
     AvailabilityCheckSerializer,
     TimeSlotSerializer,
+    RevenueReportQuerySerializer,
+    ExportQuerySerializer,
 )
-from apps.users.permissions import IsOwnerOrReadOnly, IsClient
+from apps.users.permissions import IsOwnerOrReadOnly, IsClient, IsAdminOrStaff
+from .services import apply_status_transitions, StatusTransitionConflict
+from .reports import get_revenue_report
+from .exports import EXPORTS, iter_csv_rows, export_filename
+from utils.helpers import build_time_slots
+from utils.tasks import enqueue
 from utils.email_service import (
     send_appointment_confirmation,
     send_appointment_reminder,
@@ -22,6 +29,7 @@ from utils.email_service import (
     send_staff_notification,
 )
 from rest_framework.views import APIView
+from django.http import StreamingHttpResponse, Http404
 from django.utils import timezone
 from django.db.models import Sum
 from django.contrib.auth import get_user_model
@@ -39,7 +47,7 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if user.is_staff or user.is_staff_member:
             return self.queryset
-        return self.queryset.filter(client=user)
+        return self.queryset.filter(client_id=user.pk)
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -48,8 +56,9 @@ class AppointmentViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         appointment = serializer.save()
-        send_appointment_confirmation(appointment)
-        send_staff_notification(appointment, 'created')
+        # Send the emails off the request path, once the booking is committed
+        transaction.on_commit(lambda: enqueue(send_appointment_confirmation, appointment))
+        transaction.on_commit(lambda: enqueue(send_staff_notification, appointment, 'created'))
 
     @action(detail=True, methods=['post'])
     def cancel(self, request, pk=None):
@@ -57,46 +66,46 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         reason = request.data.get('reason', '')
         appointment.status = 'cancelled'
         appointment.cancellation_reason = reason
-        appointment.cancelled_at = datetime.now()
+        appointment.cancelled_at = timezone.now()
         appointment.save()
-        send_appointment_cancellation(appointment, reason)
-        send_staff_notification(appointment, 'cancelled')
+        transaction.on_commit(lambda: enqueue(send_appointment_cancellation, appointment, reason))
+        transaction.on_commit(lambda: enqueue(send_staff_notification, appointment, 'cancelled'))
         return Response({'status': 'Appointment cancelled'})
 
+    @action(detail=False, methods=['post'], permission_classes=[permissions.IsAuthenticated, IsAdminOrStaff])
+    def batch_status(self, request):
+        """Apply many status transitions (e.g. end-of-day completed/no-show) at once."""
+        serializer = AppointmentBatchStatusSerializer(data=request.data)
+        if serializer.is_valid():
+            transitions = {
+                item['id']: item['status']
+                for item in serializer.validated_data['transitions']
+            }
+            try:
+                changes = apply_status_transitions(transitions, serializer.validated_data['reason'])
+            except StatusTransitionConflict as e:
+                return Response({'error': str(e)}, status=status.HTTP_409_CONFLICT)
+            return Response({'updated': {new_status: len(ids) for new_status, ids in changes.items()}})
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=False, methods=['get'])
     def availability(self, request):
         serializer = AvailabilityCheckSerializer(data=request.query_params)
         if serializer.is_valid():
             staff = serializer.validated_data['staff']
             service = serializer.validated_data['service']
-            date_param = request.query_params.get('date')
-            target_date = datetime.strptime(date_param, '%Y-%m-%d').date() if date_param else date.today()
+            target_date = serializer.validated_data['date']
 
-            # Get staff availability and existing appointments
-            availabilities = staff.availabilities.filter(date=target_date, is_available=True)
-            existing_appointments = Appointment.objects.filter(
+            # Get staff availability and existing appointments, then build the slots in memory
+            windows = staff.availabilities.filter(
+                date=target_date, is_available=True
+            ).order_by('start_time').values_list('start_time', 'end_time')
+            booked = Appointment.objects.filter(
                 staff=staff, appointment_date=target_date, status__in=['pending', 'confirmed']
-            )
-
-            # Generate time slots
-            slots = []
-            for avail in availabilities:
-                current_time = avail.start_time
-                while current_time < avail.end_time:
-                    end_slot = (datetime.combine(target_date, current_time) + timedelta(minutes=service.duration)).time()
-                    if end_slot <= avail.end_time:
-                        # Check if slot is free
-                        conflicting = existing_appointments.filter(
-                            Q(start_time__lt=end_slot) & Q(end_time__gt=current_time)
-                        )
-                        slots.append({
-                            'start_time': current_time,
-                            'end_time': end_slot,
-                            'is_available': not conflicting.exists()
-                        })
-                    current_time = end_slot
-
-            return Response(slots)
+            ).values_list('start_time', 'end_time')
+
+            slots = build_time_slots(target_date, windows, booked, service.duration)
+            return Response(TimeSlotSerializer(slots, many=True).data)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -109,7 +118,7 @@ class PaymentViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if user.is_staff:
             return self.queryset
-        return self.queryset.filter(appointment__client=user)
+        return self.queryset.filter(appointment__client_id=user.pk)
 
 
 class ReviewViewSet(viewsets.ModelViewSet):
@@ -121,7 +130,7 @@ class ReviewViewSet(viewsets.ModelViewSet):
         user = self.request.user
         if user.is_staff:
             return self.queryset
-        return self.queryset.filter(appointment__client=user)
+        return self.queryset.filter(appointment__client_id=user.pk)
 
     def perform_create(self, serializer):
         serializer.save()
@@ -140,11 +149,8 @@ class AvailabilityViewSet(viewsets.ReadOnlyModelViewSet):
 
     @action(detail=False, methods=['get'])
     def check(self, request):
-        serializer = AvailabilityCheckSerializer(data=request.query_params)
-        if serializer.is_valid():
-            # Reuse logic from AppointmentViewSet.availability
-            return AppointmentViewSet().availability(request)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        # Reuse logic from AppointmentViewSet.availability (it validates the query itself)
+        return AppointmentViewSet().availability(request)
 
 
 class DashboardStatsView(APIView):
@@ -171,4 +177,59 @@ class DashboardStatsView(APIView):
             {'label': 'Total Clients', 'value': total_clients, 'color': 'success'},
             {'label': 'Revenue Today', 'value': float(revenue_today), 'color': 'warning'},
         ]
-        return Response(stats)
\ No newline at end of file
+        return Response(stats)
+
+
+class RevenueReportView(APIView):
+    """
+    Revenue, refunds, discounts and booking counts grouped by day/week/month
+    and optionally by staff, service or payment method.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, format=None):
+        serializer = RevenueReportQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        params = serializer.validated_data
+        report = get_revenue_report(
+            params['start_date'],
+            params['end_date'],
+            period=params['period'],
+            group_by=params['group_by']
+        )
+        return Response({
+            'start_date': params['start_date'],
+            'end_date': params['end_date'],
+            'period': params['period'],
+            'group_by': params['group_by'],
+            'results': report,
+        })
+
+
+class ExportView(APIView):
+    """
+    Stream appointments or payments as CSV.
+
+    Supports start_date, end_date and a comma-separated status filter.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, kind, format=None):
+        if kind not in EXPORTS:
+            raise Http404
+
+        serializer = ExportQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        params = serializer.validated_data
+        start_date = params.get('start_date')
+        end_date = params.get('end_date')
+        response = StreamingHttpResponse(
+            iter_csv_rows(kind, start_date, end_date, params.get('status')),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{export_filename(kind, start_date, end_date)}"'
+        return response
\ No newline at end of file
@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class GalleryConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.gallery'
\ No newline at end of file
+    name = 'apps.gallery'
+    
+    def ready(self):
+        import apps.gallery.signals
\ No newline at end of file
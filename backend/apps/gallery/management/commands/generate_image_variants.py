@@ -0,0 +1,46 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+from utils.media import IMAGE_VARIANT_FIELDS, image_variants_stale, refresh_image_variants
+
+
+class Command(BaseCommand):
+    help = (
+        'Build the responsive image variants (srcset) for services, staff and gallery images '
+        'that have none or were saved without signals, e.g. by bulk imports'
+    )
+    
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', action='append', choices=sorted(IMAGE_VARIANT_FIELDS),
+            help='Only this model (repeatable); defaults to all of them'
+        )
+        parser.add_argument('--force', action='store_true', help='Rebuild variants that are up to date')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many objects would be processed')
+    
+    def handle(self, *args, **options):
+        labels = options['model'] or list(IMAGE_VARIANT_FIELDS)
+        
+        for label in labels:
+            model = apps.get_model(label)
+            field_name = IMAGE_VARIANT_FIELDS[label]
+            objects = model._base_manager.only('pk', field_name, 'image_variants').order_by('pk')
+            ids = [
+                obj.pk for obj in objects.iterator()
+                if options['force'] or image_variants_stale(obj, field_name)
+            ]
+            
+            if options['dry_run']:
+                self.stdout.write(f"{label}: {len(ids)} objects would get new variants")
+                continue
+            
+            built = 0
+            failed = 0
+            for pk in ids:
+                try:
+                    if refresh_image_variants(label, pk, force=options['force']) is not None:
+                        built += 1
+                except Exception as exc:
+                    failed += 1
+                    self.stderr.write(f"{label} {pk}: {exc}")
+            
+            self.stdout.write(self.style.SUCCESS(f"{label}: built variants for {built} objects ({failed} failed)"))
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from apps.gallery.models import GalleryImage
+from apps.gallery.services import generate_thumbnail
+
+
+class Command(BaseCommand):
+    help = 'Generate missing gallery thumbnails, e.g. for images uploaded before thumbnails existed'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help='Regenerate thumbnails that already exist')
+        parser.add_argument('--dry-run', action='store_true', help='Only report how many images would be processed')
+    
+    def handle(self, *args, **options):
+        images = GalleryImage.objects.exclude(image='').order_by('id')
+        if not options['force']:
+            images = images.filter(Q(thumbnail='') | Q(thumbnail__isnull=True))
+        ids = list(images.values_list('id', flat=True))
+        
+        if options['dry_run']:
+            self.stdout.write(f"{len(ids)} gallery images would get a thumbnail")
+            return
+        
+        generated = 0
+        failed = 0
+        for image_id in ids:
+            try:
+                if generate_thumbnail(image_id, force=options['force']):
+                    generated += 1
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"Image {image_id}: {exc}")
+        
+        self.stdout.write(self.style.SUCCESS(f"Generated {generated} thumbnails ({failed} failed)"))
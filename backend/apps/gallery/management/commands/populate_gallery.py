@@ -6,6 +6,7 @@ from apps.services.models import Service
 from apps.staff.models import Staff
 from django.contrib.auth import get_user_model
 import json
+from utils.bulk import bulk_upsert
 
 User = get_user_model()
 
@@ -34,16 +35,10 @@ class Command(BaseCommand):
             {'name': 'Special Events', 'description': 'Special occasion styles', 'display_order': 7},
         ]
         
-        for cat_data in categories:
-            category, created = GalleryCategory.objects.get_or_create(
-                name=cat_data['name'],
-                defaults={
-                    'description': cat_data['description'],
-                    'display_order': cat_data['display_order']
-                }
-            )
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f"  {status}: {category.name}")
+        result = bulk_upsert(GalleryCategory, categories, unique_fields=['name'])
+        self.stdout.write(
+            f"  Categories: {result.created} created, {result.unchanged} already present"
+        )
 
     def create_sample_testimonials(self):
         """Create sample testimonials"""
@@ -100,21 +95,14 @@ class Command(BaseCommand):
             ]
             
             for i, testimonial_data in enumerate(testimonials):
-                testimonial, created = Testimonial.objects.get_or_create(
-                    client_name=testimonial_data['client_name'],
-                    content=testimonial_data['content'][:100],  # Use first 100 chars for uniqueness check
-                    defaults={
-                        'content': testimonial_data['content'],
-                        'rating': testimonial_data['rating'],
-                        'service': testimonial_data['service'],
-                        'staff': testimonial_data['staff'],
-                        'is_featured': testimonial_data['is_featured'],
-                        'is_approved': testimonial_data['is_approved'],
-                        'display_order': i + 1
-                    }
-                )
-                status = 'Created' if created else 'Exists'
-                self.stdout.write(f"  {status}: Testimonial from {testimonial.client_name}")
+                testimonial_data['display_order'] = i + 1
+            
+            # Sample testimonials are identified by client name and stylist and
+            # only ever created, so edits made in the admin are kept
+            result = bulk_upsert(Testimonial, testimonials, unique_fields=['client_name', 'staff'])
+            self.stdout.write(
+                f"  Testimonials: {result.created} created, {result.unchanged} already present"
+            )
                 
         except Staff.DoesNotExist:
             self.stdout.write(self.style.WARNING('Virginia staff profile not found. Run populate_staff first.'))
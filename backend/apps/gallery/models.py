@@ -1,4 +1,4 @@
-from django.db import models
+from django.db import models, transaction
 from django.core.validators import MinValueValidator, MaxValueValidator
 
 
@@ -33,6 +33,8 @@ class GalleryImage(models.Model):
     description = models.TextField(blank=True)
     image = models.ImageField(upload_to='gallery/')
     thumbnail = models.ImageField(upload_to='gallery/thumbnails/', null=True, blank=True)
+    # Responsive image URLs by width, see utils.media.build_image_variants
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     category = models.ForeignKey(
         GalleryCategory, 
         on_delete=models.SET_NULL,
@@ -93,6 +95,13 @@ class GalleryImage(models.Model):
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored image so save() can tell when it is replaced
+        instance._loaded_image = instance.__dict__.get('image')
+        return instance
+    
     def save(self, *args, **kwargs):
         # Set is_before_after based on image_type
         if self.image_type == 'before_after':
@@ -100,7 +109,19 @@ class GalleryImage(models.Model):
         else:
             self.is_before_after = False
         
+        # A new image needs a new thumbnail; apps.gallery.signals queues it
+        loaded_image = getattr(self, '_loaded_image', None)
+        if self.pk and loaded_image is not None and self.image.name != str(loaded_image):
+            if self.thumbnail:
+                # Nothing refers to the old thumbnail once the change is committed
+                name, storage = self.thumbnail.name, self.thumbnail.storage
+                transaction.on_commit(lambda: storage.delete(name))
+            self.thumbnail = None
+            if kwargs.get('update_fields') is not None:
+                kwargs['update_fields'] = {*kwargs['update_fields'], 'thumbnail'}
+        
         super().save(*args, **kwargs)
+        self._loaded_image = self.image.name
     
     def increment_views(self):
         """Increment view count."""
@@ -3,6 +3,7 @@ from .models import GalleryCategory, GalleryImage, GalleryVideo, Testimonial
 from apps.services.serializers import ServiceSerializer
 from apps.staff.serializers import StaffListSerializer
 from apps.users.serializers import UserSerializer
+from utils.media import srcset
 
 
 class GalleryCategorySerializer(serializers.ModelSerializer):
@@ -51,11 +52,12 @@ class GalleryImageSerializer(serializers.ModelSerializer):
         source='get_tags_list',
         read_only=True
     )
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = GalleryImage
         fields = [
-            'id', 'title', 'description', 'image', 'thumbnail',
+            'id', 'title', 'description', 'image', 'thumbnail', 'srcset',
             'category', 'category_id', 'image_type', 'is_before_after',
             'before_image', 'after_image', 'transformation_description',
             'tags', 'tags_list', 'service', 'service_id', 'staff', 'staff_id',
@@ -68,17 +70,29 @@ class GalleryImageSerializer(serializers.ModelSerializer):
     
     def get_tags_list(self, obj):
         return [tag.strip() for tag in obj.tags.split(',') if tag.strip()] if obj.tags else []
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
 
 
 class GalleryImageListSerializer(serializers.ModelSerializer):
     category = serializers.StringRelatedField()
+    thumbnail = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = GalleryImage
         fields = [
-            'id', 'title', 'description', 'image', 'thumbnail',
+            'id', 'title', 'description', 'image', 'thumbnail', 'srcset',
             'category', 'image_type', 'is_featured', 'views', 'likes'
         ]
+    
+    def get_thumbnail(self, obj):
+        # The original stands in until the background thumbnail render is done
+        return self.fields['image'].to_representation(obj.thumbnail or obj.image)
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
 
 
 class GalleryVideoSerializer(serializers.ModelSerializer):
@@ -0,0 +1,33 @@
+import logging
+from utils.media import save_thumbnail
+from .models import GalleryImage
+
+logger = logging.getLogger(__name__)
+
+
+def generate_thumbnail(image_id, force=False):
+    """
+    Render and store the WebP thumbnail for a gallery image.
+    
+    Runs as a background task after upload. The thumbnail is only attached
+    if the image wasn't replaced while it was rendered, and the one it
+    replaces (with force) is deleted. Returns the stored thumbnail name, or
+    None if there was nothing to do.
+    """
+    image = GalleryImage.objects.filter(pk=image_id).only('id', 'image', 'thumbnail').first()
+    if image is None or not image.image or (image.thumbnail and not force):
+        return None
+    
+    source_name = image.image.name
+    previous_name = image.thumbnail.name
+    thumbnail_name = save_thumbnail(image.image, image.thumbnail)
+    # update() rather than save(): no signals, no updated_at bump for a derived file
+    updated = GalleryImage.objects.filter(pk=image_id, image=source_name).update(thumbnail=thumbnail_name)
+    if not updated:
+        image.thumbnail.storage.delete(thumbnail_name)
+        logger.info("Gallery image %s changed while its thumbnail was rendered", image_id)
+        return None
+    
+    if previous_name and previous_name != thumbnail_name:
+        image.thumbnail.storage.delete(previous_name)
+    return thumbnail_name
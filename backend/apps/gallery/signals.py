@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from utils.media import queue_image_variants
+from utils.tasks import enqueue
+from .models import GalleryImage
+from .services import generate_thumbnail
+
+
+@receiver(post_save, sender=GalleryImage)
+def queue_thumbnail(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Generate the thumbnail in the background once a new or replaced image is committed."""
+    if raw or (update_fields is not None and 'image' not in update_fields):
+        return
+    
+    if instance.image and not instance.thumbnail:
+        image_id = instance.pk
+        transaction.on_commit(lambda: enqueue(generate_thumbnail, image_id))
+
+
+@receiver(post_save, sender=GalleryImage)
+def queue_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Rebuild the image's srcset in the background once a new image is committed."""
+    if not raw:
+        queue_image_variants(instance, update_fields)
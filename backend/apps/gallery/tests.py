@@ -0,0 +1,71 @@
+import os
+import shutil
+import tempfile
+from io import BytesIO
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from PIL import Image
+from .models import GalleryImage
+from .services import generate_thumbnail
+
+
+def image_file(name, color):
+    output = BytesIO()
+    Image.new('RGB', (800, 600), color).save(output, format='PNG')
+    return ContentFile(output.getvalue(), name=name)
+
+
+@override_settings(
+    MEDIA_BACKEND='local',
+    DEFAULT_FILE_STORAGE='django.core.files.storage.FileSystemStorage',
+    BACKGROUND_TASKS_EAGER=True,
+)
+class GalleryThumbnailTests(TestCase):
+    """Each image keeps exactly one thumbnail file, for its current image."""
+    
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp(prefix='salon-gallery-tests-')
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media_root = self.settings(MEDIA_ROOT=self.media_root)
+        media_root.enable()
+        self.addCleanup(media_root.disable)
+    
+    def thumbnails(self):
+        return sorted(os.listdir(os.path.join(self.media_root, 'gallery', 'thumbnails')))
+    
+    def test_replacing_the_image_deletes_the_old_thumbnail(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = GalleryImage.objects.create(title='Braids', image=image_file('a.png', 'red'))
+        image.refresh_from_db()
+        self.assertEqual(image.thumbnail.name, 'gallery/thumbnails/a.webp')
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            image.image = image_file('b.png', 'blue')
+            image.save()
+        
+        image.refresh_from_db()
+        self.assertEqual(image.thumbnail.name, 'gallery/thumbnails/b.webp')
+        self.assertEqual(self.thumbnails(), ['b.webp'])
+    
+    def test_replacing_only_the_image_field(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = GalleryImage.objects.create(title='Twists', image=image_file('c.png', 'red'))
+        image.refresh_from_db()
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            image.image = image_file('d.png', 'blue')
+            image.save(update_fields=['image'])
+        
+        image.refresh_from_db()
+        self.assertEqual(image.thumbnail.name, 'gallery/thumbnails/d.webp')
+        self.assertEqual(self.thumbnails(), ['d.webp'])
+    
+    def test_forced_regeneration_deletes_the_previous_thumbnail(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            image = GalleryImage.objects.create(title='Locs', image=image_file('e.png', 'red'))
+        image.refresh_from_db()
+        previous = image.thumbnail.name
+        
+        new_name = generate_thumbnail(image.pk, force=True)
+        self.assertNotEqual(new_name, previous)
+        self.assertEqual(self.thumbnails(), [os.path.basename(new_name)])
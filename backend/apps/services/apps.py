@@ -1,6 +1,23 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class ServicesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.services'
\ No newline at end of file
+    name = 'apps.services'
+    
+    def ready(self):
+        import apps.services.signals
+        
+        if settings.MEDIA_BACKEND == 'cloudinary':
+            # CloudinaryField builds URLs from the SDK's global config, which
+            # used to be set while settings loaded
+            import cloudinary
+            
+            credentials = settings.CLOUDINARY_STORAGE
+            cloudinary.config(
+                cloud_name=credentials['CLOUD_NAME'],
+                api_key=credentials['API_KEY'],
+                api_secret=credentials['API_SECRET'],
+                secure=True
+            )
@@ -0,0 +1,9 @@
+from utils.async_views import async_api_view, json_response
+from .catalog import categories_with_services_queryset, serialize_categories_with_services
+
+
+@async_api_view()
+async def categories_with_services(request):
+    """Async version of ServiceViewSet.categories_with_services, mounted in ASGI mode."""
+    categories = [category async for category in categories_with_services_queryset()]
+    return json_response(serialize_categories_with_services(categories))
@@ -0,0 +1,19 @@
+from django.db.models import Prefetch
+from .models import ServiceCategory, Service
+from .serializers import ServiceCategorySerializer, ServiceListSerializer
+
+
+def categories_with_services_queryset():
+    """Active categories with their active services prefetched in one extra query."""
+    return ServiceCategory.objects.filter(is_active=True).prefetch_related(
+        Prefetch('services', queryset=Service.objects.filter(is_active=True))
+    ).order_by('display_order')
+
+
+def serialize_categories_with_services(categories):
+    data = []
+    for category in categories:
+        category_data = ServiceCategorySerializer(category).data
+        category_data['services'] = ServiceListSerializer(category.services.all(), many=True).data
+        data.append(category_data)
+    return data
@@ -5,6 +5,7 @@ from apps.services.models import ServiceCategory, Service
 from django.utils.text import slugify
 from datetime import timedelta
 import re
+from utils.bulk import bulk_upsert
 
 
 class Command(BaseCommand):
@@ -14,8 +15,8 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS('Starting to populate services...'))
         
         with transaction.atomic():
-            self.create_service_categories()
-            self.create_services()
+            categories = self.create_service_categories()
+            self.create_services(categories)
         
         self.stdout.write(self.style.SUCCESS('Successfully populated all services!'))
 
@@ -132,21 +133,16 @@ class Command(BaseCommand):
             },
         ]
         
-        categories = {}
-        for cat_data in categories_data:
-            category, created = ServiceCategory.objects.get_or_create(
-                name=cat_data['name'],
-                defaults={
-                    'description': cat_data['description'],
-                    'icon': cat_data['icon'],
-                    'display_order': cat_data['display_order']
-                }
-            )
-            categories[cat_data['name']] = category
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f"  {status}: {category.name}")
+        result = bulk_upsert(
+            ServiceCategory,
+            categories_data,
+            unique_fields=['name'],
+        )
+        self.stdout.write(
+            f"  Categories: {result.created} created, {result.unchanged} already present"
+        )
         
-        return categories
+        return result.pks
 
     def parse_duration(self, duration_str):
         """Parse duration string like '2h 40m' or '4 hours' into minutes"""
@@ -194,12 +190,9 @@ class Command(BaseCommand):
         
         return hours * 60 + minutes
 
-    def create_services(self):
+    def create_services(self, categories):
         """Create all services with their details"""
         
-        # Get categories
-        categories = {cat.name: cat for cat in ServiceCategory.objects.all()}
-        
         services_data = [
             # 1. SENEGAL & ISLAND TWISTS
             {
@@ -530,6 +523,7 @@ class Command(BaseCommand):
         # Continue adding all services from your comprehensive list...
         # For brevity, I'll show the pattern. You should add ALL services from your list.
         
+        rows = []
         display_order = 1
         for service_data in services_data:
             category = categories.get(service_data['category'])
@@ -537,36 +531,24 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.WARNING(f"Category not found: {service_data['category']}"))
                 continue
             
-            # Generate slug
-            slug = slugify(service_data['name'])
-            
-            # Parse duration
-            duration_minutes = self.parse_duration(service_data.get('duration', '1 hour'))
-            
-            service, created = Service.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    'category': category,
-                    'name': service_data['name'],
-                    'description': service_data['description'],
-                    'duration': duration_minutes,
-                    'price': service_data['price'],
-                    'display_order': display_order,
-                    'is_popular': service_data.get('is_popular', False)
-                }
-            )
-            
-            if not created:
-                # Update existing service
-                service.category = category
-                service.name = service_data['name']
-                service.description = service_data['description']
-                service.duration = duration_minutes
-                service.price = service_data['price']
-                service.display_order = display_order
-                service.is_popular = service_data.get('is_popular', False)
-                service.save()
-            
-            status = 'Created' if created else 'Updated'
-            self.stdout.write(f"  {status}: {service.name} (${service.price})")
-            display_order += 1
\ No newline at end of file
+            rows.append({
+                'slug': slugify(service_data['name']),
+                'category': category,
+                'name': service_data['name'],
+                'description': service_data['description'],
+                'duration': self.parse_duration(service_data.get('duration', '1 hour')),
+                'price': service_data['price'],
+                'display_order': display_order,
+                'is_popular': service_data.get('is_popular', False),
+            })
+            display_order += 1
+        
+        result = bulk_upsert(
+            Service,
+            rows,
+            unique_fields=['slug'],
+            update_fields=['category', 'name', 'description', 'duration', 'price', 'display_order', 'is_popular'],
+        )
+        self.stdout.write(
+            f"  Services: {result.created} created, {result.updated} updated, {result.unchanged} unchanged"
+        )
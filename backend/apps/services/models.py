@@ -43,6 +43,8 @@ class Service(models.Model):
         validators=[MinValueValidator(0)]
     )
     image = CloudinaryField('image', folder='services/', blank=True, null=True)
+    # Responsive image URLs by width, see utils.media.build_image_variants
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     is_popular = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     display_order = models.IntegerField(default=0)
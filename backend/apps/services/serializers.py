@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from utils.media import srcset
 from .models import ServiceCategory, Service, ServiceImage
 
 
@@ -26,25 +27,33 @@ class ServiceSerializer(serializers.ModelSerializer):
     images = ServiceImageSerializer(many=True, read_only=True)
     final_price = serializers.DecimalField(max_digits=8, decimal_places=2, read_only=True)
     discount_percentage = serializers.FloatField(read_only=True)
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Service
         fields = [
             'id', 'category', 'category_id', 'name', 'slug', 'description',
             'duration', 'price', 'discounted_price', 'final_price',
-            'discount_percentage', 'image', 'is_popular', 'is_active',
+            'discount_percentage', 'image', 'srcset', 'is_popular', 'is_active',
             'display_order', 'images', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
 
 
 class ServiceListSerializer(serializers.ModelSerializer):
     category = serializers.StringRelatedField()
     final_price = serializers.DecimalField(max_digits=8, decimal_places=2, read_only=True)
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Service
         fields = [
             'id', 'category', 'name', 'slug', 'description',
-            'duration', 'final_price', 'image', 'is_popular'
-        ]
\ No newline at end of file
+            'duration', 'final_price', 'image', 'srcset', 'is_popular'
+        ]
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
\ No newline at end of file
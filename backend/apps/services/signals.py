@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from utils.media import queue_image_variants
+from .models import Service
+
+
+@receiver(post_save, sender=Service)
+def queue_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Rebuild the image's srcset in the background once a new image is committed."""
+    if not raw:
+        queue_image_variants(instance, update_fields)
@@ -10,6 +10,7 @@ from .serializers import (
     ServiceImageSerializer,
 )
 from .filters import ServiceFilter
+from .catalog import categories_with_services_queryset, serialize_categories_with_services
 
 
 class ServiceCategoryViewSet(viewsets.ModelViewSet):
@@ -65,18 +66,7 @@ class ServiceViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def categories_with_services(self, request):
         """Get all categories with their active services."""
-        categories = ServiceCategory.objects.filter(is_active=True).prefetch_related(
-            'services'
-        ).order_by('display_order')
-        
-        data = []
-        for category in categories:
-            services = category.services.filter(is_active=True)
-            category_data = ServiceCategorySerializer(category).data
-            category_data['services'] = ServiceListSerializer(services, many=True).data
-            data.append(category_data)
-        
-        return Response(data)
+        return Response(serialize_categories_with_services(categories_with_services_queryset()))
     
     @action(detail=True, methods=['get'])
     def related(self, request, slug=None):
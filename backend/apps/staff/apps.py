@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class StaffConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'apps.staff'
\ No newline at end of file
+    name = 'apps.staff'
+    
+    def ready(self):
+        import apps.staff.signals
\ No newline at end of file
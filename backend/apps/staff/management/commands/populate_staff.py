@@ -6,6 +6,7 @@ from apps.services.models import ServiceCategory, Service
 from django.contrib.auth import get_user_model
 import json
 from datetime import date, time, timedelta
+from utils.bulk import bulk_upsert
 
 User = get_user_model()
 
@@ -38,15 +39,15 @@ class Command(BaseCommand):
                 }
             )
             
-            # Update name if user already exists
-            if not created:
+            # Update name if user already exists; skip the write when nothing changed
+            if not created and (caroline_user.first_name, caroline_user.last_name) != ('Caroline', 'Njeri'):
                 caroline_user.first_name = 'Caroline'
                 caroline_user.last_name = 'Njeri'
-                caroline_user.save()
+                caroline_user.save(update_fields=['first_name', 'last_name'])
             
             if created:
                 caroline_user.set_password('Caroline123!')  # Set a secure password
-                caroline_user.save()
+                caroline_user.save(update_fields=['password'])
             
             # Create staff profile
             staff, staff_created = Staff.objects.get_or_create(
@@ -74,9 +75,10 @@ class Command(BaseCommand):
             )
             
             # Update bio if staff already exists
-            if not staff_created:
-                staff.bio = 'Caroline "Virginia" Njeri is a highly skilled hair braider with years of experience specializing in protective styles, braids, locs, and extensions. Known professionally as Virginia Hair Braider, she is passionate about creating beautiful, healthy hairstyles that make her clients feel confident and beautiful.'
-                staff.save()
+            bio = 'Caroline "Virginia" Njeri is a highly skilled hair braider with years of experience specializing in protective styles, braids, locs, and extensions. Known professionally as Virginia Hair Braider, she is passionate about creating beautiful, healthy hairstyles that make her clients feel confident and beautiful.'
+            if not staff_created and staff.bio != bio:
+                staff.bio = bio
+                staff.save(update_fields=['bio', 'updated_at'])
             
             # Add specializations (all service categories)
             all_categories = ServiceCategory.objects.all()
@@ -96,34 +98,33 @@ class Command(BaseCommand):
 
     def create_staff_services(self, staff):
         """Link staff to all available services"""
-        all_services = Service.objects.all()
+        service_ids = Service.objects.values_list('id', flat=True)
         
-        for service in all_services:
-            staff_service, created = StaffService.objects.get_or_create(
-                staff=staff,
-                service=service,
-                defaults={
+        # Existing links are left as they are; only missing ones are inserted
+        result = bulk_upsert(
+            StaffService,
+            [
+                {
+                    'staff': staff,
+                    'service': service_id,
                     'is_available': True,
                     'notes': 'Available for this service'
                 }
-            )
+                for service_id in service_ids
+            ],
+            unique_fields=['staff', 'service'],
+        )
         
-        self.stdout.write(f"  Linked {all_services.count()} services to Caroline")
+        self.stdout.write(f"  Linked {len(result.pks)} services to Caroline ({result.created} new)")
 
     def create_sample_availability(self, staff):
         """Create sample availability for the next 30 days"""
         today = date.today()
         
-        # Clear existing availability for the next 30 days
-        StaffAvailability.objects.filter(
-            staff=staff,
-            date__gte=today,
-            date__lte=today + timedelta(days=30)
-        ).delete()
-        
         # Create availability based on working hours
         working_hours = json.loads(staff.working_hours)
         
+        rows = []
         appointments_created = 0
         for day_offset in range(30):
             current_date = today + timedelta(days=day_offset)
@@ -133,37 +134,54 @@ class Command(BaseCommand):
                 day_schedule = working_hours[day_name]
                 
                 if day_schedule['open'] and day_schedule['close']:
-                    # Create morning slot (9 AM - 12 PM)
-                    StaffAvailability.objects.create(
-                        staff=staff,
-                        date=current_date,
-                        start_time=time(9, 0),   # 9:00 AM
-                        end_time=time(12, 0),    # 12:00 PM
-                        is_available=True,
-                        reason='Morning appointments'
-                    )
+                    # Morning slot (9 AM - 12 PM)
+                    rows.append({
+                        'staff': staff,
+                        'date': current_date,
+                        'start_time': time(9, 0),   # 9:00 AM
+                        'end_time': time(12, 0),    # 12:00 PM
+                        'is_available': True,
+                        'reason': 'Morning appointments'
+                    })
                     
-                    # Create afternoon slot (1 PM - 5 PM)
-                    StaffAvailability.objects.create(
-                        staff=staff,
-                        date=current_date,
-                        start_time=time(13, 0),  # 1:00 PM
-                        end_time=time(17, 0),    # 5:00 PM
-                        is_available=True,
-                        reason='Afternoon appointments'
-                    )
+                    # Afternoon slot (1 PM - 5 PM)
+                    rows.append({
+                        'staff': staff,
+                        'date': current_date,
+                        'start_time': time(13, 0),  # 1:00 PM
+                        'end_time': time(17, 0),    # 5:00 PM
+                        'is_available': True,
+                        'reason': 'Afternoon appointments'
+                    })
                     
-                    # Create evening slot if open until 7 PM (5 PM - 7 PM)
+                    # Evening slot if open until 7 PM (5 PM - 7 PM)
                     if day_schedule['close'] == '19:00':
-                        StaffAvailability.objects.create(
-                            staff=staff,
-                            date=current_date,
-                            start_time=time(17, 0),  # 5:00 PM
-                            end_time=time(19, 0),    # 7:00 PM
-                            is_available=True,
-                            reason='Evening appointments'
-                        )
+                        rows.append({
+                            'staff': staff,
+                            'date': current_date,
+                            'start_time': time(17, 0),  # 5:00 PM
+                            'end_time': time(19, 0),    # 7:00 PM
+                            'is_available': True,
+                            'reason': 'Evening appointments'
+                        })
                     
                     appointments_created += 1
         
-        self.stdout.write(f"  Created availability for {appointments_created} days")
\ No newline at end of file
+        result = bulk_upsert(
+            StaffAvailability,
+            rows,
+            unique_fields=['staff', 'date', 'start_time', 'end_time'],
+            update_fields=['is_available', 'reason'],
+        )
+        
+        # Clear availability in the next 30 days that the schedule no longer produces
+        StaffAvailability.objects.filter(
+            staff=staff,
+            date__gte=today,
+            date__lte=today + timedelta(days=30)
+        ).exclude(pk__in=result.pks.values()).delete()
+        
+        self.stdout.write(
+            f"  Availability for {appointments_created} days: "
+            f"{result.created} created, {result.updated} updated, {result.unchanged} unchanged"
+        )
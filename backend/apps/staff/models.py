@@ -19,6 +19,8 @@ class Staff(models.Model):
     )
     experience_years = models.PositiveIntegerField(default=0)
     photo = models.ImageField(upload_to='staff/')
+    # Responsive photo URLs by width, see utils.media.build_image_variants
+    image_variants = models.JSONField(default=dict, blank=True, editable=False)
     phone = models.CharField(max_length=20, blank=True)
     email = models.EmailField(blank=True)
     is_active = models.BooleanField(default=True)
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import Staff, StaffService, StaffAvailability, StaffPreference
 from apps.services.serializers import ServiceSerializer
+from utils.media import srcset
 
 User = get_user_model()
 
@@ -30,12 +31,13 @@ class StaffSerializer(serializers.ModelSerializer):
         queryset=Staff.objects.none(),
         required=False
     )
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Staff
         fields = [
             'id', 'user', 'full_name', 'title', 'bio', 'specialization',
-            'experience_years', 'photo', 'phone', 'is_active', 'display_order',
+            'experience_years', 'photo', 'srcset', 'phone', 'is_active', 'display_order',
             'instagram', 'facebook', 'twitter', 'working_hours',
             'created_at', 'updated_at'
         ]
@@ -44,6 +46,9 @@ class StaffSerializer(serializers.ModelSerializer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.fields['specialization'].queryset = Staff.specialization.field.related_model.objects.all()
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
 
 
 class StaffListSerializer(serializers.ModelSerializer):
@@ -54,13 +59,17 @@ class StaffListSerializer(serializers.ModelSerializer):
         slug_field='name',
         read_only=True
     )
+    srcset = serializers.SerializerMethodField()
     
     class Meta:
         model = Staff
         fields = [
             'id', 'user', 'full_name', 'title', 'bio', 'specialization',
-            'experience_years', 'photo', 'is_active'
+            'experience_years', 'photo', 'srcset', 'is_active'
         ]
+    
+    def get_srcset(self, obj):
+        return srcset(obj.image_variants, self.context.get('request'))
 
 
 class StaffServiceSerializer(serializers.ModelSerializer):
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from utils.media import queue_image_variants
+from .models import Staff
+
+
+@receiver(post_save, sender=Staff)
+def queue_photo_variants(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Rebuild the photo's srcset in the background once a new photo is committed."""
+    if not raw:
+        queue_image_variants(instance, update_fields)
@@ -169,7 +169,7 @@ class StaffPreferenceViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     
     def get_queryset(self):
-        return StaffPreference.objects.filter(user=self.request.user)
+        return StaffPreference.objects.filter(user_id=self.request.user.pk)
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -1,9 +1,27 @@
-from django.contrib import admin
+import io
+from django import forms
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
 from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.token_blacklist.admin import BlacklistedTokenAdmin, OutstandingTokenAdmin
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from utils.pagination import EstimatedCountPaginator
+from .importers import import_clients, read_client_rows
 from .models import User, UserProfile
 
 
+class ClientImportForm(forms.Form):
+    csv_file = forms.FileField(
+        label=_('CSV file'),
+        help_text=_('Columns: email (required), first_name, last_name, phone, '
+                    'date_of_birth, gender, address, allergies, notes')
+    )
+    dry_run = forms.BooleanField(required=False, label=_('Validate only'))
+
+
 class UserProfileInline(admin.StackedInline):
     model = UserProfile
     can_delete = False
@@ -32,6 +50,42 @@ class UserAdmin(BaseUserAdmin):
     ordering = ('email',)
     filter_horizontal = ('groups', 'user_permissions',)
     inlines = [UserProfileInline]
+    
+    def get_urls(self):
+        urls = [
+            path(
+                'import-clients/',
+                self.admin_site.admin_view(self.import_clients_view),
+                name='users_user_import_clients'
+            ),
+        ]
+        return urls + super().get_urls()
+    
+    def import_clients_view(self, request):
+        if not self.has_add_permission(request):
+            return redirect('admin:users_user_changelist')
+        
+        form = ClientImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            file = io.TextIOWrapper(form.cleaned_data['csv_file'].file, encoding='utf-8-sig', newline='')
+            try:
+                stats = import_clients(read_client_rows(file), dry_run=form.cleaned_data['dry_run'])
+            except (ValueError, UnicodeDecodeError) as e:
+                form.add_error('csv_file', str(e))
+            else:
+                prefix = 'Dry run: ' if form.cleaned_data['dry_run'] else ''
+                self.message_user(request, f"{prefix}{stats.summary()}", messages.SUCCESS)
+                for line, message in stats.errors:
+                    self.message_user(request, f"Line {line}: {message}", messages.WARNING)
+                return redirect('admin:users_user_changelist')
+        
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': _('Import clients'),
+            'form': form,
+        }
+        return TemplateResponse(request, 'admin/users/user/import_clients.html', context)
 
 
 @admin.register(UserProfile)
@@ -39,4 +93,24 @@ class UserProfileAdmin(admin.ModelAdmin):
     list_display = ('user', 'gender')
     list_filter = ('gender',)
     search_fields = ('user__email', 'user__first_name', 'user__last_name')
-    raw_id_fields = ('user',)
\ No newline at end of file
+    raw_id_fields = ('user',)
+
+
+# The token tables grow with every login and refresh; avoid exact counts and
+# the default ordering by user, which needs a join and a sort of every row.
+admin.site.unregister(OutstandingToken)
+admin.site.unregister(BlacklistedToken)
+
+
+@admin.register(OutstandingToken)
+class PaginatedOutstandingTokenAdmin(OutstandingTokenAdmin):
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(BlacklistedToken)
+class PaginatedBlacklistedTokenAdmin(BlacklistedTokenAdmin):
+    ordering = ('-id',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
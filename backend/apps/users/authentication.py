@@ -0,0 +1,151 @@
+import time
+from collections import namedtuple
+from functools import partial
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject, empty
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+User = get_user_model()
+
+# User fields copied into tokens so most requests never need the User row
+USER_CLAIMS = ('email', 'is_staff', 'is_staff_member')
+
+USER_STATE_CACHE_KEY = 'auth:user-state:{}'
+
+UserState = namedtuple('UserState', USER_CLAIMS + ('is_active', 'password_hash', 'cached_at'))
+
+
+def get_user_state(user_id, refresh=False):
+    """
+    Return the fields needed to validate a token, cached for a short TTL.
+    
+    The cache must be shared by all workers (see CACHES): the post_save
+    signal invalidates it from whichever process changed the user, so
+    deactivation, role changes and password changes apply everywhere at
+    once. refresh=True skips the cached copy.
+    """
+    key = USER_STATE_CACHE_KEY.format(user_id)
+    state = None if refresh else cache.get(key)
+    if state is None:
+        cached_at = int(time.time())
+        row = User.objects.filter(pk=user_id).values_list(
+            *USER_CLAIMS, 'is_active', 'password'
+        ).first()
+        # Cache missing users too, so a deleted account cannot force a query per request
+        state = UserState(*row[:-1], get_md5_hash_password(row[-1]), cached_at) if row else False
+        cache.set(key, state, settings.AUTH_USER_STATE_CACHE_TIMEOUT)
+    return state or None
+
+
+def invalidate_user_state(user_id):
+    cache.delete(USER_STATE_CACHE_KEY.format(user_id))
+
+
+def _token_matches(token, state, claims):
+    return token.get(api_settings.REVOKE_TOKEN_CLAIM) == state.password_hash and all(
+        token.get(claim) == getattr(state, claim) for claim in claims
+    )
+
+
+def validate_token_state(token, claims=()):
+    """
+    Check a token against the user's current state.
+    
+    The revoke claim must match the password, and each of `claims` the
+    user's current value. A token issued after the state was cached may
+    reflect a change the cache hasn't seen yet, so it is checked against
+    the database before being rejected.
+    """
+    user_id = token[api_settings.USER_ID_CLAIM]
+    state = get_user_state(user_id)
+    if (
+        state is not None
+        and not _token_matches(token, state, claims)
+        and token.get('iat', 0) >= state.cached_at
+    ):
+        state = get_user_state(user_id, refresh=True)
+    
+    if state is None:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+    if not state.is_active:
+        raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+    if token.get(api_settings.REVOKE_TOKEN_CLAIM) != state.password_hash:
+        raise AuthenticationFailed(
+            _("The user's password has been changed."), code="password_changed"
+        )
+    # Tokens issued before a role/email change must be refreshed
+    if any(token.get(claim) != getattr(state, claim) for claim in claims):
+        raise AuthenticationFailed(
+            _("User details have changed, please refresh your token."),
+            code="token_stale"
+        )
+    return state
+
+
+def load_user(user_id):
+    try:
+        user = User.objects.get(pk=user_id)
+    except User.DoesNotExist:
+        raise AuthenticationFailed(_("User not found"), code="user_not_found")
+    
+    if not user.is_active:
+        raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+    return user
+
+
+class LazyTokenUser(SimpleLazyObject):
+    """
+    request.user for token-authenticated requests.
+    
+    id, email and the role flags are answered from the token claims; any
+    other attribute (or passing the object to the ORM) loads the full User
+    row once, on first use.
+    """
+    
+    def __init__(self, token):
+        user_id = token[api_settings.USER_ID_CLAIM]
+        super().__init__(partial(load_user, user_id))
+        
+        claims = {
+            'id': user_id,
+            'pk': user_id,
+            'is_active': True,
+            'is_authenticated': True,
+            'is_anonymous': False,
+        }
+        for claim in USER_CLAIMS:
+            claims[claim] = token.get(claim)
+        self.__dict__['_claims'] = claims
+    
+    def __getattr__(self, name):
+        if self._wrapped is empty:
+            claims = self.__dict__.get('_claims', {})
+            if name in claims:
+                return claims[name]
+        return super().__getattr__(name)
+    
+    def __bool__(self):
+        # Permission classes test `request.user and ...`; don't load the user for that
+        return True
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that does not SELECT the user on every request.
+    
+    The token is validated against a short-lived copy of the user's state
+    in the shared cache, and request.user is a LazyTokenUser built from the token claims.
+    """
+    
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        
+        validate_token_state(validated_token, USER_CLAIMS)
+        return LazyTokenUser(validated_token)
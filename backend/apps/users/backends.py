@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from .hashers import hash_password, verify_password
+
+User = get_user_model()
+
+
+class HashPoolModelBackend(ModelBackend):
+    """ModelBackend that verifies passwords through the bounded hash pool."""
+    
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        
+        try:
+            user = User._default_manager.get_by_natural_key(username)
+        except User.DoesNotExist:
+            # Hash anyway so response time doesn't reveal whether the account exists
+            hash_password(password)
+            return None
+        
+        if verify_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
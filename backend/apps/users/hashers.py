@@ -0,0 +1,109 @@
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+
+# Hashers keep Django's algorithm names, so hashes stay readable by the stock
+# hashers; only the cost parameters come from settings. When a cost changes,
+# must_update() reports stored hashes as stale and they are rehashed on login,
+# which also revokes the user's tokens from other sessions.
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """Requires hashlib.scrypt, i.e. Python built against OpenSSL 1.1+."""
+    
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+    
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+    
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Requires argon2-cffi."""
+    
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+    
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+    
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+_hash_executor = None
+
+
+def get_hash_executor():
+    """
+    Return the shared password-hashing pool.
+    
+    hashlib releases the GIL while hashing, so a small pool bounds how many
+    hashes run at once without blocking other threads (or an event loop,
+    via asyncio.wrap_future) while they do.
+    """
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix='salon-hash'
+        )
+    return _hash_executor
+
+
+def run_hashing(func, *args):
+    """Run a CPU-bound hashing call in the hash pool and wait for the result."""
+    return get_hash_executor().submit(func, *args).result()
+
+
+def hash_password(raw_password):
+    return run_hashing(make_password, raw_password)
+
+
+def password_needs_rehash(encoded):
+    """Same rule django.contrib.auth.hashers.check_password uses for its setter."""
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    preferred = get_hasher('default')
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def verify_password(user, raw_password, rehash=True):
+    """
+    Check a user's password in the hash pool.
+    
+    Hashes made with a legacy hasher or outdated cost are upgraded on success.
+    The save happens on the calling thread so it uses the request's connection.
+    """
+    encoded = user.password
+    valid = run_hashing(check_password, raw_password, encoded)
+    if valid and rehash and password_needs_rehash(encoded):
+        user.password = hash_password(raw_password)
+        user.save(update_fields=['password'])
+    return valid
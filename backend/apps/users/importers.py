@@ -0,0 +1,178 @@
+import csv
+import secrets
+import time
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX, UNUSABLE_PASSWORD_SUFFIX_LENGTH
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.utils.dateparse import parse_date
+from .models import User, UserProfile
+
+USER_FIELDS = ('first_name', 'last_name', 'phone')
+PROFILE_FIELDS = ('date_of_birth', 'gender', 'address', 'allergies', 'notes')
+GENDER_CHOICES = {choice for choice, _ in UserProfile._meta.get_field('gender').choices}
+
+# Column limits, checked per row: an over-long value would fail the whole chunk's insert
+MAX_LENGTHS = {
+    field.name: field.max_length
+    for model, names in ((User, ('email',) + USER_FIELDS), (UserProfile, PROFILE_FIELDS))
+    for field in (model._meta.get_field(name) for name in names)
+    if field.max_length
+}
+
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 50
+
+
+class ImportStats:
+    """Running totals for a client import."""
+    
+    def __init__(self):
+        self.processed = 0
+        self.created = 0
+        self.existing = 0
+        self.duplicates = 0
+        self.invalid = 0
+        self.errors = []
+        self.started = time.perf_counter()
+    
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.started
+    
+    @property
+    def rate(self):
+        return self.processed / self.elapsed if self.elapsed else 0
+    
+    def add_error(self, line, message):
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+    
+    def summary(self):
+        return (
+            f"{self.processed} rows: {self.created} created, {self.existing} already registered, "
+            f"{self.duplicates} duplicates, {self.invalid} invalid "
+            f"({self.rate:.0f} rows/s)"
+        )
+
+
+def read_client_rows(file):
+    """Yield (line number, row) from a CSV file with an 'email' column."""
+    reader = csv.DictReader(file)
+    if not reader.fieldnames or 'email' not in [name.strip().lower() for name in reader.fieldnames]:
+        raise ValueError("The CSV file must have an 'email' column")
+    
+    for row in reader:
+        yield reader.line_num, {
+            (key or '').strip().lower(): (value or '').strip() for key, value in row.items()
+        }
+
+
+def unusable_password():
+    """Same format as make_password(None), without a SystemRandom call per character."""
+    return UNUSABLE_PASSWORD_PREFIX + secrets.token_hex(UNUSABLE_PASSWORD_SUFFIX_LENGTH // 2)
+
+
+def _clean_row(row):
+    """Return (email, user fields, profile fields) or raise ValidationError."""
+    email = User.objects.normalize_email(row.get('email', ''))
+    validate_email(email)
+    
+    for field, max_length in MAX_LENGTHS.items():
+        value = email if field == 'email' else row.get(field, '')
+        if len(value) > max_length:
+            raise ValidationError(f"{field} is longer than {max_length} characters")
+    
+    user_fields = {field: row.get(field, '') for field in USER_FIELDS}
+    profile_fields = {
+        field: row.get(field, '') for field in PROFILE_FIELDS if field != 'date_of_birth'
+    }
+    
+    if row.get('date_of_birth'):
+        try:
+            date_of_birth = parse_date(row['date_of_birth'])
+        except ValueError:
+            date_of_birth = None
+        if date_of_birth is None:
+            raise ValidationError(f"Invalid date_of_birth '{row['date_of_birth']}', use YYYY-MM-DD")
+        profile_fields['date_of_birth'] = date_of_birth
+    
+    gender = profile_fields['gender'].lower()
+    if gender and gender not in GENDER_CHOICES:
+        raise ValidationError(f"Invalid gender '{profile_fields['gender']}'")
+    profile_fields['gender'] = gender
+    
+    return email, user_fields, profile_fields
+
+
+def _import_chunk(chunk, stats, dry_run, retry=True):
+    existing = set(
+        User.objects.filter(email__in=[email for email, _, _ in chunk]).values_list('email', flat=True)
+    )
+    new_clients = [item for item in chunk if item[0] not in existing]
+    
+    if dry_run:
+        stats.existing += len(chunk) - len(new_clients)
+        stats.created += len(new_clients)
+        return
+    
+    try:
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(email=email, password=unusable_password(), **user_fields)
+                for email, user_fields, _ in new_clients
+            ])
+            UserProfile.objects.bulk_create([
+                UserProfile(user=user, **profile_fields)
+                for user, (_, _, profile_fields) in zip(users, new_clients)
+            ])
+    except IntegrityError:
+        # Someone registered between the lookup and the insert; look up again
+        if retry:
+            return _import_chunk(chunk, stats, dry_run, retry=False)
+        raise
+    
+    stats.existing += len(chunk) - len(new_clients)
+    stats.created += len(users)
+
+
+def import_clients(rows, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, progress=None):
+    """
+    Create clients from (line number, row) pairs, as yielded by read_client_rows.
+    
+    Emails are normalized like UserManager.normalize_email. Each chunk is
+    checked against existing users with one IN query, and the new users and
+    their profiles are written with bulk_create. Imported users get an
+    unusable password and can set one through password reset.
+    """
+    stats = ImportStats()
+    seen = set()
+    chunk = []
+    
+    for line, row in rows:
+        stats.processed += 1
+        try:
+            email, user_fields, profile_fields = _clean_row(row)
+        except ValidationError as e:
+            stats.add_error(line, '; '.join(e.messages))
+            continue
+        
+        if email in seen:
+            stats.duplicates += 1
+            continue
+        seen.add(email)
+        chunk.append((email, user_fields, profile_fields))
+        
+        if len(chunk) >= chunk_size:
+            _import_chunk(chunk, stats, dry_run)
+            chunk = []
+            if progress:
+                progress(stats)
+    
+    if chunk:
+        _import_chunk(chunk, stats, dry_run)
+        if progress:
+            progress(stats)
+    
+    return stats
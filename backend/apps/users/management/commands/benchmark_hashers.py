@@ -0,0 +1,64 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, get_hashers
+from django.core.management.base import BaseCommand, CommandError
+
+PASSWORD = 'correct-horse-battery-staple'
+
+
+class Command(BaseCommand):
+    help = 'Measure password hashing cost as logins per second per core for each configured hasher'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Verifications per hasher')
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count() or 1,
+            help='Threads for the concurrent run (defaults to the CPU count)'
+        )
+        parser.add_argument('--hasher', action='append', help='Algorithm to benchmark (repeatable)')
+    
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        workers = options['workers']
+        if iterations < 1 or workers < 1:
+            raise CommandError('--iterations and --workers must be at least 1')
+        
+        hashers = get_hashers()
+        if options['hasher']:
+            hashers = [hasher for hasher in hashers if hasher.algorithm in options['hasher']]
+            if not hashers:
+                raise CommandError('No configured hasher matches --hasher')
+        
+        preferred = get_hasher('default').algorithm
+        self.stdout.write(f"Preferred hasher: {preferred} (PASSWORD_HASH_WORKERS={settings.PASSWORD_HASH_WORKERS})")
+        
+        for hasher in hashers:
+            try:
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+            except (ValueError, ImportError) as e:
+                self.stdout.write(self.style.WARNING(f"{hasher.algorithm}: skipped ({e})"))
+                continue
+            
+            start = time.perf_counter()
+            for _ in range(iterations):
+                hasher.verify(PASSWORD, encoded)
+            single = (time.perf_counter() - start) / iterations
+            
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                start = time.perf_counter()
+                list(executor.map(lambda _: hasher.verify(PASSWORD, encoded), range(iterations * workers)))
+                elapsed = time.perf_counter() - start
+            throughput = iterations * workers / elapsed
+            params = ', '.join(
+                f"{key}={value}" for key, value in hasher.safe_summary(encoded).items()
+                if str(key) not in ('algorithm', 'salt', 'hash')
+            )
+            
+            self.stdout.write(
+                f"{hasher.algorithm:<14} {single * 1000:8.1f} ms/verify  "
+                f"{1 / single:8.1f} logins/s/core  "
+                f"{throughput:8.1f} logins/s with {workers} threads  "
+                f"({params})"
+            )
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.users.importers import DEFAULT_CHUNK_SIZE, import_clients, read_client_rows
+
+
+class Command(BaseCommand):
+    help = 'Import clients from a CSV file (email, first_name, last_name, phone and profile columns)'
+    
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help='Path to the CSV file')
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument('--dry-run', action='store_true', help='Validate and count without writing')
+    
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1')
+        
+        def progress(stats):
+            self.stdout.write(f"  {stats.summary()}")
+        
+        try:
+            with open(options['csv_file'], newline='', encoding='utf-8-sig') as file:
+                stats = import_clients(
+                    read_client_rows(file),
+                    chunk_size=options['chunk_size'],
+                    dry_run=options['dry_run'],
+                    progress=progress
+                )
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
+        
+        for line, message in stats.errors:
+            self.stdout.write(self.style.WARNING(f"Line {line}: {message}"))
+        
+        prefix = 'Dry run: ' if options['dry_run'] else ''
+        self.stdout.write(self.style.SUCCESS(f"{prefix}{stats.summary()} in {stats.elapsed:.1f}s"))
@@ -1,572 +0,0 @@
-# apps/services/management/commands/populate_services.py
-from django.core.management.base import BaseCommand
-from django.db import transaction
-from apps.services.models import ServiceCategory, Service
-from django.utils.text import slugify
-from datetime import timedelta
-import re
-
-
-class Command(BaseCommand):
-    help = 'Populate the database with Virginia Hair Braider services'
-
-    def handle(self, *args, **options):
-        self.stdout.write(self.style.SUCCESS('Starting to populate services...'))
-        
-        with transaction.atomic():
-            self.create_service_categories()
-            self.create_services()
-        
-        self.stdout.write(self.style.SUCCESS('Successfully populated all services!'))
-
-    def create_service_categories(self):
-        """Create service categories"""
-        categories_data = [
-            {
-                'name': 'Senegal & Island Twists',
-                'description': 'Classic protective styles using twisted hair techniques',
-                'icon': 'fas fa-hands',
-                'display_order': 1
-            },
-            {
-                'name': 'Butterfly Locs',
-                'description': 'Bohemian-inspired faux locs with "butterfly" technique',
-                'icon': 'fas fa-butterfly',
-                'display_order': 2
-            },
-            {
-                'name': 'Boho Braids',
-                'description': 'Braids with added curly or wavy extensions for volume',
-                'icon': 'fas fa-crown',
-                'display_order': 3
-            },
-            {
-                'name': 'Bora Bora Braids',
-                'description': 'Intricate braided style with wrapped sections',
-                'icon': 'fas fa-water',
-                'display_order': 4
-            },
-            {
-                'name': 'Crochet Braids',
-                'description': 'Installing pre-made hair via crochet method',
-                'icon': 'fas fa-crop',
-                'display_order': 5
-            },
-            {
-                'name': 'Dreads/Locs & Sister Locs',
-                'description': 'Natural and synthetic loc maintenance and installation',
-                'icon': 'fas fa-spa',
-                'display_order': 6
-            },
-            {
-                'name': 'Faux Locs',
-                'description': 'Various faux loc styles from scratch and individual',
-                'icon': 'fas fa-layer-group',
-                'display_order': 7
-            },
-            {
-                'name': 'Fulani Braids & Boho',
-                'description': 'Traditional Fulani styles and Fulani-inspired boho',
-                'icon': 'fas fa-feather-alt',
-                'display_order': 8
-            },
-            {
-                'name': 'Invisible Twists',
-                'description': 'For women - using kinky twist hair technique',
-                'icon': 'fas fa-eye-slash',
-                'display_order': 9
-            },
-            {
-                'name': 'Knotless Braids',
-                'description': 'Modern technique reducing tension on scalp',
-                'icon': 'fas fa-infinity',
-                'display_order': 10
-            },
-            {
-                'name': 'Regular Box Braids',
-                'description': 'Classic square-part braiding style',
-                'icon': 'fas fa-square',
-                'display_order': 11
-            },
-            {
-                'name': 'Stitch Braids',
-                'description': 'French/Dutch braid variation with feeding technique',
-                'icon': 'fas fa-stitches',
-                'display_order': 12
-            },
-            {
-                'name': 'Men\'s Hairstyles',
-                'description': 'Braids, twists, and cornrows for men',
-                'icon': 'fas fa-male',
-                'display_order': 13
-            },
-            {
-                'name': 'Wigs & Weaves',
-                'description': 'Installation of wigs, weaves, and extensions',
-                'icon': 'fas fa-user-tie',
-                'display_order': 14
-            },
-            {
-                'name': 'Natural Hair Styling',
-                'description': 'For natural hair without extensions',
-                'icon': 'fas fa-leaf',
-                'display_order': 15
-            },
-            {
-                'name': 'New/Trending Styles',
-                'description': 'Popular contemporary styles',
-                'icon': 'fas fa-fire',
-                'display_order': 16
-            },
-            {
-                'name': 'I-Tips / Micro Links',
-                'description': 'Professional extension method',
-                'icon': 'fas fa-link',
-                'display_order': 17
-            },
-            {
-                'name': 'Take Down & Touch Up',
-                'description': 'Maintenance and removal services',
-                'icon': 'fas fa-tools',
-                'display_order': 18
-            },
-        ]
-        
-        categories = {}
-        for cat_data in categories_data:
-            category, created = ServiceCategory.objects.get_or_create(
-                name=cat_data['name'],
-                defaults={
-                    'description': cat_data['description'],
-                    'icon': cat_data['icon'],
-                    'display_order': cat_data['display_order']
-                }
-            )
-            categories[cat_data['name']] = category
-            status = 'Created' if created else 'Exists'
-            self.stdout.write(f"  {status}: {category.name}")
-        
-        return categories
-
-    def parse_duration(self, duration_str):
-        """Parse duration string like '2h 40m' or '4 hours' into minutes"""
-        if not duration_str:
-            return 60  # Default 1 hour
-        
-        # Remove common words
-        duration_str = duration_str.lower()
-        duration_str = duration_str.replace('hours', '').replace('hour', '').replace('hrs', '').replace('hr', '')
-        duration_str = duration_str.replace('minutes', '').replace('minute', '').replace('mins', '').replace('min', '')
-        
-        # Extract hours and minutes
-        hours = 0
-        minutes = 0
-        
-        # Find hours
-        hour_match = re.search(r'(\d+)\s*h', duration_str)
-        if hour_match:
-            hours = int(hour_match.group(1))
-        
-        # Find minutes
-        minute_match = re.search(r'(\d+)\s*m', duration_str)
-        if minute_match:
-            minutes = int(minute_match.group(1))
-        
-        # If no 'h' or 'm' markers, try to parse as just numbers
-        if not hour_match and not minute_match:
-            nums = re.findall(r'\d+', duration_str)
-            if len(nums) == 2:
-                hours = int(nums[0])
-                minutes = int(nums[1])
-            elif len(nums) == 1:
-                # If it's a decimal like "3.5", treat as hours
-                if '.' in duration_str:
-                    hour_part = float(nums[0])
-                    hours = int(hour_part)
-                    minutes = int((hour_part - hours) * 60)
-                else:
-                    # Assume it's hours if > 1, minutes if < 1
-                    num = int(nums[0])
-                    if num > 4:  # Probably minutes
-                        minutes = num
-                    else:  # Probably hours
-                        hours = num
-        
-        return hours * 60 + minutes
-
-    def create_services(self):
-        """Create all services with their details"""
-        
-        # Get categories
-        categories = {cat.name: cat for cat in ServiceCategory.objects.all()}
-        
-        services_data = [
-            # 1. SENEGAL & ISLAND TWISTS
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Senegal Twists - Medium (Mid Back)',
-                'description': 'Classic protective style. Hair not included unless specified. No oil in hair before appointment.',
-                'duration': '3 hours',
-                'price': 170.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Senegal Twists - Medium Long',
-                'description': 'Classic protective style. Hair not included unless specified. No oil in hair before appointment.',
-                'duration': '4 hours',
-                'price': 200.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Senegal Twists - Small/Medium (Back)',
-                'description': 'Classic protective style. Hair not included unless specified. No oil in hair before appointment.',
-                'duration': '2h 40m',
-                'price': 200.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Island Twists - Large (Any Length)',
-                'description': 'Stylist\'s hair only - No outside hair accepted. Hair not included.',
-                'duration': '1h 40m',
-                'price': 140.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Island Twists - Medium (Back)',
-                'description': 'Stylist\'s hair only - No outside hair accepted. Hair not included.',
-                'duration': '3 hours',
-                'price': 170.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Island Twists - Medium Long',
-                'description': 'Stylist\'s hair only - No outside hair accepted. Hair not included.',
-                'duration': '3 hours',
-                'price': 200.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Island Twists - Small/Medium (Back)',
-                'description': 'Stylist\'s hair only - No outside hair accepted. Hair not included.',
-                'duration': '4 hours',
-                'price': 250.00
-            },
-            {
-                'category': 'Senegal & Island Twists',
-                'name': 'Island Twists - Small Long',
-                'description': 'Stylist\'s hair only - No outside hair accepted. Hair not included.',
-                'duration': '6h 40m',
-                'price': 350.00
-            },
-            
-            # 2. BUTTERFLY LOCS
-            {
-                'category': 'Butterfly Locs',
-                'name': 'Butterfly Locs - Large',
-                'description': 'Bohemian-inspired faux locs. Bring locs or purchase from stylist. Wash hair, no oil.',
-                'duration': '2 hours',
-                'price': 150.00
-            },
-            {
-                'category': 'Butterfly Locs',
-                'name': 'Butterfly Locs - Medium',
-                'description': 'Bohemian-inspired faux locs. Bring locs or purchase from stylist. Wash hair, no oil.',
-                'duration': '3h 20m',
-                'price': 180.00
-            },
-            {
-                'category': 'Butterfly Locs',
-                'name': 'Butterfly Locs - Small/Medium',
-                'description': 'Bohemian-inspired faux locs. Bring locs or purchase from stylist. Wash hair, no oil.',
-                'duration': '3h 40m',
-                'price': 230.00
-            },
-            {
-                'category': 'Butterfly Locs',
-                'name': 'Butterfly Locs - Small (Back/Mid Back)',
-                'description': 'Bohemian-inspired faux locs. Bring locs or purchase from stylist. Wash hair, no oil.',
-                'duration': '4 hours',
-                'price': 250.00
-            },
-            {
-                'category': 'Butterfly Locs',
-                'name': 'Butterfly Locs - Smedium Shoulder Length',
-                'description': 'Bohemian-inspired faux locs. Bring locs or purchase from stylist. Wash hair, no oil.',
-                'duration': '4 hours',
-                'price': 250.00
-            },
-            
-            # 3. BOHO BRAIDS
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Large Long',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '2 hours',
-                'price': 165.00,
-                'is_popular': True
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Medium (Back/Mid Back)',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '3 hours',
-                'price': 180.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Medium Long',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '3 hours',
-                'price': 200.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Medium Shoulder Length',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '3 hours',
-                'price': 165.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Small Medium Long',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '4h 20m',
-                'price': 230.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Small Medium (Back)',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '3h 40m',
-                'price': 220.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Small Medium (Shoulder)',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '3h 20m',
-                'price': 200.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Small (Back)',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '4 hours',
-                'price': 250.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - Small Long',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '5 hours',
-                'price': 270.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - X-Small (Back)',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '4h 40m',
-                'price': 350.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Braids - X-Small Long',
-                'description': 'Braiding hair + curls/human hair required for volume. Hair not included.',
-                'duration': '8 hours',
-                'price': 450.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': 'Boho Locs',
-                'description': 'Specialty boho style. Hair requirements vary.',
-                'duration': '3h 9m',
-                'price': 150.00
-            },
-            {
-                'category': 'Boho Braids',
-                'name': '4 Boho Stitch Braids',
-                'description': 'Specialty boho style with stitch technique.',
-                'duration': '2 hours',
-                'price': 130.00
-            },
-            
-            # 4. BORA BORA BRAIDS
-            {
-                'category': 'Bora Bora Braids',
-                'name': 'Bora Bora Braids - Medium Full (Back)',
-                'description': 'Intricate braided style with wrapped sections. Curls not included.',
-                'duration': '3 hours',
-                'price': 230.00
-            },
-            {
-                'category': 'Bora Bora Braids',
-                'name': 'Bora Bora Braids - Small (Back)',
-                'description': 'Intricate braided style with wrapped sections. Curls not included.',
-                'duration': '4h 40m',
-                'price': 300.00
-            },
-            
-            # 5. CROCHET BRAIDS
-            {
-                'category': 'Crochet Braids',
-                'name': 'Crochet Braids - Medium Large',
-                'description': 'Bring crochet hair or consult stylist for purchase.',
-                'duration': '2 hours',
-                'price': 150.00
-            },
-            {
-                'category': 'Crochet Braids',
-                'name': 'Crochet Braids - Medium',
-                'description': 'Bring crochet hair or consult stylist for purchase.',
-                'duration': '2h 20m',
-                'price': 200.00
-            },
-            {
-                'category': 'Crochet Braids',
-                'name': 'Crochet Braids - Small Medium',
-                'description': 'Bring crochet hair or consult stylist for purchase.',
-                'duration': '4 hours',
-                'price': 240.00
-            },
-            {
-                'category': 'Crochet Braids',
-                'name': 'Crochet Braids - Small Long',
-                'description': 'Bring crochet hair or consult stylist for purchase.',
-                'duration': '4 hours',
-                'price': 300.00
-            },
-            
-            # 6. DREADS/LOCS & SISTER LOCS
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Reattachment/Dreads Breakage Repair',
-                'description': 'Maintenance service. Does not include retwist.',
-                'duration': '1h 10m',
-                'price': 120.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Retouch with Style',
-                'description': 'Maintenance and styling service.',
-                'duration': '1h 40m',
-                'price': 110.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Dreads Twist (≤20")',
-                'description': 'For dreads no longer than 20 inches.',
-                'duration': '1h 40m',
-                'price': 80.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Dreads Knots Repair',
-                'description': 'Retwist or style not included in price.',
-                'duration': '2 hours',
-                'price': 160.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Small Dreads Interlocking',
-                'description': 'Interlocking maintenance for small dreads.',
-                'duration': '4h 10m',
-                'price': 350.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Barrel Locs Style',
-                'description': 'Styling service for barrel locs/dreads.',
-                'duration': '2 hours',
-                'price': 100.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Starter Locs (Short Hair)',
-                'description': 'Starting new locs on short hair. Price varies based on length.',
-                'duration': '3h 40m',
-                'price': 250.00,
-                'notes': 'Price is 250 and up depending on hair length'
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Starter Locs (Long Hair)',
-                'description': 'Starting new locs on hair past shoulder length.',
-                'duration': '5 hours',
-                'price': 350.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Starter Coil Twist',
-                'description': 'Starting locs with coil twist method.',
-                'duration': '2 hours',
-                'price': 100.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Loc Extensions',
-                'description': 'Adding extensions to existing locs. Hair not included.',
-                'duration': '3h 40m',
-                'price': 500.00,
-                'notes': 'Price is 500 and up'
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Sister Locs Extensions',
-                'description': 'Professional sister locs extensions. Hair not included.',
-                'duration': '10 hours',
-                'price': 1200.00
-            },
-            {
-                'category': 'Dreads/Locs & Sister Locs',
-                'name': 'Sister Locs Retouch',
-                'description': 'Maintenance for sister locs.',
-                'duration': '4h 10m',
-                'price': 400.00
-            },
-            
-            # Add more services as needed... (continued in next message due to length)
-        ]
-        
-        # Continue adding all services from your comprehensive list...
-        # For brevity, I'll show the pattern. You should add ALL services from your list.
-        
-        display_order = 1
-        for service_data in services_data:
-            category = categories.get(service_data['category'])
-            if not category:
-                self.stdout.write(self.style.WARNING(f"Category not found: {service_data['category']}"))
-                continue
-            
-            # Generate slug
-            slug = slugify(service_data['name'])
-            
-            # Parse duration
-            duration_minutes = self.parse_duration(service_data.get('duration', '1 hour'))
-            
-            service, created = Service.objects.get_or_create(
-                slug=slug,
-                defaults={
-                    'category': category,
-                    'name': service_data['name'],
-                    'description': service_data['description'],
-                    'duration': duration_minutes,
-                    'price': service_data['price'],
-                    'display_order': display_order,
-                    'is_popular': service_data.get('is_popular', False)
-                }
-            )
-            
-            if not created:
-                # Update existing service
-                service.category = category
-                service.name = service_data['name']
-                service.description = service_data['description']
-                service.duration = duration_minutes
-                service.price = service_data['price']
-                service.display_order = display_order
-                service.is_popular = service_data.get('is_popular', False)
-                service.save()
-            
-            status = 'Created' if created else 'Updated'
-            self.stdout.write(f"  {status}: {service.name} (${service.price})")
-            display_order += 1
\ No newline at end of file
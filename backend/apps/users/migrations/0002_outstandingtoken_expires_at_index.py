@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-19 14:02
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+        ('token_blacklist', '0012_alter_outstandingtoken_user'),
+    ]
+
+    operations = [
+        # token_blacklist is a third-party app, so the index used by
+        # prune_tokens is added here instead of on its model
+        migrations.RunSQL(
+            sql='CREATE INDEX IF NOT EXISTS token_blacklist_outstandingtoken_expires_at_idx '
+                'ON token_blacklist_outstandingtoken (expires_at)',
+            reverse_sql='DROP INDEX IF EXISTS token_blacklist_outstandingtoken_expires_at_idx',
+        ),
+    ]
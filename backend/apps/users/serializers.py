@@ -1,7 +1,13 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from .authentication import USER_CLAIMS, validate_token_state
+from .hashers import verify_password
 from .models import UserProfile
+from .services import record_login, register_user
+from .tokens import UserClaimsRefreshToken
 
 User = get_user_model()
 
@@ -22,6 +28,14 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ['user', 'created_at', 'updated_at']
 
 
+class UserProfileListSerializer(serializers.ModelSerializer):
+    user = UserSerializer(read_only=True)
+    
+    class Meta:
+        model = UserProfile
+        fields = ['id', 'user', 'date_of_birth', 'gender', 'created_at', 'updated_at']
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     password2 = serializers.CharField(write_only=True, required=True)
@@ -36,19 +50,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         return attrs
     
     def create(self, validated_data):
-        user = User.objects.create(
+        return register_user(
             email=validated_data['email'],
+            password=validated_data['password'],
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', ''),
             phone=validated_data.get('phone', '')
         )
-        user.set_password(validated_data['password'])
-        user.save()
-        
-        # Create user profile
-        UserProfile.objects.create(user=user)
-        
-        return user
 
 
 class LoginSerializer(serializers.Serializer):
@@ -56,13 +64,55 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(write_only=True, required=True)
 
 
+class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Authenticate, issue tokens and return the user's data in one pass."""
+    token_class = UserClaimsRefreshToken
+    
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        data['user'] = UserSerializer(self.user).data
+        record_login(self.user)
+        return data
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = UserClaimsRefreshToken
+    
+    def validate(self, attrs):
+        blacklist_after_rotation = (
+            api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION
+        )
+        # With rotation, blacklist_once() below doubles as the blacklist check
+        refresh = self.token_class(attrs['refresh'], verify_blacklist=not blacklist_after_rotation)
+        state = validate_token_state(refresh)
+        
+        # Carry the user's current claims into the new tokens
+        for claim in USER_CLAIMS:
+            refresh[claim] = getattr(state, claim)
+        
+        data = {'access': str(refresh.access_token)}
+        
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                refresh.blacklist_once()
+            
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            
+            data['refresh'] = str(refresh)
+        
+        return data
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     old_password = serializers.CharField(write_only=True, required=True)
     new_password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     
     def validate_old_password(self, value):
         user = self.context['request'].user
-        if not user.check_password(value):
+        # The password is replaced right after, so skip rehashing the old one
+        if not verify_password(user, value, rehash=False):
             raise serializers.ValidationError("Old password is not correct")
         return value
 
@@ -0,0 +1,79 @@
+import threading
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+from utils.email_service import send_welcome_email
+from utils.tasks import enqueue
+from .hashers import hash_password
+from .models import UserProfile
+
+User = get_user_model()
+
+_pending_logins = {}
+_pending_lock = threading.Lock()
+_flush_timer = None
+
+
+def record_login(user):
+    """
+    Queue a last_login update instead of writing it during the login request.
+    
+    Logins are collected per process and written with a single bulk UPDATE
+    every LAST_LOGIN_FLUSH_INTERVAL seconds.
+    """
+    global _flush_timer
+    now = timezone.now()
+    user.last_login = now
+    
+    with _pending_lock:
+        _pending_logins[user.pk] = now
+    
+    interval = settings.LAST_LOGIN_FLUSH_INTERVAL
+    if interval <= 0 or settings.BACKGROUND_TASKS_EAGER:
+        enqueue(flush_last_logins)
+        return
+    
+    with _pending_lock:
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(interval, enqueue, args=(flush_last_logins,))
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_last_logins():
+    """Write all queued last_login values with one bulk UPDATE."""
+    global _flush_timer
+    with _pending_lock:
+        pending = dict(_pending_logins)
+        _pending_logins.clear()
+        _flush_timer = None
+    
+    if pending:
+        User.objects.bulk_update(
+            [User(pk=user_id, last_login=last_login) for user_id, last_login in pending.items()],
+            ['last_login']
+        )
+    return len(pending)
+
+
+def register_user(email, password, **extra_fields):
+    """
+    Create a user and their profile in one transaction.
+    
+    The password is hashed before the transaction starts, so the user is
+    written with a single INSERT and no locks are held while hashing. The
+    welcome email is queued once the transaction commits.
+    """
+    user = User(
+        email=User.objects.normalize_email(email),
+        password=hash_password(password),
+        **extra_fields
+    )
+    
+    with transaction.atomic():
+        user.save(force_insert=True)
+        UserProfile.objects.create(user=user)
+        transaction.on_commit(lambda: enqueue(send_welcome_email, user))
+    
+    return user
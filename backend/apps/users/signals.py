@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .authentication import invalidate_user_state
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def clear_cached_user_state(sender, instance, **kwargs):
+    """Drop the cached token-validation state so changes apply immediately."""
+    invalidate_user_state(instance.pk)
@@ -0,0 +1,135 @@
+import threading
+import time
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from . import hashers
+from .authentication import USER_STATE_CACHE_KEY
+from .hashers import run_hashing, verify_password
+from .models import User
+from .tokens import UserClaimsRefreshToken
+
+
+class StatelessJWTAuthenticationTests(TestCase):
+    """Token checks follow changes to the user made by any process."""
+    
+    def setUp(self):
+        self.user = User.objects.create_user(email='client@example.com', password='old-secret-123')
+        self.client = APIClient()
+    
+    def tearDown(self):
+        cache.clear()
+    
+    def get_me(self, token):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return self.client.get('/api/auth/users/me/')
+    
+    def access_token(self):
+        return UserClaimsRefreshToken.for_user(self.user).access_token
+    
+    def test_deactivation_applies_at_once(self):
+        token = self.access_token()
+        self.assertEqual(self.get_me(token).status_code, 200)
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        response = self.get_me(token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['code'], 'user_inactive')
+    
+    def test_password_change_revokes_older_tokens(self):
+        token = self.access_token()
+        self.assertEqual(self.get_me(token).status_code, 200)
+        
+        self.user.set_password('new-secret-456')
+        self.user.save()
+        
+        response = self.get_me(token)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data['code'], 'password_changed')
+        self.assertEqual(self.get_me(self.access_token()).status_code, 200)
+    
+    def test_token_newer_than_the_cached_state(self):
+        # Another process changed the password (and invalidated its own copy); the
+        # state cached here still has the old hash
+        old_token = self.access_token()
+        self.assertEqual(self.get_me(old_token).status_code, 200)
+        self.assertIsNotNone(cache.get(USER_STATE_CACHE_KEY.format(self.user.pk)))
+        
+        self.user.set_password('new-secret-456')
+        User.objects.filter(pk=self.user.pk).update(password=self.user.password)
+        
+        self.assertEqual(self.get_me(self.access_token()).status_code, 200)
+        self.assertEqual(self.get_me(old_token).status_code, 401)
+
+
+class PasswordHashingTests(TestCase):
+    """Hashes are upgraded only when the preferred hasher or its cost changes."""
+    
+    SCRYPT_FIRST = [
+        'apps.users.hashers.TunedScryptPasswordHasher',
+        'apps.users.hashers.TunedPBKDF2PasswordHasher',
+    ]
+    
+    def setUp(self):
+        self.user = User.objects.create_user(email='client@example.com', password='secret-123')
+    
+    def test_default_hash_is_kept(self):
+        encoded = self.user.password
+        with self.assertNumQueries(0):
+            self.assertTrue(verify_password(self.user, 'secret-123'))
+        self.assertEqual(self.user.password, encoded)
+    
+    @override_settings(PASSWORD_HASHERS=SCRYPT_FIRST, PASSWORD_SCRYPT_WORK_FACTOR=2 ** 10)
+    def test_rehash_on_hasher_change(self):
+        token = UserClaimsRefreshToken.for_user(self.user).access_token
+        
+        self.assertFalse(verify_password(self.user, 'wrong'))
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$'))
+        self.assertTrue(verify_password(self.user, 'secret-123', rehash=False))
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$'))
+        
+        self.assertTrue(verify_password(self.user, 'secret-123'))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('scrypt$'))
+        self.assertTrue(self.user.check_password('secret-123'))
+        
+        # The new hash revokes tokens issued before the upgrade
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(client.get('/api/auth/users/me/').status_code, 401)
+    
+    @override_settings(PASSWORD_PBKDF2_ITERATIONS=1000)
+    def test_rehash_on_cost_change(self):
+        self.assertTrue(verify_password(self.user, 'secret-123'))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+    
+    @override_settings(PASSWORD_HASH_WORKERS=2)
+    def test_hash_pool_is_bounded(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+        
+        def work():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.pop()
+        
+        executor = hashers._hash_executor
+        hashers._hash_executor = None
+        try:
+            threads = [threading.Thread(target=run_hashing, args=(work,)) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            self.assertEqual(max(peak), 2)
+            self.assertEqual(len(peak), 8)
+        finally:
+            hashers._hash_executor.shutdown()
+            hashers._hash_executor = executor
@@ -0,0 +1,58 @@
+from django.db import IntegrityError, transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+from .authentication import USER_CLAIMS
+
+
+class UserClaimsRefreshToken(RefreshToken):
+    """Refresh token carrying the user claims used by StatelessJWTAuthentication."""
+    
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        for claim in USER_CLAIMS:
+            token[claim] = getattr(user, claim)
+        return token
+    
+    def __init__(self, token=None, verify=True, verify_blacklist=True):
+        # Set before Token.__init__(), which decodes and calls verify()
+        self.verify_blacklist = verify_blacklist
+        super().__init__(token, verify=verify)
+    
+    def check_blacklist(self):
+        """
+        Skip the blacklist lookup when verify_blacklist is off.
+        
+        The signature and claims are still verified. Only safe when the token
+        is then consumed with blacklist_once(), which rejects already
+        blacklisted tokens itself.
+        """
+        if self.verify_blacklist:
+            super().check_blacklist()
+    
+    def blacklist_once(self):
+        """
+        Blacklist this token, raising TokenError if it already was.
+        
+        The unique constraint on BlacklistedToken.token does the check, so a
+        rotation costs one INSERT instead of a SELECT followed by get_or_create,
+        and two concurrent refreshes of the same token cannot both succeed.
+        """
+        jti = self.payload[api_settings.JTI_CLAIM]
+        token, _created = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={
+                'token': str(self),
+                'expires_at': datetime_from_epoch(self.payload['exp']),
+            }
+        )
+        
+        try:
+            with transaction.atomic():
+                return BlacklistedToken.objects.create(token=token)
+        except IntegrityError:
+            raise TokenError(_("Token is blacklisted"))
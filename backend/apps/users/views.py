@@ -6,15 +6,19 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
+from .tokens import UserClaimsRefreshToken
 
 from .serializers import (
     UserSerializer, 
     UserProfileSerializer,
+    UserProfileListSerializer,
     RegisterSerializer,
     LoginSerializer,
+    CustomTokenObtainPairSerializer,
     ChangePasswordSerializer,
     UpdateProfileSerializer
 )
+from .hashers import hash_password
 from .models import UserProfile
 from .permissions import IsOwnerOrReadOnly, IsAdminOrStaff
 
@@ -23,14 +27,7 @@ User = get_user_model()
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     """Custom token obtain view to include user data in response."""
-    
-    def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
-        if response.status_code == 200:
-            user = User.objects.get(email=request.data['email'])
-            serializer = UserSerializer(user)
-            response.data['user'] = serializer.data
-        return response
+    serializer_class = CustomTokenObtainPairSerializer
 
 
 class RegisterView(APIView):
@@ -40,7 +37,7 @@ class RegisterView(APIView):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
             user = serializer.save()
-            refresh = RefreshToken.for_user(user)
+            refresh = UserClaimsRefreshToken.for_user(user)
             
             return Response({
                 'user': UserSerializer(user).data,
@@ -82,16 +79,28 @@ class UserProfileViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     
     def get_queryset(self):
+        queryset = UserProfile.objects.select_related('user').order_by('id')
+        if self.action == 'list':
+            # Large free-text/JSON fields are only needed on the detail view
+            queryset = queryset.defer('address', 'preferences', 'allergies', 'notes')
         if self.request.user.is_staff:
-            return UserProfile.objects.all()
-        return UserProfile.objects.filter(user=self.request.user)
+            return queryset
+        return queryset.filter(user_id=self.request.user.pk)
+    
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return UserProfileListSerializer
+        return UserProfileSerializer
     
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
     
     @action(detail=False, methods=['get', 'patch'], permission_classes=[permissions.IsAuthenticated])
     def my_profile(self, request):
-        profile, created = UserProfile.objects.get_or_create(user=request.user)
+        # Profiles are created at registration; only older accounts can lack one
+        profile = UserProfile.objects.select_related('user').filter(user_id=request.user.pk).first()
+        if profile is None:
+            profile = UserProfile.objects.create(user=request.user)
         
         if request.method == 'PATCH':
             serializer = self.get_serializer(profile, data=request.data, partial=True)
@@ -111,7 +120,7 @@ class ChangePasswordView(APIView):
         serializer = ChangePasswordSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             user = request.user
-            user.set_password(serializer.validated_data['new_password'])
+            user.password = hash_password(serializer.validated_data['new_password'])
             user.save()
             return Response({'message': 'Password updated successfully'}, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
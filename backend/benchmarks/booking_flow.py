@@ -0,0 +1,294 @@
+"""
+Booking flow benchmark.
+
+Creates a throwaway test database and seeds it with synthetic data (see
+apps.bookings.synthetic and the generate_synthetic_data command). Then runs
+scripted client scenarios in-process through Django's test client: browse
+the catalog, check availability, book, pay a deposit and cancel. Email goes to Django's in-memory test outbox and
+background tasks run inline, so every side effect is included and nothing
+leaves the process.
+
+Reports p50/p95/p99 latency and queries per request for each step as JSON,
+so results can be diffed between commits:
+
+    python -m benchmarks.booking_flow --staff 10 --months 6 -n 200 -o before.json
+    git checkout my-branch
+    python -m benchmarks.booking_flow --staff 10 --months 6 -n 200 -o after.json
+
+Run from the backend directory with the usual environment variables; the
+configured database is only used to create the test database next to it.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+from .loadtest import percentile
+
+
+class FlowRecorder:
+    """Test client wrapper recording latency, status and query count per step."""
+    
+    def __init__(self, client, connection):
+        self.client = client
+        self.connection = connection
+        self.samples = defaultdict(list)
+        self.enabled = True
+    
+    def request(self, step, method, path, data=None, token=None, expected=(200, 201)):
+        from django.test.utils import CaptureQueriesContext
+        
+        headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'} if token else {}
+        call = getattr(self.client, method)
+        kwargs = {'content_type': 'application/json'} if method != 'get' else {}
+        if data is not None:
+            kwargs['data'] = json.dumps(data) if method != 'get' else data
+        
+        with CaptureQueriesContext(self.connection) as queries:
+            start = time.perf_counter()
+            response = call(path, **kwargs, **headers)
+            duration = time.perf_counter() - start
+        
+        if self.enabled:
+            self.samples[step].append((duration, len(queries), response.status_code in expected))
+        if response.status_code not in expected:
+            return None
+        return response.json() if response.content else {}
+    
+    def summary(self):
+        results = {}
+        for step, samples in self.samples.items():
+            durations = [duration for duration, _queries, _ok in samples]
+            query_counts = [queries for _duration, queries, _ok in samples]
+            results[step] = {
+                'requests': len(samples),
+                'errors': sum(1 for *_rest, ok in samples if not ok),
+                'latency_ms': {
+                    'p50': round(percentile(durations, 0.50) * 1000, 2),
+                    'p95': round(percentile(durations, 0.95) * 1000, 2),
+                    'p99': round(percentile(durations, 0.99) * 1000, 2),
+                    'mean': round(sum(durations) / len(durations) * 1000, 2),
+                },
+                'queries': {
+                    'mean': round(sum(query_counts) / len(query_counts), 2),
+                    'max': max(query_counts),
+                },
+            }
+        return results
+
+
+class BookingFlow:
+    """Scripted client scenarios over the seeded data."""
+    
+    def __init__(self, recorder, clients, staff, services, days_ahead):
+        from apps.users.tokens import UserClaimsRefreshToken
+        
+        self.recorder = recorder
+        # Minting tokens directly keeps password hashing out of the measurements
+        self.tokens = [str(UserClaimsRefreshToken.for_user(client).access_token) for client in clients]
+        self.staff = staff
+        self.services = services
+        self.days_ahead = days_ahead
+        self.used_slots = set()
+        self.iteration = 0
+    
+    def run_iteration(self):
+        token = self.tokens[self.iteration % len(self.tokens)]
+        self.iteration += 1
+        
+        self.browse_catalog(token)
+        booking = self.check_availability(token)
+        if booking is None:
+            return
+        appointment = self.book(token, *booking)
+        if appointment is None:
+            return
+        self.pay(token, appointment)
+        self.cancel(token, appointment)
+    
+    def browse_catalog(self, token):
+        self.recorder.request('browse_catalog/categories_with_services', 'get', '/api/services/categories_with_services/', token=token)
+        self.recorder.request('browse_catalog/services', 'get', '/api/services/', token=token)
+        self.recorder.request('browse_catalog/staff', 'get', '/api/staff/', token=token)
+    
+    def check_availability(self, token):
+        """Find a slot this run has not booked yet, walking staff and days in order."""
+        from django.utils import timezone
+        
+        service = self.services[self.iteration % len(self.services)]
+        today = timezone.localdate()
+        for offset in range(1, self.days_ahead + 1):
+            day = today + timedelta(days=offset)
+            for member in self.staff:
+                slots = self.recorder.request(
+                    'check_availability', 'get', '/api/bookings/availability/check/',
+                    data={'staff_id': member.id, 'service_id': service.id, 'date': day.isoformat()},
+                    token=token
+                )
+                for slot in slots or []:
+                    key = (member.id, day, slot['start_time'])
+                    # The unique slot constraint also covers cancelled bookings
+                    if slot['is_available'] and key not in self.used_slots:
+                        self.used_slots.add(key)
+                        return member, service, day, slot['start_time']
+        return None
+    
+    def book(self, token, member, service, day, start_time):
+        created = self.recorder.request('book/create', 'post', '/api/bookings/appointments/', data={
+            'staff_id': member.id,
+            'service_id': service.id,
+            'appointment_date': day.isoformat(),
+            'start_time': start_time,
+        }, token=token)
+        if created is None:
+            return None
+        
+        # The create response has no id; find the booking the way the client app lists it
+        listing = self.recorder.request(
+            'book/list', 'get', '/api/bookings/appointments/',
+            data={'appointment_date': day.isoformat(), 'staff': member.id},
+            token=token
+        )
+        # Synthetic history can hold other upcoming bookings for this client on the same day
+        results = [
+            appointment for appointment in (listing or {}).get('results', [])
+            if appointment['start_time'][:5] == start_time[:5]
+        ]
+        return results[0] if results else None
+    
+    def pay(self, token, appointment):
+        deposit = (Decimal(appointment['total_amount']) / 2).quantize(Decimal('0.01'))
+        self.recorder.request('pay', 'post', '/api/bookings/payments/', data={
+            'appointment': appointment['id'],
+            'amount': str(deposit),
+            'payment_method': 'card',
+        }, token=token)
+    
+    def cancel(self, token, appointment):
+        self.recorder.request(
+            'cancel', 'post', f"/api/bookings/appointments/{appointment['id']}/cancel/",
+            data={'reason': 'Benchmark'}, token=token
+        )
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    import django
+    from django.core import mail
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+    
+    django.setup()
+    from apps.bookings.synthetic import MAX_BOOKABLE_DURATION, generate_synthetic_data, synthetic_users
+    from apps.services.models import Service
+    from apps.staff.models import Staff
+    
+    # Swaps in the locmem email backend and allows the 'testserver' host
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        with override_settings(BACKGROUND_TASKS_EAGER=True):
+            started = time.perf_counter()
+            stats = generate_synthetic_data(
+                staff=args.staff,
+                clients=args.clients,
+                months=args.months,
+                per_day=args.per_day,
+                services=args.extra_services,
+                days_ahead=args.days_ahead,
+                gallery_images=0,
+                seed=args.seed,
+            )
+            seeded = dict(stats.counts)
+            seed_seconds = time.perf_counter() - started
+            
+            recorder = FlowRecorder(Client(), connection)
+            flow = BookingFlow(
+                recorder,
+                clients=list(synthetic_users().filter(is_staff_member=False).order_by('id')),
+                staff=list(Staff.objects.filter(user__in=synthetic_users()).order_by('id')),
+                services=list(Service.objects.filter(
+                    is_active=True, duration__lte=MAX_BOOKABLE_DURATION
+                ).order_by('duration', 'id')[:5]),
+                days_ahead=args.days_ahead,
+            )
+            
+            recorder.enabled = False
+            for _ in range(args.warmup):
+                flow.run_iteration()
+            recorder.enabled = True
+            mail.outbox = []
+            
+            started = time.perf_counter()
+            for _ in range(args.iterations):
+                flow.run_iteration()
+            run_seconds = time.perf_counter() - started
+            
+            return {
+                'meta': {
+                    'revision': git_revision(),
+                    'python': platform.python_version(),
+                    'database': connection.vendor,
+                    'auth': 'stateless' if args.stateless_auth else 'database',
+                    'iterations': args.iterations,
+                    'warmup': args.warmup,
+                    'seed': args.seed,
+                    'seeded': seeded,
+                    'seed_seconds': round(seed_seconds, 2),
+                    'run_seconds': round(run_seconds, 2),
+                    'emails_sent': len(mail.outbox),
+                },
+                'results': recorder.summary(),
+            }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--iterations', type=int, default=50, help='Booking flows to measure')
+    parser.add_argument('--warmup', type=int, default=5, help='Unrecorded flows run first')
+    parser.add_argument('--staff', type=int, default=5, help='Synthetic stylists')
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--months', type=int, default=3, help='Months of appointment history')
+    parser.add_argument('--per-day', type=int, default=4, help='Past appointments per stylist per day')
+    parser.add_argument('--extra-services', type=int, default=0, help='Synthetic services on top of the catalog')
+    parser.add_argument('--days-ahead', type=int, default=30, help='Days of future availability')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the synthetic data')
+    parser.add_argument(
+        '--stateless-auth', action=argparse.BooleanOptionalAction, default=True,
+        help='Authenticate from token claims (STATELESS_JWT_AUTH)'
+    )
+    parser.add_argument('-o', '--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+    
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'salon.settings')
+    # Read by the settings module, so it must be set before django.setup()
+    os.environ['STATELESS_JWT_AUTH'] = str(args.stateless_auth)
+    
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare concurrent-connection throughput between WSGI and ASGI serving modes.
+
+Starts gunicorn with the project's config once per mode (SERVER_MODE=wsgi,
+then SERVER_MODE=asgi), runs the same load against each, and prints both
+summaries as JSON:
+
+    python -m benchmarks.compare_servers \\
+        /api/services/categories_with_services/ \\
+        "/api/bookings/availability/check/?staff_id=1&service_id=1&date=2030-01-07" \\
+        -c 64 -d 20
+
+Paths are resolved against the local server. Run from the backend directory
+with the same environment (DATABASE_URL, SECRET_KEY, ...) used to serve.
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import time
+
+from .loadtest import run
+
+MODES = ('wsgi', 'asgi')
+
+
+def wait_until_ready(port, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=2)
+        try:
+            connection.request('GET', '/')
+            connection.getresponse().read()
+            return True
+        except (OSError, http.client.HTTPException):
+            time.sleep(0.2)
+        finally:
+            connection.close()
+    return False
+
+
+def run_mode(mode, paths, port, concurrency, duration, warmup, headers, workers):
+    env = dict(os.environ, SERVER_MODE=mode, PORT=str(port))
+    if workers:
+        env['WEB_CONCURRENCY'] = str(workers)
+    
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py'],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        if not wait_until_ready(port):
+            raise RuntimeError(f"{mode} server did not start on port {port}")
+        
+        urls = [f'http://127.0.0.1:{port}{path}' for path in paths]
+        if warmup:
+            run(urls, concurrency, warmup, headers)
+        return {'label': mode, **run(urls, concurrency, duration, headers)}
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help='Paths to request, round-robin')
+    parser.add_argument('-c', '--concurrency', type=int, default=32)
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='Seconds to run per mode')
+    parser.add_argument('-w', '--workers', type=int, help='WEB_CONCURRENCY for both modes')
+    parser.add_argument('--warmup', type=float, default=2.0, help='Seconds of unrecorded load first')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('-H', '--header', action='append', default=[], help="Extra header, 'Name: value'")
+    args = parser.parse_args(argv)
+    
+    headers = {}
+    for header in args.header:
+        name, _, value = header.partition(':')
+        headers[name.strip()] = value.strip()
+    
+    results = [
+        run_mode(mode, args.paths, args.port, args.concurrency, args.duration, args.warmup, headers, args.workers)
+        for mode in args.modes
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Minimal HTTP load generator (standard library only).
+
+Runs a fixed number of concurrent clients against one or more URLs for a
+fixed duration and prints requests/sec and latency percentiles. To compare
+connection pooling, start the server twice and run the same load:
+
+    DB_POOL=false gunicorn -c gunicorn.conf.py
+    python -m benchmarks.loadtest http://localhost:8000/api/services/ -c 16 -d 30 --label no-pool
+    
+    DB_POOL=true gunicorn -c gunicorn.conf.py
+    python -m benchmarks.loadtest http://localhost:8000/api/services/ -c 16 -d 30 --label pool
+"""
+import argparse
+import http.client
+import json
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(fraction * (len(values) - 1))))
+    return values[index]
+
+
+def worker(urls, headers, deadline, results, lock):
+    connections = {}
+    latencies = []
+    errors = 0
+    statuses = {}
+    index = 0
+    
+    while time.monotonic() < deadline:
+        url = urls[index % len(urls)]
+        index += 1
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        
+        connection = connections.get(key)
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+            connection = connections[key] = connection_class(parts.netloc, timeout=30)
+        
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        
+        start = time.perf_counter()
+        try:
+            connection.request('GET', path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            connection.close()
+            connections.pop(key, None)
+            continue
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] = statuses.get(response.status, 0) + 1
+    
+    for connection in connections.values():
+        connection.close()
+    
+    with lock:
+        results['latencies'].extend(latencies)
+        results['errors'] += errors
+        for status, count in statuses.items():
+            results['statuses'][status] = results['statuses'].get(status, 0) + count
+
+
+def run(urls, concurrency=8, duration=10.0, headers=None):
+    results = {'latencies': [], 'errors': 0, 'statuses': {}}
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+    
+    threads = [
+        threading.Thread(target=worker, args=(urls, headers or {}, deadline, results, lock))
+        for _ in range(concurrency)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    
+    latencies = results['latencies']
+    return {
+        'requests': len(latencies),
+        'errors': results['errors'],
+        'statuses': {str(status): count for status, count in sorted(results['statuses'].items())},
+        'duration': round(elapsed, 2),
+        'requests_per_sec': round(len(latencies) / elapsed, 1) if elapsed else 0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 0.50) * 1000, 1),
+            'p95': round(percentile(latencies, 0.95) * 1000, 1),
+            'p99': round(percentile(latencies, 0.99) * 1000, 1),
+        },
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('urls', nargs='+', help='URLs to request, round-robin')
+    parser.add_argument('-c', '--concurrency', type=int, default=8)
+    parser.add_argument('-d', '--duration', type=float, default=10.0, help='Seconds to run')
+    parser.add_argument('-H', '--header', action='append', default=[], help="Extra header, 'Name: value'")
+    parser.add_argument('--label', help='Name for this run in the JSON output')
+    args = parser.parse_args(argv)
+    
+    headers = {}
+    for header in args.header:
+        name, _, value = header.partition(':')
+        headers[name.strip()] = value.strip()
+    
+    summary = run(args.urls, args.concurrency, args.duration, headers)
+    if args.label:
+        summary = {'label': args.label, **summary}
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == '__main__':
+    main()
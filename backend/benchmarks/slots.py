@@ -0,0 +1,264 @@
+"""
+Micro-benchmarks for availability slot generation.
+
+Times utils.helpers.build_time_slots (the algorithm behind the availability
+endpoints) and get_time_slots in memory across shift lengths, service
+durations, booking densities and multi-day ranges. Then, against a
+throwaway test database, times the availability endpoint itself.
+
+Timing regression checks (non-zero exit status when any fails):
+
+- scaling: with a fully booked schedule, growing the number of slots 16x
+  must grow the time by at most 16 ** --max-exponent (default 1.5), so an
+  accidentally quadratic slot/booking comparison is caught;
+- baseline: with --baseline, no case may be slower than --tolerance times
+  the saved timing (save one with --save-baseline on a known-good commit).
+  Timings are compared relative to a calibration loop run alongside them.
+
+That the endpoint's query count doesn't grow with bookings is deterministic,
+so it is checked by the test suite (apps.bookings.tests) instead.
+    
+    python -m benchmarks.slots --save-baseline slots-baseline.json
+    python -m benchmarks.slots --baseline slots-baseline.json
+"""
+import argparse
+import itertools
+import json
+import math
+import os
+import sys
+import timeit
+from datetime import date, datetime, time, timedelta
+
+SHIFT_HOURS = (4, 8, 12)
+DURATIONS = (15, 30, 60, 120)
+DENSITIES = (0.0, 0.5, 1.0)
+DAY_RANGES = (1, 7, 30)
+
+# Slots per day for the scaling check; 1-minute services over growing shifts
+# starting at midnight, so the large size fills almost the whole day
+SCALING_SIZES = (90, 1410)
+
+DAY_START = time(6, 0)
+BENCH_DATE = date(2030, 1, 7)
+
+CALIBRATION_KEY = '_calibration'
+
+
+def calibrate():
+    """Seconds for a fixed pure-Python workload, to normalize timings across machines and runs."""
+    values = list(range(2000, 0, -1))
+    return measure(lambda: sorted(values, key=lambda value: value % 97), repeat=7)
+
+
+def minutes_after(start, minutes):
+    return (datetime.combine(BENCH_DATE, start) + timedelta(minutes=minutes)).time()
+
+
+def make_day(shift_minutes, duration, density, day_start=DAY_START):
+    """One availability window and bookings covering `density` of its slots, spread evenly."""
+    windows = [(day_start, minutes_after(day_start, shift_minutes))]
+    slot_count = shift_minutes // duration
+    booked_count = int(slot_count * density)
+    booked = []
+    if booked_count:
+        step = slot_count / booked_count
+        for index in range(booked_count):
+            start = int(index * step) * duration
+            booked.append((minutes_after(day_start, start), minutes_after(day_start, start + duration)))
+    return windows, booked
+
+
+def measure(func, repeat=5, min_time=0.02):
+    """Best seconds per call over `repeat` runs of at least min_time seconds each."""
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_memory_cases():
+    from utils.helpers import build_time_slots, get_time_slots
+    
+    results = {}
+    for hours, duration, density, days in itertools.product(SHIFT_HOURS, DURATIONS, DENSITIES, DAY_RANGES):
+        schedule = [
+            (BENCH_DATE + timedelta(days=offset), *make_day(hours * 60, duration, density))
+            for offset in range(days)
+        ]
+        
+        def build():
+            for day, windows, booked in schedule:
+                build_time_slots(day, windows, booked, duration)
+        
+        results[f'build_time_slots/shift={hours}h/duration={duration}/density={density}/days={days}'] = measure(build)
+    
+    for hours, duration in itertools.product(SHIFT_HOURS, DURATIONS):
+        end = minutes_after(DAY_START, hours * 60)
+        results[f'get_time_slots/shift={hours}h/interval={duration}'] = measure(
+            lambda: get_time_slots(DAY_START, end, duration)
+        )
+    return results
+
+
+def check_scaling(max_exponent):
+    """Return (report, failures) for the fully booked scaling check."""
+    from utils.helpers import build_time_slots
+    
+    small, large = SCALING_SIZES
+    timings = {}
+    for size in SCALING_SIZES:
+        windows, booked = make_day(size, 1, 1.0, day_start=time(0, 0))
+        timings[size] = measure(lambda: build_time_slots(BENCH_DATE, windows, booked, 1))
+    
+    exponent = math.log(timings[large] / timings[small]) / math.log(large / small)
+    report = {
+        'slots': list(SCALING_SIZES),
+        'seconds': [timings[size] for size in SCALING_SIZES],
+        'exponent': round(exponent, 2),
+        'max_exponent': max_exponent,
+    }
+    failures = []
+    if exponent > max_exponent:
+        failures.append(
+            f"build_time_slots scales as n^{exponent:.2f} on a fully booked day (limit n^{max_exponent})"
+        )
+    return report, failures
+
+
+def run_database_cases():
+    """Time the availability endpoint per density and range."""
+    import django
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment, teardown_test_environment
+    
+    django.setup()
+    from django.contrib.auth import get_user_model
+    from apps.bookings.models import Appointment
+    from apps.services.models import Service, ServiceCategory
+    from apps.staff.models import Staff, StaffAvailability, StaffService
+    from apps.users.tokens import UserClaimsRefreshToken
+    
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        User = get_user_model()
+        category = ServiceCategory.objects.create(name='Benchmark')
+        client_user = User.objects.create(email='slots-client@example.com')
+        token = str(UserClaimsRefreshToken.for_user(client_user).access_token)
+        client = Client()
+        
+        results = {}
+        for density in DENSITIES:
+            staff = Staff.objects.create(user=User.objects.create(
+                email=f'slots-staff-{density}@example.com', is_staff_member=True
+            ))
+            duration = DURATIONS[0]
+            service = Service.objects.create(
+                category=category, name=f'Slots {density}', slug=f'slots-{density}'.replace('.', '-'),
+                description='Benchmark', duration=duration, price=50
+            )
+            StaffService.objects.create(staff=staff, service=service)
+            days = max(DAY_RANGES)
+            shift_minutes = max(SHIFT_HOURS) * 60
+            appointments = []
+            for offset in range(days):
+                day = BENCH_DATE + timedelta(days=offset)
+                windows, booked = make_day(shift_minutes, duration, density)
+                StaffAvailability.objects.create(
+                    staff=staff, date=day, start_time=windows[0][0], end_time=windows[0][1]
+                )
+                appointments.extend(
+                    Appointment(
+                        client=client_user, staff=staff, service=service, appointment_date=day,
+                        start_time=start, end_time=end, status='confirmed',
+                        service_price=50, total_amount=50
+                    )
+                    for start, end in booked
+                )
+            Appointment.objects.bulk_create(appointments, batch_size=1000)
+            
+            for day_range in DAY_RANGES:
+                paths = [
+                    '/api/bookings/availability/check/?'
+                    f'staff_id={staff.id}&service_id={service.id}&date={BENCH_DATE + timedelta(days=offset)}'
+                    for offset in range(day_range)
+                ]
+                
+                def fetch():
+                    for path in paths:
+                        response = client.get(path, HTTP_AUTHORIZATION=f'Bearer {token}')
+                        assert response.status_code == 200, response.content
+                
+                results[f'availability_endpoint/shift={max(SHIFT_HOURS)}h/duration={duration}/density={density}/days={day_range}'] = measure(fetch, repeat=3)
+        return results
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def compare_baseline(results, calibration, baseline, tolerance):
+    """Compare timings relative to each run's calibration loop, so machine speed cancels out."""
+    failures = []
+    baseline_calibration = baseline.get(CALIBRATION_KEY)
+    for name, seconds in results.items():
+        previous = baseline.get(name)
+        if not previous or not baseline_calibration:
+            continue
+        ratio = (seconds / calibration) / (previous / baseline_calibration)
+        if ratio > tolerance:
+            failures.append(
+                f"{name}: {ratio:.2f}x the baseline ({seconds * 1e6:.1f}us vs {previous * 1e6:.1f}us)"
+            )
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--no-db', action='store_true', help='Only run the in-memory benchmarks')
+    parser.add_argument('--max-exponent', type=float, default=1.5)
+    parser.add_argument('--baseline', help='JSON timings to compare against')
+    parser.add_argument('--tolerance', type=float, default=2.0, help='Allowed slowdown against the baseline')
+    parser.add_argument('--save-baseline', help='Write this run\'s timings here')
+    parser.add_argument('-o', '--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+    
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'salon.settings')
+    import django
+    django.setup()
+    
+    calibration = calibrate()
+    results = run_memory_cases()
+    scaling, failures = check_scaling(args.max_exponent)
+    report = {'scaling': scaling}
+    
+    if not args.no_db:
+        results.update(run_database_cases())
+    
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            failures.extend(compare_baseline(results, calibration, json.load(baseline_file), args.tolerance))
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as baseline_file:
+            json.dump({CALIBRATION_KEY: calibration, **results}, baseline_file, indent=2, sort_keys=True)
+    
+    report['calibration_us'] = round(calibration * 1e6, 2)
+    report['timings_us'] = {name: round(seconds * 1e6, 2) for name, seconds in results.items()}
+    report['failures'] = failures
+    
+    output = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output)
+    else:
+        sys.stdout.write(output)
+    
+    for failure in failures:
+        sys.stderr.write(f"REGRESSION: {failure}\n")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
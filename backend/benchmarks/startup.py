@@ -0,0 +1,175 @@
+"""
+Startup cost: import-time report and gunicorn worker boot times.
+
+For each target, runs a fresh interpreter with `python -X importtime` and
+reports the wall time (median over --repeat runs), the total import time,
+and the packages and top-level imports that cost the most:
+
+- settings: load salon.settings only
+- setup: django.setup(), as every management command does
+- app: the WSGI application plus the URLconf, as a worker needs to serve
+
+Then starts gunicorn with the project's config, with and without
+preload_app, and reports how long each worker took from fork to ready
+(the "Worker ... ready in" log line) and until all workers were up:
+
+    python -m benchmarks.startup -o startup.json
+    python -m benchmarks.startup --targets setup --top 30 --no-gunicorn
+
+Run from the backend directory with the usual environment variables;
+MEDIA_BACKEND=local and MEDIA_BACKEND=cloudinary can be compared by
+running it once with each.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+TARGETS = {
+    'settings': "from django.conf import settings; settings.INSTALLED_APPS",
+    'setup': "import django; django.setup()",
+    'app': (
+        "from django.core.wsgi import get_wsgi_application; get_wsgi_application(); "
+        "from django.urls import get_resolver; get_resolver().url_patterns"
+    ),
+}
+
+IMPORT_LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+WORKER_READY_RE = re.compile(r'Worker (\d+) ready in (\d+) ms')
+
+
+def python_env():
+    return dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'salon.settings'))
+
+
+def parse_importtime(output):
+    """Return [(module, depth, self_us, cumulative_us)] from -X importtime output."""
+    imports = []
+    for line in output.splitlines():
+        match = IMPORT_LINE_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, len(indent) // 2, int(self_us), int(cumulative_us)))
+    return imports
+
+
+def importtime_report(code, repeat, top):
+    """Wall time over `repeat` fresh interpreters, and the import breakdown of the last one."""
+    wall = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            env=python_env(), capture_output=True, text=True
+        )
+        wall.append(time.perf_counter() - started)
+        if result.returncode:
+            raise RuntimeError(result.stderr[-2000:])
+    
+    imports = parse_importtime(result.stderr)
+    packages = defaultdict(int)
+    for module, _depth, self_us, _cumulative in imports:
+        packages[module.split('.')[0]] += self_us
+    direct = [item for item in imports if item[1] == 0]
+    
+    return {
+        'wall_ms': round(statistics.median(wall) * 1000, 1),
+        'import_ms': round(sum(item[2] for item in imports) / 1000, 1),
+        'modules': len(imports),
+        'packages_ms': {
+            package: round(self_us / 1000, 1)
+            for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+        },
+        'top_level_imports_ms': {
+            module: round(cumulative / 1000, 1)
+            for module, _depth, _self, cumulative in sorted(direct, key=lambda item: -item[3])[:top]
+        },
+    }
+
+
+def gunicorn_boot(workers, preload, port, timeout=120.0):
+    """Start gunicorn and collect each worker's boot time from its log line."""
+    env = dict(
+        python_env(),
+        PORT=str(port),
+        WEB_CONCURRENCY=str(workers),
+        GUNICORN_PRELOAD='true' if preload else 'false',
+    )
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py', '--log-level', 'info'],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    boot_ms = []
+    try:
+        deadline = time.monotonic() + timeout
+        for line in server.stderr:
+            match = WORKER_READY_RE.search(line)
+            if match:
+                boot_ms.append(int(match.group(2)))
+                if len(boot_ms) == workers:
+                    break
+            if time.monotonic() > deadline:
+                break
+        all_ready = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    
+    if len(boot_ms) < workers:
+        raise RuntimeError(f"only {len(boot_ms)} of {workers} workers reported ready")
+    return {
+        'workers': workers,
+        'worker_boot_ms': {
+            'mean': round(statistics.mean(boot_ms), 1),
+            'max': max(boot_ms),
+        },
+        'all_ready_ms': round(all_ready * 1000, 1),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--targets', nargs='+', choices=sorted(TARGETS), default=list(TARGETS))
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Interpreter starts per target')
+    parser.add_argument('--top', type=int, default=15, help='Packages and imports to list')
+    parser.add_argument('-w', '--workers', type=int, default=2, help='Gunicorn workers to boot')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument(
+        '--gunicorn', action=argparse.BooleanOptionalAction, default=True,
+        help='Also measure gunicorn worker boot with and without preload_app'
+    )
+    parser.add_argument('-o', '--output', help='Write the JSON report here instead of stdout')
+    args = parser.parse_args(argv)
+    
+    report = {
+        'meta': {
+            'python': sys.version.split()[0],
+            'media_backend': os.environ.get('MEDIA_BACKEND', 'default'),
+        },
+        'targets': {name: importtime_report(TARGETS[name], args.repeat, args.top) for name in args.targets},
+    }
+    if args.gunicorn:
+        report['gunicorn'] = {
+            'preload': gunicorn_boot(args.workers, True, args.port),
+            'no_preload': gunicorn_boot(args.workers, False, args.port),
+        }
+    
+    output = json.dumps(report, indent=2) + '\n'
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(output)
+    else:
+        sys.stdout.write(output)
+
+
+if __name__ == '__main__':
+    main()
@@ -15,6 +15,7 @@ python manage.py collectstatic --noinput
 
 echo "🔄 Running database migrations..."
 python manage.py migrate --noinput
+python manage.py createcachetable
 
 echo "📊 Populating initial data..."
 python manage.py populate_services
@@ -0,0 +1,70 @@
+# gunicorn.conf.py
+import os
+import time
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 4))
+
+# SERVER_MODE=asgi serves salon.asgi under uvicorn workers, which also mounts
+# the async views. Otherwise gthread lets each worker serve several requests at
+# once; with DB_POOL they share the worker's pooled connections. gevent needs
+# gevent and psycogreen.
+server_mode = os.environ.get('SERVER_MODE', 'wsgi')
+if server_mode == 'asgi':
+    wsgi_app = 'salon.asgi:application'
+    worker_class = 'uvicorn.workers.UvicornWorker'
+else:
+    wsgi_app = 'salon.wsgi:application'
+    worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 100))
+
+# Import Django once in the master and fork ready workers from it, so booting
+# or recycling a worker (max_requests) doesn't repeat the whole import
+preload_app = os.environ.get('GUNICORN_PRELOAD', 'true').lower() in ('1', 'true', 'yes')
+
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', 5))
+max_requests = int(os.environ.get('GUNICORN_MAX_REQUESTS', 0))
+max_requests_jitter = int(os.environ.get('GUNICORN_MAX_REQUESTS_JITTER', 0))
+
+accesslog = os.environ.get('GUNICORN_ACCESSLOG') or None
+errorlog = '-'
+
+
+def when_ready(server):
+    if preload_app:
+        # Load the URLconf (views, serializers) before forking as well,
+        # instead of in every worker on its first request
+        from django.urls import get_resolver
+        get_resolver().url_patterns
+
+
+def pre_fork(server, worker):
+    if preload_app:
+        # Close connections opened while preloading here, in the process that
+        # owns them, so no worker inherits an open database socket
+        from django.db import connections
+        from utils.db_pool.base import close_pools
+        connections.close_all()
+        close_pools()
+    worker.boot_started = time.perf_counter()
+
+
+def post_worker_init(worker):
+    worker.log.info("Worker %s ready in %.0f ms", worker.pid, (time.perf_counter() - worker.boot_started) * 1000)
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        try:
+            from psycogreen.gevent import patch_psycopg
+        except ImportError:
+            server.log.warning("psycogreen is not installed; database calls will block the gevent loop")
+        else:
+            patch_psycopg()
+    
+    if preload_app:
+        # Anything still inherited belongs to the master: forget it, don't close it
+        from utils.db_pool.base import detach_inherited_connections
+        detach_inherited_connections()
@@ -0,0 +1,13 @@
+"""
+Django settings for salon project.
+
+base holds everything shared, media adds the storage for MEDIA_BACKEND and
+production adds the hardening used on Render. DJANGO_SETTINGS_MODULE stays
+'salon.settings'.
+"""
+
+from .base import *
+from .media import *
+
+if ENVIRONMENT == 'production' or ON_RENDER:
+    from .production import *
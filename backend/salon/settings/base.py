@@ -0,0 +1,306 @@
+"""
+Settings shared by every environment; see salon/settings/__init__.py.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from datetime import timedelta
+from decouple import config
+import dj_database_url
+
+
+# Determine if running on Render
+ON_RENDER = os.environ.get('RENDER', None) is not None
+
+# Determine environment
+ENVIRONMENT = config('ENVIRONMENT', default='development')
+
+# Build paths inside the project like this: BASE_DIR / 'subdir'.
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+
+# SECURITY WARNING: keep the secret key used in production secret!
+SECRET_KEY = config('SECRET_KEY', default='django-insecure-default-key-for-dev')
+
+# SECURITY WARNING: don't run with debug turned on in production!
+DEBUG = config('DEBUG', default=True, cast=bool)
+
+# Update ALLOWED_HOSTS based on environment
+if ENVIRONMENT == 'production' or ON_RENDER:
+    ALLOWED_HOSTS = config(
+        'ALLOWED_HOSTS', 
+        default='salon-backend-hl61.onrender.com,salon-frontend-4pst.onrender.com'
+    ).split(',')
+else:
+    ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1').split(',')
+
+# Application definition
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.auth',
+    'django.contrib.contenttypes',
+    'django.contrib.sessions',
+    'django.contrib.messages',
+    'django.contrib.staticfiles',
+
+    # Third party apps (media storage apps are added by salon.settings.media)
+    'rest_framework',
+    'rest_framework_simplejwt',
+    'rest_framework_simplejwt.token_blacklist',
+    'corsheaders',
+
+    # Local apps
+    'apps.users',
+    'apps.services',
+    'apps.bookings',
+    'apps.staff',
+    'apps.gallery',
+]
+
+MIDDLEWARE = [
+    'utils.middleware.RequestMetricsMiddleware',
+    'utils.middleware.ProfilingMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+ROOT_URLCONF = 'salon.urls'
+
+TEMPLATES = [
+    {
+        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'DIRS': [BASE_DIR / 'templates'],
+        'APP_DIRS': True,
+        'OPTIONS': {
+            'context_processors': [
+                'django.template.context_processors.debug',
+                'django.template.context_processors.request',
+                'django.contrib.auth.context_processors.auth',
+                'django.contrib.messages.context_processors.messages',
+            ],
+        },
+    },
+]
+
+WSGI_APPLICATION = 'salon.wsgi.application'
+ASGI_APPLICATION = 'salon.asgi.application'
+
+# 'wsgi' (gthread workers) or 'asgi' (uvicorn workers, async views for read-heavy endpoints)
+SERVER_MODE = config('SERVER_MODE', default='wsgi')
+
+# Database
+DATABASES = {
+    'default': dj_database_url.config(
+        default=config('DATABASE_URL', default=f'sqlite:///{BASE_DIR / "db.sqlite3"}'),
+        conn_max_age=600,
+        ssl_require=ENVIRONMENT == 'production' or ON_RENDER
+    )
+}
+
+# Pooled PostgreSQL connections (utils/db_pool). Connections go back to the pool
+# at the end of each request, so threads in a worker share a bounded set.
+DB_POOL = config('DB_POOL', default=False, cast=bool)
+if DB_POOL and DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    DATABASES['default']['ENGINE'] = 'utils.db_pool'
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['POOL'] = {
+        'MAX_SIZE': config('DB_POOL_MAX_SIZE', default=10, cast=int),
+        'TIMEOUT': config('DB_POOL_TIMEOUT', default=30, cast=float),
+        'MAX_LIFETIME': config('DB_POOL_MAX_LIFETIME', default=3600, cast=int),
+        'MAX_IDLE': config('DB_POOL_MAX_IDLE', default=600, cast=int),
+        'CHECK_INTERVAL': config('DB_POOL_CHECK_INTERVAL', default=30, cast=int),
+    }
+else:
+    DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+
+# Password validation
+AUTH_PASSWORD_VALIDATORS = [
+    {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.CommonPasswordValidator'},
+    {'NAME': 'django.contrib.auth.password_validation.NumericPasswordValidator'},
+]
+
+# Password hashing: the preferred hasher is used for new hashes, the rest
+# verify existing ones, which are upgraded on the next successful login.
+# Upgrading changes the stored hash and so revokes the user's other sessions
+# (CHECK_REVOKE_TOKEN), which is why scrypt/argon2 and cost changes are opt-in.
+PASSWORD_HASHER = config('PASSWORD_HASHER', default='pbkdf2')
+_PASSWORD_HASHERS = {
+    'scrypt': 'apps.users.hashers.TunedScryptPasswordHasher',
+    'argon2': 'apps.users.hashers.TunedArgon2PasswordHasher',  # requires argon2-cffi
+    'pbkdf2': 'apps.users.hashers.TunedPBKDF2PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    hasher for name, hasher in _PASSWORD_HASHERS.items()
+    if name != PASSWORD_HASHER
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+PASSWORD_SCRYPT_WORK_FACTOR = config('PASSWORD_SCRYPT_WORK_FACTOR', default=2 ** 14, cast=int)
+PASSWORD_SCRYPT_BLOCK_SIZE = config('PASSWORD_SCRYPT_BLOCK_SIZE', default=8, cast=int)
+PASSWORD_SCRYPT_PARALLELISM = config('PASSWORD_SCRYPT_PARALLELISM', default=1, cast=int)
+PASSWORD_ARGON2_TIME_COST = config('PASSWORD_ARGON2_TIME_COST', default=2, cast=int)
+PASSWORD_ARGON2_MEMORY_COST = config('PASSWORD_ARGON2_MEMORY_COST', default=102400, cast=int)
+PASSWORD_ARGON2_PARALLELISM = config('PASSWORD_ARGON2_PARALLELISM', default=8, cast=int)
+PASSWORD_PBKDF2_ITERATIONS = config('PASSWORD_PBKDF2_ITERATIONS', default=600000, cast=int)
+PASSWORD_HASH_WORKERS = config('PASSWORD_HASH_WORKERS', default=2, cast=int)
+
+AUTHENTICATION_BACKENDS = ['apps.users.backends.HashPoolModelBackend']
+
+# Internationalization
+LANGUAGE_CODE = 'en-us'
+TIME_ZONE = config('TIME_ZONE', default='America/New_York')
+USE_I18N = True
+USE_TZ = True
+
+# Static files
+STATIC_URL = 'static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
+STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
+# Media storage: 'cloudinary' or 'local' (files under MEDIA_ROOT, see salon.settings.media).
+# Cloudinary is the default whenever its credentials are set, so local runs,
+# management commands and tests work without them.
+MEDIA_BACKEND = config(
+    'MEDIA_BACKEND',
+    default='cloudinary' if config('CLOUDINARY_CLOUD_NAME', default='') else 'local'
+)
+
+# Gallery thumbnails: WebP renders that fit in a MEDIA_THUMBNAIL_SIZE pixel square,
+# generated in the background when an image is uploaded
+MEDIA_THUMBNAIL_SIZE = config('MEDIA_THUMBNAIL_SIZE', default=480, cast=int)
+MEDIA_THUMBNAIL_QUALITY = config('MEDIA_THUMBNAIL_QUALITY', default=80, cast=int)
+
+# Widths precomputed for responsive srcsets: Cloudinary transformation URLs, or
+# WebP renders next to the original with the local backend
+MEDIA_VARIANT_WIDTHS = [
+    int(width) for width in config('MEDIA_VARIANT_WIDTHS', default='320,640,1024,1600').split(',')
+]
+
+# Default primary key field type
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Custom User Model
+AUTH_USER_MODEL = 'users.User'
+
+# Cache, shared by every worker: token validation state and reports are
+# invalidated by whichever process made the change, so a per-process cache
+# would keep serving stale data elsewhere. REDIS_URL selects Redis; otherwise
+# the database table created by `manage.py createcachetable` is used.
+REDIS_URL = config('REDIS_URL', default='')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'django_cache',
+        }
+    }
+
+# REST Framework
+# Stateless JWT auth validates tokens against a short-lived cache instead of loading the user
+STATELESS_JWT_AUTH = config('STATELESS_JWT_AUTH', default=True, cast=bool)
+AUTH_USER_STATE_CACHE_TIMEOUT = config('AUTH_USER_STATE_CACHE_TIMEOUT', default=60, cast=int)
+LAST_LOGIN_FLUSH_INTERVAL = config('LAST_LOGIN_FLUSH_INTERVAL', default=30, cast=int)
+
+# Lists larger than this report the PostgreSQL planner's row estimate instead of an exact count
+ESTIMATED_COUNT_THRESHOLD = config('ESTIMATED_COUNT_THRESHOLD', default=10000, cast=int)
+
+# Background tasks (utils.tasks): emails and rollups run on a thread pool of this
+# size; eager mode runs them inline, for management commands and benchmarks
+BACKGROUND_TASK_WORKERS = config('BACKGROUND_TASK_WORKERS', default=4, cast=int)
+BACKGROUND_TASKS_EAGER = config('BACKGROUND_TASKS_EAGER', default=False, cast=bool)
+
+REST_FRAMEWORK = {
+    'DEFAULT_AUTHENTICATION_CLASSES': (
+        'apps.users.authentication.StatelessJWTAuthentication'
+        if STATELESS_JWT_AUTH else
+        'rest_framework_simplejwt.authentication.JWTAuthentication',
+    ),
+    'DEFAULT_PERMISSION_CLASSES': (
+        'rest_framework.permissions.IsAuthenticatedOrReadOnly',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'utils.pagination.EstimatedCountPagination',
+    'PAGE_SIZE': 20,
+}
+
+# JWT Settings
+SIMPLE_JWT = {
+    'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
+    'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
+    'ROTATE_REFRESH_TOKENS': True,
+    'BLACKLIST_AFTER_ROTATION': True,
+    'UPDATE_LAST_LOGIN': False,  # batched by apps.users.services.record_login
+
+    'ALGORITHM': 'HS256',
+    'SIGNING_KEY': SECRET_KEY,
+    'AUTH_HEADER_TYPES': ('Bearer',),
+    'USER_ID_FIELD': 'id',
+    'USER_ID_CLAIM': 'user_id',
+    'CHECK_REVOKE_TOKEN': True,
+
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.users.serializers.CustomTokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.users.serializers.CustomTokenRefreshSerializer',
+}
+
+# CORS Settings
+if ENVIRONMENT == 'production' or ON_RENDER:
+    CORS_ALLOWED_ORIGINS = config(
+        'CORS_ALLOWED_ORIGINS', 
+        default='https://salon-frontend-4pst.onrender.com,https://salon-backend-hl61.onrender.com'
+    ).split(',')
+else:
+    CORS_ALLOWED_ORIGINS = config(
+        'CORS_ALLOWED_ORIGINS', 
+        default='http://localhost:3000,http://127.0.0.1:3000'
+    ).split(',')
+
+CORS_ALLOW_CREDENTIALS = True
+
+# Email settings
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='smtp.gmail.com')
+EMAIL_PORT = config('EMAIL_PORT', default=587, cast=int)
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
+EMAIL_HOST_USER = config('EMAIL_HOST_USER', default='')
+EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD', default='')
+DEFAULT_FROM_EMAIL = config('DEFAULT_FROM_EMAIL', default='noreply@virginiahairbraider.com')
+
+# Site info
+SITE_NAME = config('SITE_NAME', default='Virginia Hair Braider')
+SITE_URL = config('SITE_URL', default='https://salon-frontend-4pst.onrender.com')
+CONTACT_EMAIL = config('CONTACT_EMAIL', default='berthaajohn151@gmail.com')
+
+# Reports for fully closed periods are cached for this many seconds
+REPORT_CACHE_TIMEOUT = config('REPORT_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int)
+
+# Per-endpoint request metrics (served at /api/metrics/) and slow request logging
+REQUEST_METRICS_ENABLED = config('REQUEST_METRICS_ENABLED', default=True, cast=bool)
+SLOW_REQUEST_THRESHOLD_MS = config('SLOW_REQUEST_THRESHOLD_MS', default=500, cast=int)
+SLOW_REQUEST_LOG_QUERIES = config('SLOW_REQUEST_LOG_QUERIES', default=3, cast=int)
+
+# Request profiling, off by default. When enabled, one in PROFILING_SAMPLE_RATE
+# requests (0 = none) and requests with a signed PROFILING_HEADER from
+# /api/profiles/token/ are profiled; admins download them from /api/profiles/.
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_SAMPLE_RATE = config('PROFILING_SAMPLE_RATE', default=0, cast=int)
+PROFILING_HEADER = 'X-Profile'
+PROFILING_TOKEN_MAX_AGE = config('PROFILING_TOKEN_MAX_AGE', default=60 * 60, cast=int)
+PROFILER = config('PROFILER', default='cprofile')  # or 'pyinstrument', if installed
+PROFILING_INTERVAL = config('PROFILING_INTERVAL', default=0.001, cast=float)  # pyinstrument sampling, seconds
+PROFILING_DIR = config('PROFILING_DIR', default=os.path.join(tempfile.gettempdir(), 'salon-profiles'))
+PROFILING_MAX_FILES = config('PROFILING_MAX_FILES', default=200, cast=int)
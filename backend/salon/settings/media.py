@@ -0,0 +1,28 @@
+"""
+Media storage for the configured MEDIA_BACKEND.
+"""
+
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+from .base import BASE_DIR, INSTALLED_APPS, MEDIA_BACKEND
+
+if MEDIA_BACKEND == 'cloudinary':
+    # The SDK is configured from these credentials in ServicesConfig.ready(),
+    # so loading settings imports nothing from cloudinary
+    INSTALLED_APPS = INSTALLED_APPS + ['cloudinary', 'cloudinary_storage']
+    
+    CLOUDINARY_STORAGE = {
+        'CLOUD_NAME': config('CLOUDINARY_CLOUD_NAME'),
+        'API_KEY': config('CLOUDINARY_API_KEY'),
+        'API_SECRET': config('CLOUDINARY_API_SECRET'),
+    }
+    
+    DEFAULT_FILE_STORAGE = 'cloudinary_storage.storage.MediaCloudinaryStorage'
+elif MEDIA_BACKEND == 'local':
+    MEDIA_URL = '/media/'
+    MEDIA_ROOT = BASE_DIR / 'media'
+    # Serve MEDIA_ROOT from Django itself when DEBUG is off, for offline
+    # deployments with no web server or CDN in front
+    MEDIA_SERVE = config('MEDIA_SERVE', default=False, cast=bool)
+else:
+    raise ImproperlyConfigured(f"Unknown MEDIA_BACKEND '{MEDIA_BACKEND}', use 'cloudinary' or 'local'")
@@ -0,0 +1,59 @@
+"""
+Production hardening, applied on top of base when ENVIRONMENT is
+'production' or the app runs on Render.
+"""
+
+from decouple import config
+from django.core.exceptions import ImproperlyConfigured
+from .base import MEDIA_BACKEND
+
+# MEDIA_BACKEND falls back to local when the Cloudinary credentials are missing,
+# which on Render would write uploads to the ephemeral disk. Fail the deploy
+# instead, unless local media is asked for on purpose and served by Django.
+if MEDIA_BACKEND == 'local' and not config('MEDIA_SERVE', default=False, cast=bool):
+    raise ImproperlyConfigured(
+        "Media would be stored on the local disk in production. Set the CLOUDINARY_* "
+        "credentials, or MEDIA_BACKEND=local with MEDIA_SERVE=true for a deployment "
+        "with persistent storage."
+    )
+
+# Security settings
+SECURE_SSL_REDIRECT = True
+SESSION_COOKIE_SECURE = True
+CSRF_COOKIE_SECURE = True
+SECURE_BROWSER_XSS_FILTER = True
+SECURE_CONTENT_TYPE_NOSNIFF = True
+SECURE_HSTS_SECONDS = 31536000  # 1 year
+SECURE_HSTS_INCLUDE_SUBDOMAINS = True
+SECURE_HSTS_PRELOAD = True
+X_FRAME_OPTIONS = 'DENY'
+
+# Debug should be False in production
+DEBUG = config('DEBUG', default=False, cast=bool)
+
+# Logging
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'salon.requests': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
@@ -1,8 +1,10 @@
+import re
+
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path, include, re_path
 from django.http import JsonResponse
 from django.conf import settings
-from django.conf.urls.static import static
+from django.views.static import serve
 
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,
@@ -10,7 +12,8 @@ from rest_framework_simplejwt.views import (
     TokenVerifyView,
 )
 
-from apps.bookings.views import DashboardStatsView
+from apps.bookings.views import DashboardStatsView, RevenueReportView, ExportView
+from utils.views import MetricsView, ProfileDownloadView, ProfileListView, ProfileTokenView
 
 
 def api_root(request):
@@ -26,6 +29,9 @@ def api_root(request):
             'bookings': '/api/bookings/',
             'gallery': '/api/gallery/',
             'dashboard_stats': '/api/dashboard/stats/',
+            'revenue_report': '/api/reports/revenue/',
+            'exports': '/api/reports/export/<appointments|payments>/',
+            'metrics': '/api/metrics/',
             'admin': '/admin/',
         },
         'contact': {
@@ -50,6 +56,16 @@ urlpatterns = [
     # Dashboard
     path('api/dashboard/stats/', DashboardStatsView.as_view(), name='dashboard-stats'),
 
+    # Reports
+    path('api/reports/revenue/', RevenueReportView.as_view(), name='revenue-report'),
+    path('api/reports/export/<str:kind>/', ExportView.as_view(), name='report-export'),
+
+    # Monitoring
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
+    path('api/profiles/', ProfileListView.as_view(), name='profile-list'),
+    path('api/profiles/token/', ProfileTokenView.as_view(), name='profile-token'),
+    path('api/profiles/<str:name>/', ProfileDownloadView.as_view(), name='profile-download'),
+
     # App APIs
     path('api/auth/', include('apps.users.urls')),
     path('api/services/', include('apps.services.urls')),
@@ -58,6 +74,25 @@ urlpatterns = [
     path('api/gallery/', include('apps.gallery.urls')),
 ]
 
-# Media files (development only)
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+# ASGI mode: async versions of read-heavy endpoints take precedence over the DRF views
+if settings.SERVER_MODE == 'asgi':
+    from apps.bookings import async_views as booking_async_views
+    from apps.services import async_views as service_async_views
+
+    urlpatterns = [
+        path('api/dashboard/stats/', booking_async_views.dashboard_stats, name='dashboard-stats-async'),
+        path('api/bookings/availability/check/', booking_async_views.availability_check,
+             name='availability-check-async'),
+        path('api/services/categories_with_services/', service_async_views.categories_with_services,
+             name='categories-with-services-async'),
+    ] + urlpatterns
+
+# Local media files (development, or MEDIA_SERVE for offline deployments)
+if settings.MEDIA_BACKEND == 'local' and (settings.DEBUG or settings.MEDIA_SERVE):
+    urlpatterns += [
+        re_path(
+            r'^%s(?P<path>.*)$' % re.escape(settings.MEDIA_URL.lstrip('/')),
+            serve,
+            {'document_root': settings.MEDIA_ROOT},
+        ),
+    ]
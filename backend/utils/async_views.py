@@ -0,0 +1,56 @@
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from rest_framework import exceptions
+from rest_framework.settings import api_settings
+
+
+def json_response(data, status=200):
+    return JsonResponse(data, status=status, safe=False, encoder=DjangoJSONEncoder)
+
+
+async def authenticate(request):
+    """
+    Run the configured DRF authentication classes for a plain async view.
+    
+    Returns the user, or None for anonymous requests. Raises
+    AuthenticationFailed for invalid credentials, like DRF does.
+    """
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = await sync_to_async(authentication_class().authenticate)(request)
+        if result is not None:
+            return result[0]
+    return None
+
+
+def async_api_view(methods=('GET',), authenticated=False):
+    """
+    Decorator for async JSON endpoints served under ASGI.
+    
+    DRF views are synchronous, so these views use Django's async ORM directly
+    and only borrow DRF's authentication classes and error format. The
+    authenticated user is set on request.user.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method not in methods:
+                return json_response(
+                    {'detail': f'Method "{request.method}" not allowed.'}, status=405
+                )
+            
+            try:
+                request.user = await authenticate(request)
+            except exceptions.AuthenticationFailed as e:
+                data = e.detail if isinstance(e.detail, (list, dict)) else {'detail': e.detail}
+                return json_response(data, status=e.status_code)
+            
+            if authenticated and request.user is None:
+                return json_response(
+                    {'detail': 'Authentication credentials were not provided.'}, status=401
+                )
+            return await view(request, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+from collections import namedtuple
+from django.db import models, transaction
+
+UpsertResult = namedtuple('UpsertResult', ['created', 'updated', 'unchanged', 'pks'])
+
+
+def _normalize(model, row):
+    """Map a row of field names to attnames with values cleaned by the model fields."""
+    values = {}
+    for name, value in row.items():
+        field = model._meta.get_field(name)
+        if field.is_relation:
+            values[field.attname] = value.pk if isinstance(value, models.Model) else value
+        else:
+            values[field.attname] = field.to_python(value)
+    return values
+
+
+def _attnames(model, names):
+    return [model._meta.get_field(name).attname for name in names]
+
+
+def bulk_upsert(model, rows, unique_fields, update_fields=(), batch_size=500):
+    """
+    Insert or update rows (dicts of field values) keyed by unique_fields.
+    
+    Existing rows are read with one query and compared in memory, so rows
+    that already match are not written at all. New and changed rows go out
+    in a single bulk_create(update_conflicts=True), which needs a unique
+    constraint over unique_fields. With no update_fields, existing rows are
+    left alone and only missing ones are inserted, which needs no constraint.
+    
+    Returns UpsertResult with the counts and {key: pk} for every row, where
+    key is the tuple of unique field values (a plain value for one field).
+    """
+    meta = model._meta
+    key_attnames = _attnames(model, unique_fields)
+    update_attnames = _attnames(model, update_fields)
+    single_key = len(key_attnames) == 1
+    
+    def make_key(values):
+        return values[key_attnames[0]] if single_key else tuple(values[name] for name in key_attnames)
+    
+    wanted = {}
+    for row in rows:
+        values = _normalize(model, row)
+        wanted[make_key(values)] = values
+    if not wanted:
+        return UpsertResult(0, 0, 0, {})
+    
+    # One query: filter on the first key field, match the full key in memory
+    first_values = {values[key_attnames[0]] for values in wanted.values()}
+    existing = {
+        make_key(values): values
+        for values in model._base_manager.filter(
+            **{f'{key_attnames[0]}__in': first_values}
+        ).values(meta.pk.attname, *key_attnames, *update_attnames)
+    }
+    
+    created = []
+    changed = []
+    pks = {}
+    for key, values in wanted.items():
+        current = existing.get(key)
+        if current is None:
+            created.append(model(**values))
+            continue
+        pks[key] = current[meta.pk.attname]
+        if any(name in values and values[name] != current[name] for name in update_attnames):
+            changed.append(model(**values))
+    
+    with transaction.atomic(using=model._base_manager.db):
+        if changed:
+            # Keep auto_now timestamps moving on updated rows
+            auto_now = [
+                field.name for field in meta.concrete_fields
+                if getattr(field, 'auto_now', False) and field.name not in update_fields
+            ]
+            # Changed rows conflict on the unique key and are updated in place
+            model._base_manager.bulk_create(
+                created + changed,
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=list(unique_fields),
+                update_fields=list(update_fields) + auto_now,
+            )
+        elif created:
+            model._base_manager.bulk_create(created, batch_size=batch_size)
+    
+    new_keys = set()
+    for obj in created:
+        key = make_key({name: getattr(obj, name) for name in key_attnames})
+        if obj.pk is None:
+            new_keys.add(key)
+        else:
+            pks[key] = obj.pk
+    
+    if new_keys:
+        # PKs aren't returned for upserts, nor for inserts on every backend
+        new_first = {key if single_key else key[0] for key in new_keys}
+        for values in model._base_manager.filter(
+            **{f'{key_attnames[0]}__in': new_first}
+        ).values(meta.pk.attname, *key_attnames):
+            key = make_key(values)
+            if key in new_keys:
+                pks[key] = values[meta.pk.attname]
+    
+    return UpsertResult(len(created), len(changed), len(wanted) - len(created) - len(changed), pks)
@@ -0,0 +1,84 @@
+"""
+PostgreSQL backend that checks connections out of a per-process pool.
+
+Enable with ENGINE 'utils.db_pool' and an optional 'POOL' dict in the
+database settings (MAX_SIZE, TIMEOUT, MAX_LIFETIME, MAX_IDLE,
+CHECK_INTERVAL). CONN_MAX_AGE should be 0: Django then "closes" the
+connection at the end of every request, which returns it to the pool, so
+threads in a worker share a bounded set of healthy connections.
+"""
+import threading
+
+from django.db import connections
+from django.db.backends.postgresql.base import DatabaseWrapper as PostgresDatabaseWrapper
+
+from .pool import ConnectionPool
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+# Connections inherited from the parent process, kept referenced so that
+# garbage collection never closes them (see detach_inherited_connections)
+_inherited = []
+
+
+def close_pools():
+    """
+    Close idle pooled connections, e.g. in the parent before forking workers.
+    
+    Connections still checked out are closed when they are returned, and
+    new checkouts get a fresh pool.
+    """
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def detach_inherited_connections():
+    """
+    Forget the connections a forked child inherited, without closing them.
+    
+    Their sockets are shared with the parent, and closing one would end the
+    parent's session. They are set aside, never used or closed, and the
+    child opens its own connections and pools.
+    """
+    with _pools_lock:
+        _inherited.extend(_pools.values())
+        _pools.clear()
+    for connection in connections.all(initialized_only=True):
+        if connection.connection is not None:
+            _inherited.append(connection.connection)
+            connection.connection = None
+
+
+class DatabaseWrapper(PostgresDatabaseWrapper):
+    
+    def _get_pool(self):
+        pool = _pools.get(self.alias)
+        if pool is None:
+            with _pools_lock:
+                pool = _pools.get(self.alias)
+                if pool is None:
+                    options = self.settings_dict.get('POOL', {})
+                    pool = ConnectionPool(
+                        max_size=options.get('MAX_SIZE', 10),
+                        timeout=options.get('TIMEOUT', 30),
+                        max_lifetime=options.get('MAX_LIFETIME', 3600),
+                        max_idle=options.get('MAX_IDLE', 600),
+                        check_interval=options.get('CHECK_INTERVAL', 30),
+                    )
+                    _pools[self.alias] = pool
+        return pool
+    
+    def get_new_connection(self, conn_params):
+        # Remember the pool: after close_pools() the connection goes back to
+        # (and is closed by) the pool it came from, not a fresh one
+        self._pool = self._get_pool()
+        return self._pool.getconn(lambda: super(DatabaseWrapper, self).get_new_connection(conn_params))
+    
+    def _close(self):
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.putconn(self.connection)
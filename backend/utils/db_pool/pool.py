@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+from collections import deque
+
+from psycopg2 import extensions
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection became available within the pool timeout."""
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of psycopg2 connections.
+    
+    Connections are opened lazily up to max_size. On checkout a connection
+    older than max_lifetime is replaced, and one idle for longer than
+    check_interval is health-checked with SELECT 1 first. On return, open
+    transactions are rolled back and broken connections are discarded.
+    """
+    
+    def __init__(self, max_size=10, timeout=30, max_lifetime=3600, max_idle=600, check_interval=30):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.check_interval = check_interval
+        
+        self._idle = deque()  # (connection, created, last_used)
+        self._created = {}
+        self._size = 0
+        self._closed = False
+        self._condition = threading.Condition()
+    
+    @property
+    def size(self):
+        return self._size
+    
+    @property
+    def idle(self):
+        return len(self._idle)
+    
+    def getconn(self, connect):
+        """Return an idle connection, or one opened with connect() if below max_size."""
+        deadline = time.monotonic() + self.timeout
+        while True:
+            with self._condition:
+                if self._idle:
+                    connection, created, last_used = self._idle.pop()
+                elif self._size < self.max_size:
+                    self._size += 1
+                    connection = None
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolTimeout(f"No database connection available after {self.timeout}s")
+                    self._condition.wait(remaining)
+                    continue
+            
+            if connection is None:
+                return self._open(connect)
+            
+            now = time.monotonic()
+            if now - created > self.max_lifetime or now - last_used > self.max_idle:
+                self._discard(connection)
+                continue
+            if now - last_used > self.check_interval and not self._is_healthy(connection):
+                self._discard(connection)
+                continue
+            return connection
+    
+    def putconn(self, connection):
+        if not connection.closed:
+            try:
+                if connection.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                    connection.rollback()
+            except Exception:
+                logger.warning("Discarding database connection that failed to reset", exc_info=True)
+        
+        created = self._created.get(id(connection), 0)
+        if self._closed or connection.closed or time.monotonic() - created > self.max_lifetime:
+            self._discard(connection)
+            return
+        
+        with self._condition:
+            self._idle.append((connection, created, time.monotonic()))
+            self._condition.notify()
+    
+    def close(self):
+        """Close all idle connections; checked-out ones close when returned."""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for connection, _, _ in idle:
+            self._discard(connection)
+    
+    def _open(self, connect):
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        self._created[id(connection)] = time.monotonic()
+        return connection
+    
+    def _discard(self, connection):
+        self._created.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+    
+    def _is_healthy(self, connection):
+        if connection.closed:
+            return False
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if connection.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except Exception:
+            return False
+        return True
@@ -11,8 +11,8 @@ def send_email(subject, message, recipient_list, html_message=None, from_email=N
         from_email = settings.DEFAULT_FROM_EMAIL
     
     if html_message:
-        # Create text version from HTML
-        text_message = strip_tags(html_message)
+        # Plain text version: the .txt template, or the HTML with its tags stripped
+        text_message = message or strip_tags(html_message)
         
         email = EmailMultiAlternatives(
             subject=subject,
@@ -1,3 +1,4 @@
+import heapq
 import json
 import random
 import string
@@ -70,6 +71,53 @@ def get_time_slots(start_time, end_time, interval_minutes=15):
     return slots
 
 
+def build_time_slots(target_date, windows, booked, duration_minutes):
+    """
+    Split availability windows into back-to-back slots of duration_minutes.
+    
+    windows and booked are iterables of (start_time, end_time); a slot is
+    available when it overlaps none of the booked ranges. Pure function, so
+    callers fetch both lists once instead of querying per slot.
+    
+    Slots and bookings are swept in start order, keeping a heap of the end
+    times of bookings that have started, so the cost is O((slots + bookings)
+    log bookings) rather than slots x bookings.
+    """
+    booked = sorted(booked)
+    duration = timedelta(minutes=duration_minutes)
+    slots = []
+    active_ends = []
+    next_booking = 0
+    
+    for window_start, window_end in sorted(windows):
+        if slots and window_start < slots[-1]['start_time']:
+            # Overlapping windows go back in time; restart the sweep
+            active_ends = []
+            next_booking = 0
+        
+        current_time = window_start
+        while current_time < window_end:
+            end_slot = (datetime.combine(target_date, current_time) + duration).time()
+            # A slot that would run past midnight wraps around; stop there
+            if end_slot <= current_time or end_slot > window_end:
+                break
+            
+            while next_booking < len(booked) and booked[next_booking][0] < end_slot:
+                heapq.heappush(active_ends, booked[next_booking][1])
+                next_booking += 1
+            while active_ends and active_ends[0] <= current_time:
+                heapq.heappop(active_ends)
+            
+            slots.append({
+                'start_time': current_time,
+                'end_time': end_slot,
+                'is_available': not active_ends,
+            })
+            current_time = end_slot
+    
+    return slots
+
+
 def get_week_dates(start_date=None):
     """Get dates for the current week."""
     if not start_date:
@@ -0,0 +1,231 @@
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from utils.tasks import enqueue
+
+THUMBNAIL_FORMAT = 'WEBP'
+THUMBNAIL_EXTENSION = 'webp'
+
+# Models whose image_variants cache is kept up to date, and the image field it is built from
+IMAGE_VARIANT_FIELDS = {
+    'services.Service': 'image',
+    'staff.Staff': 'photo',
+    'gallery.GalleryImage': 'image',
+}
+
+
+def variant_name(name, suffix='', extension=THUMBNAIL_EXTENSION):
+    """File name for a rendition of `name`, e.g. gallery/braids.jpg -> braids-480.webp."""
+    stem = PurePosixPath(name).stem
+    return f"{stem}-{suffix}.{extension}" if suffix else f"{stem}.{extension}"
+
+
+def _load_image(field_file, size):
+    """
+    Open a stored image upright and return it with its full-size width.
+    
+    Works through the file's storage, so the source can be local or on
+    Cloudinary. JPEGs are decoded at a reduced scale that still covers
+    size x size, and the EXIF orientation is applied so phone photos
+    aren't shown sideways.
+    """
+    field_file.open('rb')
+    try:
+        with Image.open(field_file) as opened:
+            full_width = opened.width
+            opened.draft('RGB', (size, size))
+            scale = full_width / opened.width
+            image = ImageOps.exif_transpose(opened)
+    finally:
+        field_file.close()
+    
+    return image, round(image.width * scale)
+
+
+def _encode(image, quality, image_format=THUMBNAIL_FORMAT):
+    has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+    
+    output = BytesIO()
+    image.save(output, format=image_format, quality=quality)
+    return ContentFile(output.getvalue())
+
+
+def render_image(field_file, size, quality=None, image_format=THUMBNAIL_FORMAT):
+    """
+    Render a stored image scaled down to fit in a size x size square.
+    
+    Returns a ContentFile ready for FieldFile.save() or storage.save().
+    """
+    quality = quality or settings.MEDIA_THUMBNAIL_QUALITY
+    image, _full_width = _load_image(field_file, size)
+    image.thumbnail((size, size), Image.LANCZOS)
+    return _encode(image, quality, image_format)
+
+
+def save_thumbnail(source, target, size=None, quality=None):
+    """
+    Render `source` (an image FieldFile) as a WebP thumbnail into the `target`
+    FieldFile's storage and upload_to, without saving the model.
+    
+    Returns the stored name.
+    """
+    size = size or settings.MEDIA_THUMBNAIL_SIZE
+    content = render_image(source, size, quality)
+    target.save(variant_name(source.name), content, save=False)
+    return target.name
+
+
+def variants_source(value):
+    """The stored reference an image_variants cache was built from ('' for no image)."""
+    if not value:
+        return ''
+    if isinstance(value, str):
+        # CloudinaryField assigned a public ID directly
+        return value
+    if hasattr(value, 'get_prep_value'):
+        # CloudinaryField resource: public ID with version and format
+        return value.get_prep_value() or ''
+    return value.name or ''
+
+
+def _cloudinary_widths(value, widths):
+    """Transformation URLs; Cloudinary resizes (never upscales) and picks the format on first request."""
+    import cloudinary
+    
+    if not cloudinary.config().cloud_name:
+        return {}
+    if not isinstance(value, cloudinary.CloudinaryResource):
+        # ImageField on MediaCloudinaryStorage: the stored name is the public ID
+        value = cloudinary.CloudinaryResource(value.name, default_resource_type='image')
+    return {
+        width: value.build_url(width=width, crop='limit', quality='auto', fetch_format='auto')
+        for width in widths
+    }
+
+
+def _rendered_widths(field_file, widths, quality):
+    """
+    WebP renders saved next to the original, plus the original itself when
+    it is small enough. Returns ({width: url}, [stored render names]).
+    """
+    image, full_width = _load_image(field_file, max(widths))
+    source = PurePosixPath(field_file.name)
+    # Keep the source's extension in the name (braids.jpg -> braids-jpg-320.webp) so
+    # braids.png doesn't share it; storage.save() picks a free name for anything else
+    stem = f"{source.stem}-{source.suffix.lstrip('.')}" if source.suffix else source.stem
+    urls = {}
+    files = []
+    for width in widths:
+        if width >= full_width:
+            continue
+        height = max(1, round(image.height * width / image.width))
+        content = _encode(image.resize((width, height), Image.LANCZOS), quality)
+        name = field_file.storage.save(str(source.parent / 'variants' / f"{stem}-{width}.{THUMBNAIL_EXTENSION}"), content)
+        files.append(name)
+        urls[width] = field_file.storage.url(name)
+    if full_width <= max(widths):
+        urls[full_width] = field_file.url
+    return urls, files
+
+
+def build_image_variants(value, widths=None, quality=None):
+    """
+    Build the image_variants cache for an image field value.
+    
+    Returns {'source', 'widths': {width: url}, 'srcset'} (plus 'files' for
+    local renders) so serializers can
+    hand out a srcset without touching storage or Cloudinary per request.
+    CloudinaryField values and Cloudinary-stored files get transformation
+    URLs; local files are rendered with Pillow, which is slow enough that
+    this runs as a background task (see queue_image_variants).
+    """
+    source = variants_source(value)
+    if not source:
+        return {}
+    
+    widths = sorted(widths or settings.MEDIA_VARIANT_WIDTHS)
+    quality = quality or settings.MEDIA_THUMBNAIL_QUALITY
+    files = []
+    if hasattr(value, 'get_prep_value') or settings.MEDIA_BACKEND == 'cloudinary':
+        urls = _cloudinary_widths(value, widths)
+    else:
+        urls, files = _rendered_widths(value, widths, quality)
+    
+    variants = {
+        'source': source,
+        'widths': {str(width): url for width, url in sorted(urls.items())},
+        'srcset': ', '.join(f"{url} {width}w" for width, url in sorted(urls.items())),
+    }
+    if files:
+        # Rendered files this object owns, removed when it is rebuilt
+        variants['files'] = files
+    return variants
+
+
+def image_variants_stale(instance, field_name):
+    return (instance.image_variants or {}).get('source', '') != variants_source(getattr(instance, field_name))
+
+
+def refresh_image_variants(model_label, pk, force=False):
+    """
+    Rebuild and store one object's image_variants.
+    
+    The cache is only written if the image wasn't replaced meanwhile, and
+    with update() so neither signals nor auto_now fields fire. Returns the
+    new cache, or None if there was nothing to do.
+    """
+    model = apps.get_model(model_label)
+    field_name = IMAGE_VARIANT_FIELDS[model_label]
+    instance = model._base_manager.filter(pk=pk).only('pk', field_name, 'image_variants').first()
+    if instance is None or not (force or image_variants_stale(instance, field_name)):
+        return None
+    
+    field_file = getattr(instance, field_name)
+    variants = build_image_variants(field_file)
+    queryset = model._base_manager.filter(pk=pk)
+    if variants:
+        queryset = queryset.filter(**{field_name: variants['source']})
+    updated = queryset.update(image_variants=variants)
+    
+    # Only ever delete renders recorded in this object's own cache: the old
+    # ones once replaced, or the new ones if the image changed meanwhile
+    new_files = variants.get('files', [])
+    if updated:
+        stale_files = [name for name in (instance.image_variants or {}).get('files', []) if name not in new_files]
+    else:
+        stale_files = new_files
+    storage = model._meta.get_field(field_name).storage if stale_files else None
+    for name in stale_files:
+        storage.delete(name)
+    return variants if updated else None
+
+
+def queue_image_variants(instance, update_fields=None):
+    """post_save hook: rebuild the variants in the background once a new image is committed."""
+    model_label = instance._meta.label
+    field_name = IMAGE_VARIANT_FIELDS[model_label]
+    if update_fields is not None and field_name not in update_fields:
+        return
+    
+    if image_variants_stale(instance, field_name):
+        pk = instance.pk
+        transaction.on_commit(lambda: enqueue(refresh_image_variants, model_label, pk))
+
+
+def srcset(variants, request=None):
+    """The cached srcset, with absolute URLs for locally served media when there is a request."""
+    if not variants:
+        return ''
+    if request is None or not settings.MEDIA_URL.startswith('/'):
+        return variants['srcset']
+    return ', '.join(
+        f"{request.build_absolute_uri(url)} {width}w" for width, url in variants['widths'].items()
+    )
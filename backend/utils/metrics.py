@@ -0,0 +1,177 @@
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from django.db.backends.signals import connection_created
+
+# Upper bounds of the histogram buckets, per metric
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS = (
+    # (attribute, metric name, help, buckets)
+    ('duration', 'salon_request_duration_seconds', 'Wall time per request', DURATION_BUCKETS),
+    ('db_duration', 'salon_request_db_duration_seconds', 'Time spent in SQL per request', DURATION_BUCKETS),
+    ('queries', 'salon_request_queries', 'SQL queries per request', QUERY_COUNT_BUCKETS),
+    ('response_size', 'salon_response_size_bytes', 'Response body size', SIZE_BUCKETS),
+)
+
+_current_recorder = ContextVar('query_recorder', default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+    
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+    
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+    
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self):
+        total = 0
+        for bound, count in zip(self.buckets + ('+Inf',), self.counts):
+            total += count
+            yield bound, total
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint request histograms for this process.
+    
+    Every gunicorn worker keeps its own registry, so a scrape reports only
+    the worker that served it.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._requests = {}
+    
+    def observe(self, endpoint, method, status, duration, db_duration, queries, response_size=None):
+        values = {
+            'duration': duration,
+            'db_duration': db_duration,
+            'queries': queries,
+            'response_size': response_size,
+        }
+        with self._lock:
+            key = (endpoint, method, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            
+            for attribute, _name, _help, buckets in METRICS:
+                if values[attribute] is None:
+                    continue
+                histogram = self._histograms.get((attribute, endpoint))
+                if histogram is None:
+                    histogram = self._histograms[(attribute, endpoint)] = Histogram(buckets)
+                histogram.observe(values[attribute])
+    
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._requests.clear()
+    
+    def render(self):
+        """Return all metrics in the Prometheus text exposition format."""
+        with self._lock:
+            lines = [
+                '# HELP salon_requests_total Requests served',
+                '# TYPE salon_requests_total counter',
+            ]
+            for (endpoint, method, status), count in sorted(self._requests.items()):
+                labels = _labels(endpoint=endpoint, method=method, status=status)
+                lines.append(f'salon_requests_total{{{labels}}} {count}')
+            
+            for attribute, name, help_text, _buckets in METRICS:
+                lines.append(f'# HELP {name} {help_text}')
+                lines.append(f'# TYPE {name} histogram')
+                series = sorted(
+                    (endpoint, histogram) for (metric, endpoint), histogram in self._histograms.items()
+                    if metric == attribute
+                )
+                for endpoint, histogram in series:
+                    for bound, total in histogram.cumulative():
+                        labels = _labels(endpoint=endpoint, le=bound)
+                        lines.append(f'{name}_bucket{{{labels}}} {total}')
+                    labels = _labels(endpoint=endpoint)
+                    lines.append(f'{name}_sum{{{labels}}} {histogram.sum:g}')
+                    lines.append(f'{name}_count{{{labels}}} {histogram.count}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(**labels):
+    return ','.join(
+        '{}="{}"'.format(key, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+        for key, value in labels.items()
+    )
+
+
+registry = MetricsRegistry()
+
+
+class QueryRecorder:
+    """Accumulates SQL count and time for one request, keeping the slowest statements."""
+    
+    def __init__(self, keep=3):
+        self.keep = keep
+        self.count = 0
+        self.duration = 0.0
+        self._slowest = []
+    
+    def record(self, sql, duration):
+        self.count += 1
+        self.duration += duration
+        entry = (duration, self.count, sql)
+        if len(self._slowest) < self.keep:
+            heapq.heappush(self._slowest, entry)
+        elif self.keep:
+            heapq.heappushpop(self._slowest, entry)
+    
+    @property
+    def slowest(self):
+        return [(duration, sql) for duration, _index, sql in sorted(self._slowest, reverse=True)]
+    
+    def start(self):
+        return _current_recorder.set(self)
+    
+    def stop(self, token):
+        _current_recorder.reset(token)
+
+
+def _record_query(execute, sql, params, many, context):
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        recorder.record(sql, time.perf_counter() - start)
+
+
+def install_query_recorder(connection, **kwargs):
+    """
+    Add the recording execute wrapper to a database connection.
+    
+    The wrapper is installed on every connection, in every thread, and finds
+    the active request through a context variable; that also covers the
+    async ORM, whose queries run in a worker thread with the request's context.
+    """
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+connection_created.connect(install_query_recorder, dispatch_uid='utils.metrics.install_query_recorder')
@@ -0,0 +1,141 @@
+import itertools
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+
+from .metrics import QueryRecorder, registry
+from .profiling import check_profile_token, get_profiler, save_profile
+
+logger = logging.getLogger('salon.requests')
+
+
+class RequestMetricsMiddleware:
+    """
+    Record wall time, SQL time, query count and response size per endpoint.
+    
+    Requests are keyed by resolved URL name, so /api/bookings/appointments/1/
+    and /api/bookings/appointments/2/ share a series. Requests slower than
+    SLOW_REQUEST_THRESHOLD_MS are logged with their slowest SQL. Streaming
+    responses are measured up to the point the response is returned.
+    """
+    
+    sync_capable = True
+    async_capable = True
+    
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        
+        self.get_response = get_response
+        self.slow_threshold = settings.SLOW_REQUEST_THRESHOLD_MS / 1000
+        self.slow_queries = settings.SLOW_REQUEST_LOG_QUERIES
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+    
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        
+        recorder = QueryRecorder(keep=self.slow_queries)
+        token = recorder.start()
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            recorder.stop(token)
+        self.record(request, response, time.perf_counter() - start, recorder)
+        return response
+    
+    async def __acall__(self, request):
+        recorder = QueryRecorder(keep=self.slow_queries)
+        token = recorder.start()
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            recorder.stop(token)
+        self.record(request, response, time.perf_counter() - start, recorder)
+        return response
+    
+    def record(self, request, response, duration, recorder):
+        match = getattr(request, 'resolver_match', None)
+        endpoint = (match.view_name or match._func_path) if match else 'unresolved'
+        size = None if response.streaming else len(response.content)
+        
+        registry.observe(
+            endpoint,
+            request.method,
+            response.status_code,
+            duration,
+            recorder.duration,
+            recorder.count,
+            size
+        )
+        
+        if duration >= self.slow_threshold:
+            slowest = ''.join(
+                f'\n  {query_duration * 1000:.1f}ms: {sql}' for query_duration, sql in recorder.slowest
+            )
+            logger.warning(
+                "Slow request %s %s (%s) %s: %.0fms, %d queries in %.0fms%s",
+                request.method,
+                request.path,
+                endpoint,
+                response.status_code,
+                duration * 1000,
+                recorder.count,
+                recorder.duration * 1000,
+                slowest
+            )
+
+
+class ProfilingMiddleware:
+    """
+    Profile one in PROFILING_SAMPLE_RATE requests, or any request carrying a
+    valid signed PROFILING_HEADER, and store the result for admins.
+    
+    Disabled unless PROFILING_ENABLED is set, in which case Django drops the
+    middleware at startup and it costs nothing per request. Profiled
+    responses carry the stored file name in X-Profile-Id. Only the thread
+    running the middleware is profiled, so under ASGI async views are not
+    covered.
+    """
+    
+    def __init__(self, get_response):
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        
+        self.get_response = get_response
+        self.sample_rate = settings.PROFILING_SAMPLE_RATE
+        self.header = 'HTTP_' + settings.PROFILING_HEADER.upper().replace('-', '_')
+        self.counter = itertools.count(1)
+    
+    def should_profile(self, request):
+        token = request.META.get(self.header)
+        if token:
+            return check_profile_token(token)
+        return bool(self.sample_rate) and next(self.counter) % self.sample_rate == 0
+    
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+        
+        runner = get_profiler()
+        start = time.perf_counter()
+        runner.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            runner.stop()
+        duration = time.perf_counter() - start
+        
+        match = getattr(request, 'resolver_match', None)
+        endpoint = (match.view_name or match._func_path) if match else 'unresolved'
+        try:
+            response['X-Profile-Id'] = save_profile(runner, request, endpoint, duration)
+        except OSError:
+            logger.exception("Could not save profile for %s", request.path)
+        return response
@@ -0,0 +1,97 @@
+import json
+from django.conf import settings
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import PageNumberPagination
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that trusts the PostgreSQL planner for large counts.
+    
+    Unfiltered querysets use pg_class.reltuples for the table; filtered ones
+    use the row estimate from EXPLAIN. When the estimate is below
+    ESTIMATED_COUNT_THRESHOLD, or the database is not PostgreSQL, the
+    count is exact.
+    
+    An estimate can be off either way, so pages aren't checked against it:
+    each page reads one row past its end to tell whether there is a next
+    page, and the count is corrected from what the page actually found.
+    """
+    
+    estimated = False
+    
+    @cached_property
+    def count(self):
+        estimate = self._estimate(self.object_list)
+        if estimate is not None and estimate >= settings.ESTIMATED_COUNT_THRESHOLD:
+            self.estimated = True
+            return estimate
+        return super().count
+    
+    def validate_number(self, number):
+        if not self.estimated:
+            return super().validate_number(number)
+        
+        # Only the format is checked here; page() finds out whether it has rows
+        try:
+            if isinstance(number, float) and not number.is_integer():
+                raise ValueError
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger(_("That page number is not an integer"))
+        if number < 1:
+            raise EmptyPage(_("That page number is less than 1"))
+        return number
+    
+    def page(self, number):
+        # Settles whether the count is an estimate before the number is checked
+        self.count
+        if not self.estimated:
+            return super().page(number)
+        
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        # The extra row after the orphans says whether a next page exists
+        rows = list(self.object_list[bottom:bottom + self.per_page + self.orphans + 1])
+        has_next = len(rows) > self.per_page + self.orphans
+        if has_next:
+            rows = rows[:self.per_page]
+        elif not rows and (number > 1 or not self.allow_empty_first_page):
+            raise EmptyPage(_("That page contains no results"))
+        
+        if has_next:
+            # At least one row past the page (and its orphans)
+            count = max(self.count, bottom + self.per_page + self.orphans + 1)
+        else:
+            # The last page: the count is now exact
+            count = bottom + len(rows)
+        self.__dict__['count'] = count
+        self.__dict__.pop('num_pages', None)
+        return self._get_page(rows, number, self)
+    
+    def _estimate(self, queryset):
+        """The planner's row count for the queryset, or None where there is none."""
+        if not hasattr(queryset, 'query') or connections[queryset.db].vendor != 'postgresql':
+            return None
+        
+        query = queryset.query
+        if not (query.where or query.distinct or query.is_sliced or query.group_by or query.combinator):
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed
+            return row[0] if row else -1
+        
+        plan = json.loads(queryset.order_by().explain(format='json'))
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPagination(PageNumberPagination):
+    """PageNumberPagination backed by EstimatedCountPaginator."""
+    django_paginator_class = EstimatedCountPaginator
@@ -0,0 +1,121 @@
+import logging
+import os
+import re
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SALT = 'utils.profiling'
+
+# Profile files are only ever created by save_profile(), so this also
+# rejects path traversal in download requests
+PROFILE_NAME_RE = re.compile(r'^[\w.-]+\.(prof|html)$')
+
+
+def profiling_dir():
+    return Path(settings.PROFILING_DIR)
+
+
+def make_profile_token(user_id):
+    """Signed value for the profiling header, minted for an admin."""
+    return signing.TimestampSigner(salt=TOKEN_SALT).sign(str(user_id))
+
+
+def check_profile_token(value):
+    try:
+        signing.TimestampSigner(salt=TOKEN_SALT).unsign(
+            value, max_age=settings.PROFILING_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return False
+    return True
+
+
+class CProfileRunner:
+    extension = 'prof'
+    
+    def __init__(self):
+        import cProfile
+        self.profiler = cProfile.Profile()
+    
+    def start(self):
+        self.profiler.enable()
+    
+    def stop(self):
+        self.profiler.disable()
+    
+    def write(self, path):
+        # Binary pstats dump; open with `python -m pstats` or snakeviz
+        self.profiler.dump_stats(path)
+
+
+class PyinstrumentRunner:
+    extension = 'html'
+    
+    def __init__(self):
+        from pyinstrument import Profiler
+        self.profiler = Profiler(interval=settings.PROFILING_INTERVAL)
+    
+    def start(self):
+        self.profiler.start()
+    
+    def stop(self):
+        self.profiler.stop()
+    
+    def write(self, path):
+        with open(path, 'w', encoding='utf-8') as output:
+            output.write(self.profiler.output_html())
+
+
+def get_profiler():
+    """Return a new profiler runner; pyinstrument is used when configured and installed."""
+    if settings.PROFILER == 'pyinstrument':
+        try:
+            return PyinstrumentRunner()
+        except ImportError:
+            logger.warning("pyinstrument is not installed, falling back to cProfile")
+    return CProfileRunner()
+
+
+def save_profile(runner, request, endpoint, duration):
+    """Write a profile to PROFILING_DIR, pruning the oldest beyond PROFILING_MAX_FILES."""
+    directory = profiling_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    
+    slug = re.sub(r'[^\w.-]+', '_', endpoint)[:80]
+    name = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{slug}-{request.method}-{duration * 1000:.0f}ms.{runner.extension}"
+    runner.write(directory / name)
+    
+    max_files = settings.PROFILING_MAX_FILES
+    profiles = sorted(list_profiles(), key=lambda profile: profile['modified'])
+    for profile in profiles[:max(0, len(profiles) - max_files)]:
+        try:
+            (directory / profile['name']).unlink()
+        except OSError:
+            pass
+    return name
+
+
+def list_profiles():
+    directory = profiling_dir()
+    if not directory.is_dir():
+        return []
+    
+    profiles = []
+    for entry in os.scandir(directory):
+        if entry.is_file() and PROFILE_NAME_RE.match(entry.name):
+            stat = entry.stat()
+            profiles.append({'name': entry.name, 'size': stat.st_size, 'modified': stat.st_mtime})
+    return profiles
+
+
+def get_profile_path(name):
+    """Return the path of a stored profile, or None if the name is unknown or invalid."""
+    if not PROFILE_NAME_RE.match(name):
+        return None
+    path = profiling_dir() / name
+    return path if path.is_file() else None
@@ -0,0 +1,47 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def get_executor():
+    """Return the shared background executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.BACKGROUND_TASK_WORKERS,
+            thread_name_prefix='salon-task'
+        )
+    return _executor
+
+
+def _call(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception("Background task %s failed", getattr(func, '__name__', func))
+
+
+def _run(func, args, kwargs):
+    close_old_connections()
+    try:
+        return _call(func, args, kwargs)
+    finally:
+        close_old_connections()
+
+
+def enqueue(func, *args, **kwargs):
+    """
+    Run a side effect (emails, rollups) outside the request path.
+    
+    With BACKGROUND_TASKS_EAGER the task runs inline, which keeps management
+    commands and benchmarks deterministic.
+    """
+    if settings.BACKGROUND_TASKS_EAGER:
+        return _call(func, args, kwargs)
+    return get_executor().submit(_run, func, args, kwargs)
@@ -0,0 +1,245 @@
+import threading
+from types import SimpleNamespace
+from unittest import mock
+from django.core import mail
+from django.core.paginator import EmptyPage
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from psycopg2 import extensions
+from apps.services.models import ServiceCategory
+from apps.users.models import User
+from .db_pool import base as db_pool
+from .db_pool.pool import ConnectionPool, PoolTimeout
+from .email_service import send_contact_form_email, send_password_reset_email
+from .pagination import EstimatedCountPaginator
+
+
+@override_settings(ESTIMATED_COUNT_THRESHOLD=10)
+class EstimatedCountPaginatorTests(TestCase):
+    """Pages follow the rows that exist, whichever way the planner's estimate is off."""
+    
+    ROWS = 45
+    
+    @classmethod
+    def setUpTestData(cls):
+        ServiceCategory.objects.bulk_create(
+            ServiceCategory(name=f"Category {index:02}", display_order=index) for index in range(cls.ROWS)
+        )
+    
+    def setUp(self):
+        self.client = APIClient()
+    
+    def estimate(self, rows):
+        return mock.patch.object(EstimatedCountPaginator, '_estimate', return_value=rows)
+    
+    def paginator(self):
+        return EstimatedCountPaginator(ServiceCategory.objects.order_by('display_order'), 20)
+    
+    def test_exact_count_below_threshold(self):
+        with self.estimate(5):
+            paginator = self.paginator()
+            self.assertEqual(paginator.count, self.ROWS)
+            self.assertFalse(paginator.estimated)
+            with self.assertRaises(EmptyPage):
+                paginator.page(4)
+    
+    def test_underestimate_serves_pages_past_the_estimate(self):
+        with self.estimate(15):
+            paginator = self.paginator()
+            self.assertEqual(paginator.num_pages, 1)
+            
+            page = paginator.page(1)
+            self.assertTrue(page.has_next())
+            
+            page = paginator.page(3)
+            self.assertEqual(len(page), 5)
+            self.assertFalse(page.has_next())
+            self.assertEqual(paginator.count, self.ROWS)
+            self.assertEqual(page.end_index(), self.ROWS)
+    
+    def test_overestimate_stops_at_the_last_row(self):
+        with self.estimate(1000):
+            paginator = self.paginator()
+            self.assertEqual(paginator.num_pages, 50)
+            
+            page = paginator.page(3)
+            self.assertEqual(len(page), 5)
+            self.assertFalse(page.has_next())
+            self.assertEqual(paginator.num_pages, 3)
+            
+            with self.assertRaises(EmptyPage):
+                self.paginator().page(4)
+    
+    def test_api_underestimate(self):
+        with self.estimate(15):
+            response = self.client.get('/api/services/categories/', {'page': 3})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), 5)
+            self.assertIsNone(response.data['next'])
+            self.assertEqual(response.data['count'], self.ROWS)
+            
+            response = self.client.get('/api/services/categories/', {'page': 1})
+            self.assertIn('page=2', response.data['next'])
+    
+    def test_api_overestimate(self):
+        with self.estimate(1000):
+            response = self.client.get('/api/services/categories/', {'page': 2})
+            self.assertIn('page=3', response.data['next'])
+            
+            response = self.client.get('/api/services/categories/', {'page': 3})
+            self.assertEqual(len(response.data['results']), 5)
+            self.assertIsNone(response.data['next'])
+            
+            response = self.client.get('/api/services/categories/', {'page': 4})
+            self.assertEqual(response.status_code, 404)
+
+
+class FakeConnection:
+    """Stands in for a psycopg2 connection: records rollbacks and closes."""
+    
+    def __init__(self):
+        self.closed = 0
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+        self.rollbacks = 0
+    
+    def get_transaction_status(self):
+        return self.status
+    
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+    
+    def close(self):
+        self.closed = 1
+
+
+class ConnectionPoolTests(TestCase):
+    """Checkout, return, overflow and shutdown of the per-process connection pool."""
+    
+    def setUp(self):
+        self.opened = []
+    
+    def connect(self):
+        connection = FakeConnection()
+        self.opened.append(connection)
+        return connection
+    
+    def test_connections_are_opened_lazily_and_reused(self):
+        pool = ConnectionPool(max_size=2)
+        self.assertEqual(pool.size, 0)
+        
+        connection = pool.getconn(self.connect)
+        self.assertEqual((pool.size, pool.idle), (1, 0))
+        pool.putconn(connection)
+        self.assertEqual((pool.size, pool.idle), (1, 1))
+        
+        self.assertIs(pool.getconn(self.connect), connection)
+        self.assertEqual(len(self.opened), 1)
+    
+    def test_open_transaction_is_rolled_back_on_return(self):
+        pool = ConnectionPool()
+        connection = pool.getconn(self.connect)
+        connection.status = extensions.TRANSACTION_STATUS_INTRANS
+        pool.putconn(connection)
+        
+        self.assertEqual(connection.rollbacks, 1)
+        self.assertEqual(pool.idle, 1)
+    
+    def test_broken_connection_is_discarded(self):
+        pool = ConnectionPool()
+        connection = pool.getconn(self.connect)
+        connection.closed = 2
+        pool.putconn(connection)
+        
+        self.assertEqual((pool.size, pool.idle), (0, 0))
+    
+    def test_expired_connection_is_replaced_on_checkout(self):
+        pool = ConnectionPool(max_lifetime=60)
+        connection = pool.getconn(self.connect)
+        pool.putconn(connection)
+        
+        with mock.patch('utils.db_pool.pool.time.monotonic', return_value=pool._idle[0][1] + 61):
+            replacement = pool.getconn(self.connect)
+        self.assertIsNot(replacement, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.size, 1)
+    
+    def test_overflow_waits_for_a_return(self):
+        pool = ConnectionPool(max_size=1, timeout=0.05)
+        connection = pool.getconn(self.connect)
+        with self.assertRaises(PoolTimeout):
+            pool.getconn(self.connect)
+        
+        pool.timeout = 5
+        checked_out = []
+        waiter = threading.Thread(target=lambda: checked_out.append(pool.getconn(self.connect)))
+        waiter.start()
+        pool.putconn(connection)
+        waiter.join()
+        
+        self.assertEqual(checked_out, [connection])
+        self.assertEqual(pool.size, 1)
+    
+    def test_failed_connect_frees_its_slot(self):
+        pool = ConnectionPool(max_size=1)
+        with self.assertRaises(OSError):
+            pool.getconn(mock.Mock(side_effect=OSError))
+        self.assertEqual(pool.size, 0)
+        pool.getconn(self.connect)
+    
+    def test_closed_pool_closes_idle_and_returned_connections(self):
+        pool = ConnectionPool()
+        idle = pool.getconn(self.connect)
+        checked_out = pool.getconn(self.connect)
+        pool.putconn(idle)
+        
+        pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(checked_out.closed)
+        
+        pool.putconn(checked_out)
+        self.assertTrue(checked_out.closed)
+        self.assertEqual((pool.size, pool.idle), (0, 0))
+    
+    def test_close_pools_and_detach_inherited_connections(self):
+        pool = ConnectionPool()
+        idle = pool.getconn(self.connect)
+        pool.putconn(idle)
+        
+        with mock.patch.dict(db_pool._pools, {'default': pool}, clear=True):
+            db_pool.close_pools()
+            self.assertEqual(db_pool._pools, {})
+        self.assertTrue(idle.closed)
+        
+        pool = ConnectionPool()
+        inherited = pool.getconn(self.connect)
+        pool.putconn(inherited)
+        wrapper = SimpleNamespace(connection=self.connect())
+        django_connection = wrapper.connection
+        connections = mock.Mock(**{'all.return_value': [wrapper]})
+        with mock.patch.dict(db_pool._pools, {'default': pool}, clear=True), \
+                mock.patch.object(db_pool, 'connections', connections), \
+                mock.patch.object(db_pool, '_inherited', []) as kept:
+            db_pool.detach_inherited_connections()
+            self.assertEqual(db_pool._pools, {})
+            self.assertEqual(kept, [pool, django_connection])
+        self.assertIsNone(wrapper.connection)
+        self.assertFalse(inherited.closed or django_connection.closed)
+
+
+class EmailTemplateTests(TestCase):
+    """Every email has both its HTML and plain text template."""
+    
+    def test_password_reset_email(self):
+        user = User(email='client@example.com', first_name='Ada')
+        send_password_reset_email(user, 'https://example.com/reset/abc')
+        
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('https://example.com/reset/abc', mail.outbox[0].body)
+    
+    def test_contact_form_emails(self):
+        send_contact_form_email('Ada', 'ada@example.com', 'Hours', 'Are you open on Sunday?', to_email='salon@example.com')
+        
+        self.assertEqual([message.to for message in mail.outbox], [['salon@example.com'], ['ada@example.com']])
+        self.assertIn('Are you open on Sunday?', mail.outbox[0].body)
+        self.assertIn('Hello Ada', mail.outbox[1].body)
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from rest_framework import permissions
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .metrics import registry
+from .profiling import get_profile_path, list_profiles, make_profile_token
+
+
+class MetricsView(APIView):
+    """Per-endpoint request metrics for this worker, in Prometheus text format."""
+    permission_classes = [permissions.IsAdminUser]
+    
+    def get(self, request, format=None):
+        return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+class ProfileListView(APIView):
+    """Stored request profiles, newest first."""
+    permission_classes = [permissions.IsAdminUser]
+    
+    def get(self, request, format=None):
+        profiles = sorted(list_profiles(), key=lambda profile: profile['modified'], reverse=True)
+        return Response(profiles)
+
+
+class ProfileDownloadView(APIView):
+    permission_classes = [permissions.IsAdminUser]
+    
+    def get(self, request, name, format=None):
+        path = get_profile_path(name)
+        if path is None:
+            raise Http404
+        return FileResponse(open(path, 'rb'), as_attachment=True, filename=name)
+
+
+class ProfileTokenView(APIView):
+    """
+    Mint a signed value for the profiling header.
+    
+    Any request sent with it is profiled until it expires
+    (PROFILING_TOKEN_MAX_AGE seconds).
+    """
+    permission_classes = [permissions.IsAdminUser]
+    
+    def post(self, request, format=None):
+        return Response({
+            'header': settings.PROFILING_HEADER,
+            'token': make_profile_token(request.user.id),
+            'expires_in': settings.PROFILING_TOKEN_MAX_AGE,
+        })